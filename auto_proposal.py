@@ -4,6 +4,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Any
 import striprtf.striprtf as rtf
+from job_record import coerce_jobs
+from compile_jobs import recent_jobs
 
 class ProposalGenerator:
     def __init__(self):
@@ -67,12 +69,19 @@ class ProposalGenerator:
             }
         }
 
-    def load_compiled_jobs(self, filename: str = 'compiled_jobs.json') -> List[Dict]:
-        """Load compiled job data from JSON file"""
+    def load_compiled_jobs(self, filename: str = None, keywords: List[str] = None) -> List[Dict]:
+        """Load recent jobs from the job store (compile_jobs.recent_jobs), or from a compiled JSON file when one is given"""
+        if filename is None:
+            jobs = recent_jobs(keywords)
+            if jobs or not os.path.exists('compiled_jobs.json'):
+                return jobs
+            filename = 'compiled_jobs.json'
         try:
             if os.path.exists(filename):
                 with open(filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    data = json.load(f)
+                # compiled_jobs.json wraps the list as {"metadata": ..., "jobs": [...]}
+                return coerce_jobs(data.get('jobs', []) if isinstance(data, dict) else data)
             else:
                 print(f"❌ File {filename} not found. Please run compile_jobs.py first.")
                 return []
@@ -457,7 +466,7 @@ def main():
     jobs = generator.load_compiled_jobs()
     
     if not jobs:
-        print("❌ No jobs found. Please run compile_jobs.py first.")
+        print("❌ No jobs found. Please run main.py to collect some first.")
         return
     
     print(f"\n📊 Found {len(jobs)} jobs to process")
@@ -0,0 +1,154 @@
+import asyncio
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from get_jobs import all_jobs, SEARCH_URLS, close_browser_pools, close_aiohttp_session, selenium_pool
+from main import search_all_platforms, save_results_to_json, SEARCH_DEADLINE, SYNC_SCRAPER_WORKERS
+from parse_pipeline import ParsePipeline
+from seen_jobs import get_seen_jobs
+from job_record import job_hash
+from job_store import get_job_store
+
+BATCH_CONCURRENCY = 4    # queries in flight at once; the per-host rate limiter paces the actual requests
+
+
+def normalize_keyword(keyword):
+    """'  Django  REST ' and 'rest django' are the same search"""
+    return ' '.join(sorted(re.sub(r'\s+', ' ', keyword.strip().lower()).split(' ')))
+
+
+def normalize_location(location):
+    if not location:
+        return None
+    return re.sub(r'[\s_]+', '-', location.strip().lower()) or None
+
+
+def expand_queries(keywords, locations=None):
+    """
+    Every keyword x location pair, with equivalent queries collapsed.
+    Returns [(keyword, location)] in first-seen order; location None is global.
+    Normalized forms are only the de-duplication key: each query keeps the
+    location as typed (stripped), since scrapers URL-encode it themselves.
+    """
+    queries = []
+    seen = set()
+    for location in (locations or [None]):
+        for keyword in keywords:
+            key = (normalize_keyword(keyword), normalize_location(location))
+            if not key[0] or key in seen:
+                continue
+            seen.add(key)
+            queries.append((keyword.strip(), location.strip() if key[1] else None))
+    return queries
+
+
+def merge_results(query_results, platforms):
+    """
+    Merge per-query {platform: jobs} into one {platform: jobs}, dropping jobs
+    whose job_hash was already seen. Each kept job lists the queries that found it.
+    """
+    merged = {name: [] for name in platforms}
+    by_hash = {}
+    for (keyword, location), results in query_results:
+        query_label = f"{keyword} @ {location}" if location else keyword
+        for platform, jobs in results.items():
+            for job in jobs:
+                key = job_hash(job)
+                if key in by_hash:
+                    matched = by_hash[key]['matched_queries']
+                    if query_label not in matched:
+                        matched.append(query_label)
+                    continue
+                job['matched_queries'] = [query_label]
+                by_hash[key] = job
+                merged.setdefault(platform, []).append(job)
+    return merged
+
+
+async def batch_search(keywords, locations=None, platforms=None, concurrency=BATCH_CONCURRENCY,
+                       deadline=SEARCH_DEADLINE, max_workers=SYNC_SCRAPER_WORKERS, seen=None, store=None):
+    """
+    Run every keyword/location query over the platforms with a shared scraper
+    executor and parse pipeline, and return the merged, link-deduplicated
+    results as {platform: jobs}. With a SeenJobs index only new jobs are kept;
+    with a JobStore every query's jobs are stored under its keyword.
+    """
+    platforms = platforms or all_jobs
+    queries = expand_queries(keywords, locations)
+    print(f"Batch search: {len(queries)} unique queries over {len(platforms)} platforms")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+    pipeline = ParsePipeline() if any(name in SEARCH_URLS for name in platforms) else None
+    semaphore = asyncio.Semaphore(concurrency)
+    started = time.time()
+
+    async def run_query(keyword, location):
+        async with semaphore:
+            results = await search_all_platforms([keyword], location, platforms=platforms, deadline=deadline,
+                                                 executor=executor, pipeline=pipeline, verbose=False, seen=seen)
+            found = sum(len(jobs) for jobs in results.values())
+            print(f"  '{keyword}'" + (f" in {location}" if location else "") + f": {found} jobs")
+            return (keyword, location), results
+
+    try:
+        query_results = await asyncio.gather(*(run_query(keyword, location) for keyword, location in queries))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if pipeline is not None:
+            await pipeline.close()
+
+    if store is not None:
+        for (keyword, location), results in query_results:
+            store.add_results(results, [keyword])
+    merged = merge_results(query_results, platforms)
+    raw = sum(len(jobs) for _, results in query_results for jobs in results.values())
+    unique = sum(len(jobs) for jobs in merged.values())
+    print(f"Batch search finished in {time.time() - started:.1f}s: {raw} jobs, {unique} after de-duplication")
+    return merged
+
+
+async def main():
+    """
+    Usage: python batch_search.py KEYWORD [KEYWORD ...] [--location LOCATION ...] [--platform NAME ...] [--all]
+    """
+    args = sys.argv[1:]
+    keywords, locations, platform_names = [], [], []
+    only_new = True
+    while args:
+        arg = args.pop(0)
+        if arg == '--all':
+            only_new = False
+        elif arg == '--new':
+            # New-only is the default now; kept so old command lines still work
+            only_new = True
+        elif arg == '--location' and args:
+            locations.append(args.pop(0))
+        elif arg == '--platform' and args:
+            platform_names.append(args.pop(0))
+        elif arg.startswith('--'):
+            print(main.__doc__)
+            sys.exit(2)
+        else:
+            keywords.append(arg)
+
+    if not keywords:
+        print(main.__doc__)
+        sys.exit(2)
+
+    platforms = {name: all_jobs[name] for name in platform_names if name in all_jobs} or None
+    try:
+        merged = await batch_search(keywords, locations or None, platforms,
+                                    seen=get_seen_jobs() if only_new else None, store=get_job_store())
+    finally:
+        await close_browser_pools()
+        await close_aiohttp_session()
+        selenium_pool.close()
+
+    if any(merged.values()):
+        save_results_to_json(merged, keywords, '+'.join(locations) if locations else None)
+        get_seen_jobs().mark_results(merged)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,234 @@
+import json
+import os
+import platform as py_platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+import page_parsers
+from fixtures import iter_fixtures
+from selector_cascade import SelectorCascade
+
+BENCHMARK_DIR = 'benchmarks'
+PARSER_FEATURES = ['html.parser', 'lxml']
+REPEAT = 20
+REGRESSION_THRESHOLD = 0.20    # flag a p50 slowdown of more than 20%
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return 'unknown'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def measure_allocations(parser, body, features):
+    """Peak traced memory (bytes) and allocated blocks for a single parse"""
+    tracemalloc.start()
+    try:
+        before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        parser(body, features=features)
+        peak = tracemalloc.get_traced_memory()[1]
+        after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+    return peak, max(0, after - before)
+
+
+def scratch_cascade(cascade):
+    """
+    A copy of `cascade` with the same try order that never saves, so the
+    benchmark's synthetic hits stay out of the live selector stats file
+    """
+    scratch = SelectorCascade(cascade.specs, path=os.devnull)
+    scratch.add_hits([(platform, field, selector, count)
+                      for (platform, field), hits in cascade._hits.items() for selector, count in hits.items()])
+    return scratch
+
+
+def single_selector_cascade(parser, body, features):
+    """
+    A cascade holding, per field, only the selector that matched on this page:
+    the single-selector path a perfectly tuned scraper would take, without the
+    cascade's fallbacks and bookkeeping
+    """
+    specs = page_parsers.selector_cascade.specs
+    learner = SelectorCascade(specs, path=os.devnull)
+    real, page_parsers.selector_cascade = page_parsers.selector_cascade, learner
+    try:
+        parser(body, features=features)
+    finally:
+        page_parsers.selector_cascade = real
+    pinned = {}
+    for platform, fields in specs.items():
+        pinned[platform] = {}
+        for field, selectors in fields.items():
+            hits = learner._hits.get((platform, field), {})
+            pinned[platform][field] = [max(selectors, key=lambda selector: hits.get(selector, 0))]
+    return SelectorCascade(pinned, path=os.devnull)
+
+
+def benchmark_platform(platform, parser, pages, features, repeat=REPEAT, single_selector=False):
+    """
+    Time every recorded page of one platform with one BeautifulSoup tree
+    builder, parsing through scratch_cascade (or, with single_selector=True,
+    single_selector_cascade) so the global cascade is never touched
+    """
+    cascade = page_parsers.selector_cascade
+    timings = []
+    per_job = []
+    total_jobs = 0
+    total_time = 0.0
+    peaks = []
+    blocks = []
+
+    for entry, body in pages:
+        if single_selector:
+            page_parsers.selector_cascade = single_selector_cascade(parser, body, features)
+        else:
+            page_parsers.selector_cascade = scratch_cascade(cascade)
+        try:
+            jobs = parser(body, features=features)    # warm-up, also gives the job count
+            for _ in range(repeat):
+                started = time.perf_counter()
+                parser(body, features=features)
+                elapsed = time.perf_counter() - started
+                timings.append(elapsed)
+                total_time += elapsed
+                total_jobs += len(jobs)
+                if jobs:
+                    per_job.append(elapsed / len(jobs))
+            peak, allocated = measure_allocations(parser, body, features)
+        finally:
+            page_parsers.selector_cascade = cascade
+        peaks.append(peak)
+        blocks.append(allocated)
+
+    return {
+        'platform': platform,
+        'features': features,
+        'pages': len(pages),
+        'jobs_per_page': round(total_jobs / (len(pages) * repeat), 2),
+        'page_p50_ms': round(percentile(timings, 50) * 1000, 3),
+        'page_p95_ms': round(percentile(timings, 95) * 1000, 3),
+        'job_p50_ms': round(percentile(per_job, 50) * 1000, 3) if per_job else None,
+        'job_p95_ms': round(percentile(per_job, 95) * 1000, 3) if per_job else None,
+        'jobs_per_sec': round(total_jobs / total_time, 1) if total_time else 0.0,
+        'peak_alloc_kb': round(max(peaks) / 1024, 1),
+        'mean_alloc_blocks': int(statistics.mean(blocks))
+    }
+
+
+def run_benchmarks(platforms=None, features_list=None, repeat=REPEAT):
+    """
+    Benchmark every platform parser over the fixture corpus. Platforms parsed
+    through the selector cascade are also timed with single_selector_cascade,
+    so the cost of the fallbacks shows up next to each cascade result.
+    """
+    features_list = features_list or PARSER_FEATURES
+    results = []
+    for platform, parser in page_parsers.PAGE_PARSERS.items():
+        if platforms and platform not in platforms:
+            continue
+        pages = list(iter_fixtures(platform))
+        if not pages:
+            print(f"No fixtures recorded for {platform}, skipping")
+            continue
+        modes = ['cascade', 'single'] if platform in page_parsers.selector_cascade.specs else ['cascade']
+        for features in features_list:
+            for mode in modes:
+                result = benchmark_platform(platform, parser, pages, features, repeat, mode == 'single')
+                result['selectors'] = mode
+                results.append(result)
+                print(f"{platform:<16} {features:<12} {mode:<8} p50 {result['page_p50_ms']:>8.2f} ms  "
+                      f"p95 {result['page_p95_ms']:>8.2f} ms  {result['jobs_per_sec']:>9.1f} jobs/s  "
+                      f"peak {result['peak_alloc_kb']:>8.1f} KB")
+            if len(modes) > 1:
+                cascaded, single = results[-2], results[-1]
+                if single['page_p50_ms']:
+                    overhead = (cascaded['page_p50_ms'] - single['page_p50_ms']) / single['page_p50_ms']
+                    print(f"{'':<16} {'':<12} cascade overhead vs single selector: {overhead:+.0%}")
+    return results
+
+
+def save_results(results, output_dir=BENCHMARK_DIR):
+    os.makedirs(output_dir, exist_ok=True)
+    commit = git_commit()
+    run = {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(),
+        'python': py_platform.python_version(),
+        'results': results
+    }
+    filename = os.path.join(output_dir, f"parsers_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{commit}.json")
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(run, f, indent=2)
+    print(f"Benchmark results saved to {filename}")
+    return filename
+
+
+def compare_runs(baseline_path, results, threshold=REGRESSION_THRESHOLD):
+    """Print p50 changes against a previous run; returns the list of regressions"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    previous = {(r['platform'], r['features'], r.get('selectors', 'cascade')): r for r in baseline['results']}
+
+    print(f"\nCompared with {baseline_path} (commit {baseline.get('commit', 'unknown')}):")
+    regressions = []
+    for result in results:
+        before = previous.get((result['platform'], result['features'], result['selectors']))
+        if not before or not before['page_p50_ms']:
+            continue
+        change = (result['page_p50_ms'] - before['page_p50_ms']) / before['page_p50_ms']
+        marker = ''
+        if change > threshold:
+            marker = '  <-- regression'
+            regressions.append((result['platform'], result['features'], result['selectors'], change))
+        print(f"{result['platform']:<16} {result['features']:<12} {result['selectors']:<8} "
+              f"{before['page_p50_ms']:>8.2f} -> {result['page_p50_ms']:>8.2f} ms ({change:+.0%}){marker}")
+    return regressions
+
+
+def main():
+    """
+    Usage: python benchmark_parsers.py [--platform NAME ...] [--features NAME ...]
+                                       [--repeat N] [--compare PREVIOUS.json]
+    """
+    args = sys.argv[1:]
+    platforms, features_list, repeat, baseline = [], [], REPEAT, None
+    while args:
+        arg = args.pop(0)
+        if arg == '--platform' and args:
+            platforms.append(args.pop(0))
+        elif arg == '--features' and args:
+            features_list.append(args.pop(0))
+        elif arg == '--repeat' and args:
+            repeat = int(args.pop(0))
+        elif arg == '--compare' and args:
+            baseline = args.pop(0)
+        else:
+            print(main.__doc__)
+            sys.exit(2)
+
+    results = run_benchmarks(platforms or None, features_list or None, repeat)
+    if not results:
+        print("Nothing to benchmark; record fixtures first with CARIKERJA_FIXTURES=record")
+        return
+    save_results(results)
+    if baseline and compare_runs(baseline, results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
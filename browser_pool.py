@@ -0,0 +1,266 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+from pyppeteer import launch
+
+
+class BrowserPool:
+    """
+    Keeps a few pyppeteer browsers warm and hands out pages in isolated
+    incognito contexts. A browser is retired after `max_uses` leases or as
+    soon as it is found dead, and a fresh one is launched on demand.
+    """
+
+    def __init__(self, launch_options, size=2, max_uses=25, max_pages=4):
+        # launch_options is a callable so every launch can get fresh args (user agent, etc.)
+        self.launch_options = launch_options
+        self.size = size
+        self.max_uses = max_uses
+        self.max_pages = max_pages
+        self._browsers = []
+        self._leases = {}
+        self._loop = None
+        self._lock = None
+        self._slots = None
+        self._stats = {
+            'launched': 0,
+            'recycled': 0,
+            'crashed': 0,
+            'leases': 0,
+            'launch_seconds': 0.0
+        }
+
+    def _bind_loop(self):
+        """
+        Browsers and asyncio primitives belong to one event loop; start over on a
+        new one. Browsers left from the old loop are killed, since they can no
+        longer be closed through their (dead) connection.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._leases and self._loop is not None and not self._loop.is_closed():
+                raise RuntimeError("BrowserPool still has pages leased on another event loop")
+            for entry in self._browsers:
+                self._kill(entry['browser'])
+            self._loop = loop
+            self._browsers = []
+            self._leases = {}
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_pages)
+
+    @staticmethod
+    def _is_alive(browser):
+        process = browser.process
+        if process is not None and process.poll() is not None:
+            return False
+        connection = getattr(browser, '_connection', None)
+        return connection is None or getattr(connection, '_connected', True)
+
+    @staticmethod
+    def _kill(browser):
+        process = browser.process
+        if process is None or process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+    async def _launch(self):
+        started = time.time()
+        browser = await launch(**self.launch_options())
+        self._stats['launched'] += 1
+        self._stats['launch_seconds'] += time.time() - started
+        entry = {'browser': browser, 'uses': 0, 'active': 0, 'launched_at': time.time()}
+        self._browsers.append(entry)
+        return entry
+
+    async def _retire(self, entry, crashed=False):
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        self._stats['crashed' if crashed else 'recycled'] += 1
+        try:
+            await entry['browser'].close()
+        except Exception:
+            pass
+
+    async def _checkout(self):
+        async with self._lock:
+            for entry in list(self._browsers):
+                if not self._is_alive(entry['browser']):
+                    await self._retire(entry, crashed=True)
+
+            usable = [entry for entry in self._browsers if entry['uses'] + entry['active'] < self.max_uses]
+            idle = [entry for entry in usable if entry['active'] == 0]
+            if idle:
+                entry = idle[0]
+            elif len(self._browsers) < self.size or not usable:
+                entry = await self._launch()
+            else:
+                entry = min(usable, key=lambda e: e['active'])
+
+            entry['active'] += 1
+            return entry
+
+    async def _checkin(self, entry):
+        async with self._lock:
+            entry['active'] -= 1
+            entry['uses'] += 1
+            if not self._is_alive(entry['browser']):
+                await self._retire(entry, crashed=True)
+            elif entry['uses'] >= self.max_uses and entry['active'] == 0:
+                await self._retire(entry)
+
+    async def acquire_page(self):
+        """Lease a fresh page in its own incognito context; hand it back with release_page"""
+        self._bind_loop()
+        await self._slots.acquire()
+        entry = None
+        try:
+            entry = await self._checkout()
+            self._stats['leases'] += 1
+            context = await entry['browser'].createIncognitoBrowserContext()
+            page = await context.newPage()
+        except Exception:
+            if entry is not None:
+                await self._checkin(entry)
+            self._slots.release()
+            raise
+        self._leases[page] = (entry, context)
+        return page
+
+    async def release_page(self, page):
+        """Close the page's incognito context and return its browser to the pool"""
+        lease = self._leases.pop(page, None)
+        if lease is None:
+            return
+        entry, context = lease
+        try:
+            await context.close()
+        except Exception:
+            pass
+        await self._checkin(entry)
+        self._slots.release()
+
+    @asynccontextmanager
+    async def page(self):
+        page = await self.acquire_page()
+        try:
+            yield page
+        finally:
+            await self.release_page(page)
+
+    async def close(self):
+        """Close every browser in the pool"""
+        for entry in list(self._browsers):
+            try:
+                await entry['browser'].close()
+            except Exception:
+                pass
+        self._browsers = []
+        self._leases = {}
+
+    def stats(self):
+        """Pool size and health counters"""
+        alive = sum(1 for entry in self._browsers if self._is_alive(entry['browser']))
+        return {
+            'browsers': len(self._browsers),
+            'alive': alive,
+            'active_pages': sum(entry['active'] for entry in self._browsers),
+            'max_browsers': self.size,
+            'max_uses': self.max_uses,
+            **self._stats
+        }
+
+
+# Rough transfer sizes used to estimate what an aborted request would have cost
+BLOCKED_RESOURCE_SIZES = {
+    'image': 60000,
+    'font': 40000,
+    'media': 400000,
+    'stylesheet': 30000,
+    'script': 50000,
+    'xhr': 5000,
+    'fetch': 5000,
+    'other': 5000
+}
+
+
+# Bot-challenge providers; never blocked as third party or the challenge cannot complete
+CHALLENGE_HOSTS = ('challenges.cloudflare.com', 'hcaptcha.com', 'recaptcha.net')
+
+
+class ResourceBlocker:
+    """
+    Request interception for pyppeteer pages. Aborts requests whose resource
+    type is listed in `block` (e.g. 'image', 'font', 'media') and, when
+    'third_party' is listed, any request to a host outside `first_party_hosts`.
+    Documents and bot-challenge scripts (CHALLENGE_HOSTS, reCAPTCHA) are never
+    blocked. Keeps counts of what was blocked and loaded.
+    """
+
+    def __init__(self, block, first_party_hosts):
+        self.block = set(block)
+        self.first_party_hosts = [host[4:] if host.startswith('www.') else host for host in first_party_hosts]
+        self.stats = {
+            'blocked_requests': 0,
+            'allowed_requests': 0,
+            'estimated_bytes_saved': 0,
+            'bytes_loaded': 0,
+            'blocked_by_type': {}
+        }
+
+    def _is_third_party(self, url):
+        host = urlparse(url).hostname or ''
+        return not any(host == first or host.endswith('.' + first) for first in self.first_party_hosts)
+
+    @staticmethod
+    def _is_challenge(url):
+        parts = urlparse(url)
+        host = parts.hostname or ''
+        if any(host == challenge or host.endswith('.' + challenge) for challenge in CHALLENGE_HOSTS):
+            return True
+        return parts.path.startswith(('/recaptcha/', '/cdn-cgi/challenge-platform/'))
+
+    def should_block(self, resource_type, url):
+        if resource_type == 'document' or url.startswith('data:') or self._is_challenge(url):
+            return False
+        if resource_type in self.block:
+            return True
+        return 'third_party' in self.block and self._is_third_party(url)
+
+    async def attach(self, page):
+        """Turn on interception for a page; can be attached to several pages"""
+        await page.setRequestInterception(True)
+        page.on('request', lambda request: asyncio.ensure_future(self._on_request(request)))
+        page.on('response', self._on_response)
+
+    async def _on_request(self, request):
+        resource_type = request.resourceType
+        try:
+            if self.should_block(resource_type, request.url):
+                self.stats['blocked_requests'] += 1
+                self.stats['estimated_bytes_saved'] += BLOCKED_RESOURCE_SIZES.get(resource_type, BLOCKED_RESOURCE_SIZES['other'])
+                by_type = self.stats['blocked_by_type']
+                by_type[resource_type] = by_type.get(resource_type, 0) + 1
+                await request.abort('blockedbyclient')
+            else:
+                self.stats['allowed_requests'] += 1
+                await request.continue_()
+        except Exception:
+            pass  # Request already handled or page closed
+
+    def _on_response(self, response):
+        try:
+            self.stats['bytes_loaded'] += int(response.headers.get('content-length', 0))
+        except (TypeError, ValueError):
+            pass
+
+    def report(self, label):
+        """Print a one-line summary of what the blocker saved"""
+        stats = self.stats
+        print(f"{label}: blocked {stats['blocked_requests']} requests "
+              f"(~{stats['estimated_bytes_saved'] / 1024:.0f} KB est.), "
+              f"loaded {stats['allowed_requests']} requests ({stats['bytes_loaded'] / 1024:.0f} KB)")
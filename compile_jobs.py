@@ -3,8 +3,21 @@ import re
 from datetime import datetime
 from collections import defaultdict
 import glob
+import sys
+import time
+import orjson
+import xxhash
+from job_record import Job, job_hash
+from near_duplicates import collapse_near_duplicates
+from job_store import get_job_store
+
+RESULTS_DIR = 'job_results'
+IMPORT_BATCH_SIZE = 1000    # jobs per store transaction while importing
+RECENT_DAYS = 7             # window recent_jobs reads for the proposal and cover letter generators
+RECENT_LIMIT = 500          # newest jobs recent_jobs returns at most
+
 def parse_job_file(filepath):
-    """Parse a job results file and extract job data"""
+    """Parse a text report (legacy; only used for runs without a JSON export)"""
     jobs = []
     current_platform = None
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -84,24 +97,34 @@ def parse_single_job(job_text):
     job_data['platform'] = extract_platform_name(job_data['link'])
     pattern = r"^\d\.+"
     job_data['title'] = re.sub(pattern, '', job_data['title'])
-    return job_data
+    return Job.coerce(job_data)
 
 def remove_duplicates(jobs):
-    """Remove duplicate jobs based on job links"""
-    seen_links = set()
+    """Remove duplicate jobs based on the hash of their canonical link"""
+    seen_hashes = set()
     unique_jobs = []
     
     for job in jobs:
-        job_link = job.get('link')
-        if job_link and job_link not in seen_links:
-            seen_links.add(job_link)
-            unique_jobs.append(job)
-        elif not job_link:  # Keep jobs without links but mark them
+        key = job_hash(job)
+        if key in seen_hashes:
+            continue
+        seen_hashes.add(key)
+        if not job.get('link'):  # Matched on platform/title/company only
             job['duplicate_warning'] = 'No link available - potential duplicate'
-            unique_jobs.append(job)
+        unique_jobs.append(job)
     
     return unique_jobs
 
+def recent_jobs(keywords=None, days=RECENT_DAYS, limit=RECENT_LIMIT, store=None):
+    """
+    Jobs first seen in the last `days` days, newest first and at most
+    `limit`, de-duplicated and with cross-posts folded as a compile does
+    """
+    store = store or get_job_store()
+    jobs = store.query(keywords=keywords, since=time.time() - days * 86400, limit=limit)
+    jobs, _ = collapse_near_duplicates(remove_duplicates(jobs))
+    return jobs
+
 def group_by_platform(jobs):
     """Group jobs by platform"""
     grouped = defaultdict(list)
@@ -157,14 +180,14 @@ def save_compiled_results(grouped_jobs, total_jobs, duplicates_removed):
                 if job.get('location'):
                     f.write(f"   Location: {job['location']}\n")
                 
-                if job.get('headquarters'):
-                    f.write(f"   Headquarters: {job['headquarters']}\n")
+                if job.get('budget'):
+                    f.write(f"   Budget: {job['budget']}\n")
                 
                 if job.get('categories'):
-                    f.write(f"   Categories: {job['categories']}\n")
+                    f.write(f"   Categories: {', '.join(job['categories'])}\n")
                 
-                if job.get('posted_date'):
-                    f.write(f"   Posted: {job['posted_date']}\n")
+                if job.get('posted'):
+                    f.write(f"   Posted: {job['posted']}\n")
                 
                 if job.get('link'):
                     f.write(f"   Link: {job['link']}\n")
@@ -172,6 +195,9 @@ def save_compiled_results(grouped_jobs, total_jobs, duplicates_removed):
                 if job.get('duplicate_warning'):
                     f.write(f"   ⚠️  {job['duplicate_warning']}\n")
                 
+                if job.get('near_duplicates'):
+                    f.write(f"   Also posted as: {', '.join(job['near_duplicates'])}\n")
+                
                 f.write("\n")
             
             f.write("\n")
@@ -180,7 +206,7 @@ def save_compiled_results(grouped_jobs, total_jobs, duplicates_removed):
         f.write("=" * 70 + "\n")
         f.write("COMPILATION SUMMARY\n")
         f.write("=" * 70 + "\n")
-        f.write(f"Total Files Processed: {total_jobs}\n")
+        f.write(f"Total Jobs Compiled: {total_jobs}\n")
         f.write(f"Unique Jobs After Deduplication: {len([job for jobs in grouped_jobs.values() for job in jobs])}\n")
         f.write(f"Duplicates Removed: {duplicates_removed}\n")
         f.write(f"Platforms Represented: {', '.join(grouped_jobs.keys())}\n")
@@ -188,44 +214,173 @@ def save_compiled_results(grouped_jobs, total_jobs, duplicates_removed):
     
     return filepath
 
+def iter_result_jobs(filepath, offset=0, end=None):
+    """
+    Jobs from one result file, one at a time: JSON-lines sinks line by line
+    (only the bytes in [offset, end) when given), main.py's JSON exports via
+    orjson, and text reports through the legacy parser
+    """
+    if filepath.endswith('.jsonl'):
+        with open(filepath, 'rb') as f:
+            f.seek(offset)
+            remaining = None if end is None else end - offset
+            for line in f:
+                if remaining is not None:
+                    remaining -= len(line)
+                    if remaining < 0:
+                        break
+                if line.strip():
+                    yield Job.coerce(orjson.loads(line))
+    elif filepath.endswith('.json'):
+        with open(filepath, 'rb') as f:
+            data = orjson.loads(f.read())
+        for raw in (data.get('jobs', []) if isinstance(data, dict) else data):
+            yield Job.coerce(raw)
+    else:
+        yield from parse_job_file(filepath)
+
+def find_result_files(results_dir=RESULTS_DIR):
+    """
+    JSON and JSON-lines results, plus text reports from runs that have no JSON
+    export with the same name (older runs, or CARIKERJA_EXPORTS=txt)
+    """
+    structured = glob.glob(os.path.join(results_dir, '*.json')) + glob.glob(os.path.join(results_dir, '*.jsonl'))
+    stems = {os.path.splitext(path)[0] for path in structured}
+    legacy = [path for path in glob.glob(os.path.join(results_dir, '*.txt')) if os.path.splitext(path)[0] not in stems]
+    return sorted(structured) + sorted(legacy)
+
+def file_hash(filepath, length=None):
+    """xxh64 of the file's first `length` bytes (the whole file by default) as a signed int"""
+    digest = xxhash.xxh64()
+    remaining = length
+    with open(filepath, 'rb') as f:
+        while remaining is None or remaining > 0:
+            chunk = f.read(1 << 20 if remaining is None else min(1 << 20, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    value = digest.intdigest()
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def complete_lines_end(filepath, size):
+    """Offset just past the last newline in the first `size` bytes; a sink may be mid-write"""
+    with open(filepath, 'rb') as f:
+        position = size
+        while position > 0:
+            start = max(0, position - (1 << 16))
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                return start + newline + 1
+            position = start
+    return 0
+
+def import_file(store, filepath, offset=0, end=None):
+    """Stream one result file into the store in batches; returns the jobs imported"""
+    count = 0
+    batch = []
+    for job in iter_result_jobs(filepath, offset, end):
+        batch.append(job)
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            count += store.add_jobs(batch)
+            batch = []
+    return count + store.add_jobs(batch)
+
+def import_results(store, job_files, full=False):
+    """
+    Bring the store up to date with the result files. The store's manifest
+    records each file's size, mtime and content hash; unchanged files are
+    skipped, files that only grew at the end (JSON-lines sinks) are read from
+    where the last import stopped, and anything else is re-imported.
+    full=True ignores the manifest. Returns the files read.
+    """
+    manifest = {} if full else store.compiled_files()
+    store.forget_compiled([path for path in manifest if not os.path.exists(path)])
+    imported = []
+    skipped = 0
+    for filepath in job_files:
+        try:
+            stat = os.stat(filepath)
+            entry = manifest.get(filepath)
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                skipped += 1
+                continue
+            
+            end = complete_lines_end(filepath, stat.st_size) if filepath.endswith('.jsonl') else stat.st_size
+            content_hash = file_hash(filepath, end)
+            if entry and entry['size'] == end and entry['content_hash'] == content_hash:
+                # Touched but not changed
+                store.mark_compiled(filepath, end, stat.st_mtime, content_hash, entry['jobs'])
+                skipped += 1
+                continue
+            
+            offset, previous = 0, 0
+            if (entry and filepath.endswith('.jsonl') and entry['size'] < end
+                    and file_hash(filepath, entry['size']) == entry['content_hash']):
+                offset, previous = entry['size'], entry['jobs']
+            
+            count = import_file(store, filepath, offset, end)
+            store.mark_compiled(filepath, end, stat.st_mtime, content_hash, previous + count)
+            imported.append(filepath)
+            print(f"  {os.path.basename(filepath)}: {count} jobs" + (" (appended)" if offset else ""))
+        except Exception as e:
+            print(f"  Error processing {os.path.basename(filepath)}: {e}")
+    print(f"Imported {len(imported)} result files, {skipped} unchanged\n")
+    return imported
+
 def main():
-    """Main function to compile job results"""
+    """
+    Usage: python compile_jobs.py [--keyword KEYWORD ...] [--platform NAME ...] [--full]
+    Imports new or changed result files from job_results/ into the job store,
+    then compiles the jobs in the store; --full re-imports every file.
+    """
     print("=== Job Results Compiler ===")
     print("Compiling and deduplicating job search results...\n")
     
-    # Find all job result files
-    job_files = glob.glob("job_results/*.txt")
-    
-    if not job_files:
-        print("No job result files found in 'job_results' directory.")
-        print("Please run the main scraper first to generate job results.")
-        return
+    args = sys.argv[1:]
+    keywords, platforms = [], []
+    full = False
+    while args:
+        arg = args.pop(0)
+        if arg == '--full':
+            full = True
+        elif arg == '--keyword' and args:
+            keywords.append(args.pop(0))
+        elif arg == '--platform' and args:
+            platforms.append(args.pop(0))
+        else:
+            print(main.__doc__)
+            sys.exit(2)
     
-    print(f"Found {len(job_files)} job result files to process:")
-    for file in job_files:
-        print(f"  - {os.path.basename(file)}")
-    print()
+    store = get_job_store()
+    job_files = import_results(store, find_result_files(), full=full)
     
-    # Parse all job files
-    all_jobs = []
-    for filepath in job_files:
-        print(f"Processing {os.path.basename(filepath)}...")
-        try:
-            jobs = parse_job_file(filepath)
-            all_jobs.extend(jobs)
-            print(f"  Extracted {len(jobs)} jobs")
-        except Exception as e:
-            print(f"  Error processing file: {e}")
+    all_jobs = store.query(platforms=platforms or None, keywords=keywords or None)
+    if not all_jobs:
+        print("No jobs in the job store.")
+        print("Please run the main scraper first to collect jobs.")
+        return
     
-    print(f"\nTotal jobs extracted: {len(all_jobs)}")
+    print(f"Jobs in the store matching the filters: {len(all_jobs)}")
     
-    # Remove duplicates
+    # The store holds one row per canonical link; this only catches link-less repeats
     print("Removing duplicates based on job links...")
     original_count = len(all_jobs)
     unique_jobs = remove_duplicates(all_jobs)
     duplicates_removed = original_count - len(unique_jobs)
     
     print(f"Duplicates removed: {duplicates_removed}")
+    
+    # Fold cross-posted copies of the same gig (different links, near-identical text)
+    print("Merging near-duplicate postings across platforms...")
+    unique_jobs, clusters = collapse_near_duplicates(unique_jobs)
+    near_duplicates_removed = sum(len(cluster['members']) - 1 for cluster in clusters)
+    duplicates_removed += near_duplicates_removed
+    
+    print(f"Near-duplicates merged: {near_duplicates_removed} in {len(clusters)} groups")
     print(f"Unique jobs remaining: {len(unique_jobs)}")
     
     # Group by platform
@@ -239,12 +394,12 @@ def main():
     # Save compiled results
     print("\nSaving compiled results...")
     try:
-        filepath = save_compiled_results(grouped_jobs, len(job_files), duplicates_removed)
+        filepath = save_compiled_results(grouped_jobs, original_count, duplicates_removed)
         print(f"✅ Compiled results saved to: {filepath}")
         
         # Display summary
         print(f"\n=== Compilation Complete ===")
-        print(f"📁 Files processed: {len(job_files)}")
+        print(f"📁 Files imported: {len(job_files)}")
         print(f"🔍 Total jobs found: {original_count}")
         print(f"🗑️  Duplicates removed: {duplicates_removed}")
         print(f"✨ Unique jobs: {len(unique_jobs)}")
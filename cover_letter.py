@@ -4,6 +4,8 @@ import re
 from datetime import datetime
 from typing import Dict, List, Any
 import striprtf.striprtf as rtf
+from job_record import coerce_jobs
+from compile_jobs import recent_jobs
 
 class CoverLetterGenerator:
     def __init__(self):
@@ -86,12 +88,14 @@ class CoverLetterGenerator:
             'project management': "managed projects delivering 20% under budget"
         }
 
-    def load_job_data(self, json_file_path: str) -> List[Dict]:
-        """Load job data from JSON file"""
+    def load_job_data(self, json_file_path: str = None, keywords: List[str] = None) -> List[Dict]:
+        """Load recent jobs from the job store (compile_jobs.recent_jobs), or from a JSON results file when a path is given"""
+        if not json_file_path:
+            return recent_jobs(keywords)
         try:
             with open(json_file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                return data.get('jobs', [])
+                return coerce_jobs(data.get('jobs', []))
         except Exception as e:
             print(f"❌ Error loading job data: {e}")
             return []
@@ -541,15 +545,15 @@ def main():
     generator = CoverLetterGenerator()
     
     # Load job data
-    json_file = input("Enter path to jobs JSON file (default: compiled_jobs.json): ").strip() or "compiled_jobs.json"
+    json_file = input("Enter path to jobs JSON file (press Enter to use the job store): ").strip() or None
     
     try:
         jobs = generator.load_job_data(json_file)
         if not jobs:
-            print("❌ No jobs found in the specified file.")
+            print("❌ No jobs found.")
             return
         
-        print(f"✅ Loaded {len(jobs)} jobs from {json_file}")
+        print(f"✅ Loaded {len(jobs)} jobs from {json_file or 'the job store'}")
     except Exception as e:
         print(f"❌ Error loading jobs: {e}")
         return
@@ -0,0 +1,69 @@
+import threading
+import soupsieve
+
+
+class SelectorRegistry:
+    """
+    Compiled soupsieve selectors shared by every scraper and thread. Each
+    selector string is compiled once, on first use or via precompile(), and
+    the compiled matcher is reused for every later select/select_one.
+    """
+
+    def __init__(self):
+        self._compiled = {}
+        self._lock = threading.Lock()
+        self.compilations = 0
+        self.reuses = 0
+
+    def compile(self, selector):
+        compiled = self._compiled.get(selector)
+        if compiled is not None:
+            self.reuses += 1    # unlocked; the counters are for profiling, not accounting
+            return compiled
+        with self._lock:
+            compiled = self._compiled.get(selector)
+            if compiled is None:
+                compiled = soupsieve.compile(selector)
+                self._compiled[selector] = compiled
+                self.compilations += 1
+            else:
+                self.reuses += 1
+        return compiled
+
+    def precompile(self, selectors):
+        for selector in selectors:
+            self.compile(selector)
+
+    def select(self, element, selector, limit=0):
+        return self.compile(selector).select(element, limit)
+
+    def select_one(self, element, selector):
+        return self.compile(selector).select_one(element)
+
+    def stats(self):
+        return {
+            'selectors': len(self._compiled),
+            'compilations': self.compilations,
+            'reuses': self.reuses
+        }
+
+
+registry = SelectorRegistry()
+
+
+def compile_selector(selector):
+    return registry.compile(selector)
+
+
+def select(element, selector, limit=0):
+    """soup.select(selector) through the shared compiled-selector registry"""
+    return registry.select(element, selector, limit)
+
+
+def select_one(element, selector):
+    """soup.select_one(selector) through the shared compiled-selector registry"""
+    return registry.select_one(element, selector)
+
+
+def selector_stats():
+    return registry.stats()
@@ -0,0 +1,210 @@
+import asyncio
+import json
+import os
+import random
+import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from get_jobs import all_jobs, SEARCH_URLS, close_browser_pools, close_aiohttp_session, selenium_pool
+from main import stream_platform, SYNC_SCRAPER_WORKERS
+from parse_pipeline import ParsePipeline
+from seen_jobs import get_seen_jobs
+from job_store import get_job_store
+
+PROFILES_PATH = 'search_profiles.json'
+DEFAULT_SINK = os.path.join('job_results', 'new_jobs.jsonl')
+DEFAULT_POLL_INTERVAL = 15 * 60    # seconds between polls of one platform for one profile
+POLL_JITTER = 0.2                  # each wait is the interval +/- this fraction
+
+
+def load_profiles(path=PROFILES_PATH):
+    """
+    Read the daemon config:
+        {"sink": "job_results/new_jobs.jsonl",
+         "profiles": [{"name": "python", "keywords": ["python", "django"], "location": null,
+                       "platforms": ["remoteok", "freelancer"], "interval": 600,
+                       "intervals": {"freelancer": 300}}]}
+    'platforms' defaults to every platform, 'interval' to DEFAULT_POLL_INTERVAL.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+
+    profiles = []
+    for i, profile in enumerate(config.get('profiles', []), 1):
+        keywords = [keyword for keyword in profile.get('keywords', []) if keyword.strip()]
+        if not keywords:
+            print(f"Skipping profile {i}: no keywords")
+            continue
+        platforms = profile.get('platforms') or list(all_jobs)
+        unknown = [name for name in platforms if name not in all_jobs]
+        if unknown:
+            print(f"Profile {profile.get('name', i)}: ignoring unknown platforms {', '.join(unknown)}")
+        profiles.append({
+            'name': profile.get('name') or ' '.join(keywords),
+            'keywords': keywords,
+            'location': profile.get('location') or None,
+            'platforms': [name for name in platforms if name in all_jobs],
+            'interval': profile.get('interval', DEFAULT_POLL_INTERVAL),
+            'intervals': profile.get('intervals', {})
+        })
+    return profiles, config.get('sink', DEFAULT_SINK)
+
+
+def jittered(interval):
+    return interval * random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+
+
+class JsonlSink:
+    """Appends each new job as one JSON line and flushes, so readers can tail the file"""
+
+    def __init__(self, path=DEFAULT_SINK):
+        self.path = path
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self.written = 0
+
+    def emit(self, jobs):
+        for job in jobs:
+            self._file.write(json.dumps(job.to_dict(), ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.written += len(jobs)
+
+    def close(self):
+        self._file.close()
+
+
+class PollingDaemon:
+    """
+    Polls every (profile, platform) pair on its own jittered interval, with the
+    scraper threads, parse pipeline, browser pools and aiohttp session kept
+    open across cycles. Only jobs missing from the seen-jobs index reach the
+    sink and the job store: each batch is claimed in the index first, and the
+    claim is released if writing it fails.
+    """
+
+    def __init__(self, profiles, sink, seen=None, store=None, max_workers=SYNC_SCRAPER_WORKERS):
+        self.profiles = profiles
+        self.sink = sink
+        self.seen = seen or get_seen_jobs()
+        self.store = store or get_job_store()
+        self.max_workers = max_workers
+        self.executor = None
+        self.pipeline = None
+        self._stopping = asyncio.Event()
+        self.polls = 0
+
+    def stop(self):
+        self._stopping.set()
+
+    async def poll(self, profile, platform):
+        """One search of one platform for one profile; returns the new jobs emitted"""
+        started = time.time()
+        emitted = []
+        async for jobs in stream_platform(platform, all_jobs[platform], profile['keywords'], profile['location'],
+                                          self.executor, self.pipeline, self.seen):
+            # Claiming is atomic, so profiles polling the same platform
+            # never emit a job twice
+            jobs = self.seen.claim(jobs, platform)
+            if not jobs:
+                continue
+            # Each results page goes out as soon as it is parsed
+            found_at = datetime.now().isoformat()
+            for job in jobs:
+                job['platform'] = platform
+                job['search_profile'] = profile['name']
+                job['search_keywords'] = profile['keywords']
+                job['search_location'] = profile['location']
+                job['found_at'] = found_at
+            try:
+                self.sink.emit(jobs)
+                self.store.add_jobs(jobs, profile['keywords'])
+            except Exception:
+                # Hand the claim back so the next poll delivers these jobs
+                self.seen.forget(jobs)
+                raise
+            emitted.extend(jobs)
+        self.polls += 1
+        if emitted:
+            print(f"[{profile['name']}] {platform}: {len(emitted)} new jobs ({time.time() - started:.1f}s)")
+        return emitted
+
+    async def _poll_loop(self, profile, platform):
+        interval = profile['intervals'].get(platform, profile['interval'])
+        # Spread the first polls out so every platform does not start at once
+        delay = random.uniform(0, min(interval, 30) * POLL_JITTER)
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+                break
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.poll(profile, platform)
+            except Exception as e:
+                print(f"[{profile['name']}] {platform} poll failed: {e}")
+            delay = jittered(interval)
+
+    async def run(self, once=False):
+        """Poll until stop() (or after one round of every pair when once=True)"""
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scraper')
+        if any(name in SEARCH_URLS for profile in self.profiles for name in profile['platforms']):
+            self.pipeline = ParsePipeline()
+        pairs = [(profile, platform) for profile in self.profiles for platform in profile['platforms']]
+        print(f"Polling {len(pairs)} profile/platform pairs from {len(self.profiles)} profiles")
+        try:
+            if once:
+                await asyncio.gather(*(self.poll(profile, platform) for profile, platform in pairs),
+                                     return_exceptions=True)
+            else:
+                await asyncio.gather(*(self._poll_loop(profile, platform) for profile, platform in pairs))
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            if self.pipeline is not None:
+                await self.pipeline.close()
+            print(f"Daemon stopped after {self.polls} polls, {self.sink.written} new jobs written to {self.sink.path}")
+
+
+async def main():
+    """
+    Usage: python daemon.py [CONFIG] [--once]
+    CONFIG defaults to search_profiles.json; --once runs a single round and exits.
+    """
+    args = sys.argv[1:]
+    once = '--once' in args
+    paths = [arg for arg in args if not arg.startswith('--')]
+    if len(paths) > 1 or len(paths) + once != len(args):
+        print(main.__doc__)
+        sys.exit(2)
+
+    path = paths[0] if paths else PROFILES_PATH
+    if not os.path.exists(path):
+        print(f"Config file not found: {path}")
+        print(load_profiles.__doc__)
+        sys.exit(1)
+    profiles, sink_path = load_profiles(path)
+    if not profiles:
+        print(f"No usable search profiles in {path}")
+        sys.exit(1)
+
+    sink = JsonlSink(sink_path)
+    daemon = PollingDaemon(profiles, sink)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, daemon.stop)
+        except (NotImplementedError, RuntimeError):
+            pass    # Windows: Ctrl+C raises KeyboardInterrupt instead
+
+    try:
+        await daemon.run(once=once)
+    finally:
+        sink.close()
+        await close_browser_pools()
+        await close_aiohttp_session()
+        selenium_pool.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,163 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+class DriverPool:
+    """
+    Bounded pool of warm Selenium WebDriver instances shared between threads.
+    Drivers are leased with acquire()/release() (or the lease() context
+    manager), retired once they have served `max_pages` page loads, and
+    replaced automatically when they are found dead. close() quits the
+    current drivers; the pool stays usable and starts new ones on demand.
+    """
+
+    def __init__(self, factory, size=2, max_pages=20, acquire_timeout=120):
+        # factory() returns a ready WebDriver or None when Chrome cannot start
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+        self._idle = []
+        self._pages = {}
+        self._live = 0
+        # Bumped by close(); drivers from an older generation are quit on release
+        self._generation = 0
+        self._born = {}
+        self._cond = threading.Condition()
+        self._stats = {
+            'created': 0,
+            'recycled': 0,
+            'replaced': 0,
+            'leases': 0,
+            'failed_starts': 0,
+            'wait_seconds': 0.0
+        }
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _create(self):
+        driver = self.factory()
+        with self._cond:
+            if driver is None:
+                self._live -= 1
+                self._stats['failed_starts'] += 1
+                self._cond.notify()
+            else:
+                self._stats['created'] += 1
+                self._pages[driver] = 0
+                self._born[driver] = self._generation
+        return driver
+
+    def acquire(self, timeout=None):
+        """Lease a driver, waiting for a free slot; returns None if none becomes available"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.time()
+        with self._cond:
+            while not self._idle and self._live >= self.size:
+                remaining = timeout - (time.time() - started)
+                if remaining <= 0:
+                    print("Timed out waiting for a free Selenium driver")
+                    return None
+                self._cond.wait(remaining)
+            self._stats['wait_seconds'] += time.time() - started
+            self._stats['leases'] += 1
+            driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                self._live += 1
+
+        if driver is None:
+            return self._create()
+
+        if not self._is_alive(driver):
+            # Dead browser: throw it away and start a replacement in the same slot
+            self._quit(driver)
+            with self._cond:
+                self._pages.pop(driver, None)
+                self._born.pop(driver, None)
+                self._stats['replaced'] += 1
+            return self._create()
+
+        return driver
+
+    def release(self, driver, pages=1):
+        """Return a leased driver, recycling it if it is worn out or broken"""
+        if driver is None:
+            return
+        with self._cond:
+            self._pages[driver] = self._pages.get(driver, 0) + pages
+            worn_out = self._pages[driver] >= self.max_pages
+            closed = self._born.get(driver) != self._generation
+
+        alive = not closed and not worn_out and self._is_alive(driver)
+        if alive:
+            try:
+                # Stop any activity on the last page before parking the driver
+                driver.get('about:blank')
+            except Exception:
+                alive = False
+
+        with self._cond:
+            if alive:
+                self._idle.append(driver)
+            else:
+                self._pages.pop(driver, None)
+                self._born.pop(driver, None)
+                self._live -= 1
+                if worn_out:
+                    self._stats['recycled'] += 1
+                elif not closed:
+                    self._stats['replaced'] += 1
+            self._cond.notify()
+
+        if not alive:
+            self._quit(driver)
+
+    @contextmanager
+    def lease(self, timeout=None):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """
+        Quit idle drivers; drivers still leased are quit when they come back.
+        Later leases start fresh drivers.
+        """
+        with self._cond:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            for driver in idle:
+                self._pages.pop(driver, None)
+                self._born.pop(driver, None)
+            self._cond.notify_all()
+        for driver in idle:
+            self._quit(driver)
+
+    def stats(self):
+        """Pool size and lease counters"""
+        with self._cond:
+            return {
+                'drivers': self._live,
+                'idle': len(self._idle),
+                'leased': self._live - len(self._idle),
+                'max_drivers': self.size,
+                'max_pages': self.max_pages,
+                **self._stats
+            }
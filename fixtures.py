@@ -0,0 +1,120 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from http_cache import normalize_url
+
+# Record/replay of raw HTTP responses for offline runs.
+#   CARIKERJA_FIXTURES=record  -> every fetched page is also written to FIXTURE_DIR
+#   CARIKERJA_FIXTURES=replay  -> pages are served from FIXTURE_DIR only, no network
+FIXTURE_DIR = os.getenv('CARIKERJA_FIXTURE_DIR', 'fixtures')
+FIXTURE_MODES = ('', 'record', 'replay')
+
+_mode = os.getenv('CARIKERJA_FIXTURES', '').strip().lower()
+_lock = threading.Lock()
+
+
+def fixture_mode():
+    return _mode
+
+
+def set_fixture_mode(mode):
+    """Switch between '' (live), 'record' and 'replay' at runtime"""
+    global _mode
+    if mode not in FIXTURE_MODES:
+        raise ValueError(f"Unknown fixture mode {mode!r}, expected one of {FIXTURE_MODES}")
+    _mode = mode
+
+
+def replaying():
+    return _mode == 'replay'
+
+
+def recording():
+    return _mode == 'record'
+
+
+def fixture_key(url):
+    return hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()[:16]
+
+
+def _index_path(fixture_dir):
+    return os.path.join(fixture_dir, 'index.json')
+
+
+def load_index(fixture_dir=None):
+    """Return {key: {url, platform, file, recorded_at}} for the fixture corpus"""
+    path = _index_path(fixture_dir or FIXTURE_DIR)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def record_response(url, body, platform=None, fixture_dir=None):
+    """Save a raw response body into the fixture corpus"""
+    fixture_dir = fixture_dir or FIXTURE_DIR
+    key = fixture_key(url)
+    filename = f"{platform or 'unknown'}_{key}.html"
+    with _lock:
+        os.makedirs(fixture_dir, exist_ok=True)
+        with open(os.path.join(fixture_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(body)
+        index = load_index(fixture_dir)
+        index[key] = {
+            'url': url,
+            'platform': platform,
+            'file': filename,
+            'recorded_at': datetime.now().isoformat()
+        }
+        with open(_index_path(fixture_dir), 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+
+
+def replay_response(url, fixture_dir=None):
+    """Return the recorded body for a URL, or None if it was never recorded"""
+    fixture_dir = fixture_dir or FIXTURE_DIR
+    entry = load_index(fixture_dir).get(fixture_key(url))
+    if not entry:
+        print(f"No fixture recorded for {url}")
+        return None
+    with open(os.path.join(fixture_dir, entry['file']), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def iter_fixtures(platform=None, fixture_dir=None):
+    """Yield (entry, body) for every recorded page, optionally for one platform"""
+    fixture_dir = fixture_dir or FIXTURE_DIR
+    for key, entry in sorted(load_index(fixture_dir).items()):
+        if platform and entry.get('platform') != platform:
+            continue
+        with open(os.path.join(fixture_dir, entry['file']), 'r', encoding='utf-8') as f:
+            yield entry, f.read()
+
+
+def main():
+    """List the corpus or replay every recorded page through its parser"""
+    from page_parsers import PAGE_PARSERS
+
+    command = sys.argv[1] if len(sys.argv) > 1 else 'replay'
+    if command == 'list':
+        for entry, body in iter_fixtures():
+            print(f"{entry['platform']:<16} {len(body):>8} bytes  {entry['url']}")
+        return
+
+    total = 0
+    for entry, body in iter_fixtures():
+        parser = PAGE_PARSERS.get(entry['platform'])
+        if not parser:
+            print(f"No parser for platform {entry['platform']!r}, skipping {entry['url']}")
+            continue
+        jobs = parser(body)
+        total += len(jobs)
+        print(f"{entry['platform']:<16} {len(jobs):>4} jobs  {entry['url']}")
+    print(f"Replayed fixtures produced {total} jobs")
+
+
+if __name__ == "__main__":
+    main()
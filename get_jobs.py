@@ -4,6 +4,11 @@ from bs4 import BeautifulSoup
 import time
 import random
 import requests
+from page_parsers import (selector_cascade, PAGE_PARSERS, UPWORK_SELECTORS, FREELANCER_SELECTORS,
+                          REMOTE_CO_SELECTORS, parse_upwork_jobs, parse_freelancer_jobs, parse_timesjobs_jobs,
+                          parse_remote_co_jobs, parse_weworkremotely_jobs, parse_remoteok_jobs)
+from rate_limiter import RateLimiter
+from job_record import Job, coerce_jobs, job_hash
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -11,18 +16,29 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 import asyncio
-from pyppeteer import launch
 from pyppeteer_stealth import stealth
 from pyppeteer.errors import TimeoutError, ElementHandleError
+from browser_pool import BrowserPool, ResourceBlocker
+from http_cache import get_response_cache, is_challenge_page
+from fixtures import replaying, recording, record_response, replay_response
+from parse_pipeline import parse_off_loop
+from driver_pool import DriverPool
+from waits import (WaitBudget, wait_for_selector, wait_for_count_stable, wait_for_network_quiet,
+                   wait_for_elements, wait_for_count_stable_driver)
 import urllib.parse
 from bs4 import BeautifulSoup
 import time
 import random
 import requests
+from requests.adapters import HTTPAdapter
+import aiohttp
 import json
 import re
 import sys
 import os
+import threading
+import functools
+import atexit
 
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -65,36 +81,186 @@ def find_chrome_executable():
 def get_random_user_agent():
     return random.choice(USER_AGENTS)
 
-def make_request(url, retries=3, use_session=True, headers=None):
-    """Make HTTP request with enhanced error handling and anti-detection"""
+# Shared HTTP connection pool. One Session is reused by every requests-based
+# scraper so TCP/TLS connections are kept alive between fetches.
+HTTP_POOL_HOSTS = 20        # number of per-host pools kept around
+HTTP_POOL_PER_HOST = 8      # max open connections to a single host
+
+DEFAULT_REQUEST_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """Return the shared pooled requests Session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_HOSTS,
+                    pool_maxsize=HTTP_POOL_PER_HOST,
+                    pool_block=True
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update(DEFAULT_REQUEST_HEADERS)
+                _http_session = session
+    return _http_session
+
+def close_http_session():
+    """Close the shared Session and drop its pooled connections"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+# asyncio twin of the shared Session for make_request_async. aiohttp sessions
+# belong to one event loop, so a new loop gets a new session.
+HTTP_ASYNC_LIMIT = 100      # open connections across all hosts
+
+_aiohttp_session = None
+_aiohttp_loop = None
+
+async def get_aiohttp_session():
+    """Return the shared aiohttp ClientSession for the running event loop"""
+    global _aiohttp_session, _aiohttp_loop
+    loop = asyncio.get_running_loop()
+    if _aiohttp_session is None or _aiohttp_session.closed or _aiohttp_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_ASYNC_LIMIT,
+            limit_per_host=HTTP_POOL_PER_HOST,
+            ttl_dns_cache=300
+        )
+        _aiohttp_session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_REQUEST_HEADERS)
+        _aiohttp_loop = loop
+    return _aiohttp_session
+
+async def close_aiohttp_session():
+    global _aiohttp_session, _aiohttp_loop
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+    _aiohttp_loop = None
+
+# Request headers some platforms need on top of DEFAULT_REQUEST_HEADERS (a random
+# User-Agent is added per request). Every fetch path for the platform sends them.
+PLATFORM_HEADERS = {
+    'upwork': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5'
+    },
+    'weworkremotely': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5'
+    },
+    'remoteok': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+    }
+}
+
+def platform_headers(platform):
+    """A copy of the platform's PLATFORM_HEADERS, or None"""
+    headers = PLATFORM_HEADERS.get(platform)
+    return dict(headers) if headers else None
+
+# Response cache freshness when all_jobs has no 'cache_ttl' for the platform
+DEFAULT_CACHE_TTL = 15 * 60
+
+def cache_ttl_for(platform):
+    """Seconds a cached response for the platform stays fresh (0 disables caching)"""
+    return all_jobs.get(platform, {}).get('cache_ttl', DEFAULT_CACHE_TTL)
+
+def _cache_lookup(url, headers, cache_ttl):
+    """Return (cache, key, cached entry, fresh body) for make_request/make_request_async"""
+    if not cache_ttl:
+        return None, None, None, None
+    cache = get_response_cache()
+    cache_key = cache.make_key(url, {**DEFAULT_REQUEST_HEADERS, **(headers or {})})
+    cached = cache.get(cache_key)
+    if cached and time.time() - cached['stored_at'] < cache_ttl:
+        cache.mark_hit()
+        return cache, cache_key, cached, cached['body']
+    return cache, cache_key, cached, None
+
+def _conditional_headers(headers, cached):
+    request_headers = {'User-Agent': get_random_user_agent()}
+    if headers:
+        request_headers.update(headers)
+    if cached:
+        if cached['etag']:
+            request_headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            request_headers['If-Modified-Since'] = cached['last_modified']
+    return request_headers
+
+def _cache_store(cache, cache_key, url, body, response_headers):
+    """Cache a fetched body unless it is a bot-challenge page served as a 200"""
+    if not cache:
+        return
+    if is_challenge_page(body):
+        print(f"Not caching challenge page from {url}")
+        return
+    cache.put(cache_key, url, body,
+              etag=response_headers.get('ETag'),
+              last_modified=response_headers.get('Last-Modified'))
+
+def _revalidated(cache, cache_key, cached):
+    """Body for a 304 Not Modified answer to a conditional request"""
+    cache.touch(cache_key)
+    cache.mark_hit(revalidated=True)
+    return cached['body']
+
+def _fetched(url, body, platform):
+    if recording():
+        record_response(url, body, platform)
+    return body
+
+def make_request(url, retries=3, use_session=True, headers=None, timeout=20, platform=None, cache_ttl=None):
+    """Make HTTP request with enhanced error handling and anti-detection.
+    With a cache TTL (from the platform's all_jobs entry unless cache_ttl is
+    given), fresh cached bodies are returned without a request and stale ones
+    are revalidated with If-None-Match / If-Modified-Since. In fixture replay
+    mode the body comes from the fixture corpus and the network is never used."""
+    if replaying():
+        return replay_response(url)
+    
+    if cache_ttl is None and platform:
+        cache_ttl = cache_ttl_for(platform)
+    cache, cache_key, cached, fresh = _cache_lookup(url, headers, cache_ttl if use_session else 0)
+    if fresh is not None:
+        return _fetched(url, fresh, platform)
+    
     for attempt in range(retries):
         try:
+            throttle(url)
             if use_session:
-                session = requests.Session()
-                default_headers = {
-                    'User-Agent': get_random_user_agent(),
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'none',
-                    'Cache-Control': 'max-age=0'
-                }
-                if headers:
-                    default_headers.update(headers)
-                session.headers.update(default_headers)
-                
-                response = session.get(url, timeout=20, allow_redirects=True)
+                request_headers = _conditional_headers(headers, cached)
+                response = get_http_session().get(url, headers=request_headers, timeout=timeout, allow_redirects=True)
+                if cached and response.status_code == 304:
+                    return _fetched(url, _revalidated(cache, cache_key, cached), platform)
                 response.raise_for_status()
-                return response.text
+                body = response.text
+                _cache_store(cache, cache_key, url, body, response.headers)
             else:
                 req_headers = headers or {'User-Agent': get_random_user_agent()}
                 req = urllib.request.Request(url, headers=req_headers)
-                response = urllib.request.urlopen(req, timeout=20)
-                return response.read().decode('utf-8')
+                response = urllib.request.urlopen(req, timeout=timeout)
+                body = response.read().decode('utf-8')
+            
+            return _fetched(url, body, platform)
         except Exception as e:
             print(f"Request failed (attempt {attempt + 1}): {e}")
             if attempt < retries - 1:
@@ -103,6 +269,44 @@ def make_request(url, retries=3, use_session=True, headers=None):
             else:
                 return None
 
+async def make_request_async(url, retries=3, headers=None, timeout=20, platform=None, cache_ttl=None):
+    """
+    make_request on the shared aiohttp session: same cache, fixtures and
+    retries, without blocking the loop. Cache (SQLite + zstd) and fixture
+    file access run in worker threads.
+    """
+    if replaying():
+        return await asyncio.to_thread(replay_response, url)
+    
+    if cache_ttl is None and platform:
+        cache_ttl = cache_ttl_for(platform)
+    cache, cache_key, cached, fresh = await asyncio.to_thread(_cache_lookup, url, headers, cache_ttl)
+    if fresh is not None:
+        return await asyncio.to_thread(_fetched, url, fresh, platform)
+    
+    session = await get_aiohttp_session()
+    for attempt in range(retries):
+        try:
+            await throttle_async(url)
+            request_headers = _conditional_headers(headers, cached)
+            async with session.get(url, headers=request_headers, allow_redirects=True,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if cached and response.status == 304:
+                    body = await asyncio.to_thread(_revalidated, cache, cache_key, cached)
+                    return await asyncio.to_thread(_fetched, url, body, platform)
+                response.raise_for_status()
+                body = await response.text()
+                response_headers = dict(response.headers)
+            await asyncio.to_thread(_cache_store, cache, cache_key, url, body, response_headers)
+            return await asyncio.to_thread(_fetched, url, body, platform)
+        except Exception as e:
+            print(f"Request failed (attempt {attempt + 1}): {e}")
+            if attempt < retries - 1:
+                delay = (2 ** attempt) + random.uniform(1, 3)
+                await asyncio.sleep(delay)
+            else:
+                return None
+
 def setup_selenium_driver(headless=True):
     """Setup Selenium driver with advanced anti-detection measures"""
     try:
@@ -207,7 +411,18 @@ def setup_selenium_driver(headless=True):
         print(f"Could not setup Selenium driver: {e}")
         print("Make sure ChromeDriver is installed and in PATH")
         return None
-def simulate_human_behavior(driver):
+
+# Warm Selenium drivers shared by the Selenium scrapers (Indeed, Fiverr)
+SELENIUM_POOL_SIZE = 2      # drivers kept open at most
+SELENIUM_MAX_PAGES = 20     # page loads before a driver is recycled
+selenium_pool = DriverPool(setup_selenium_driver, size=SELENIUM_POOL_SIZE, max_pages=SELENIUM_MAX_PAGES)
+atexit.register(selenium_pool.close)
+
+# Fallback selectors learn their try order from hits; counts persist across runs.
+# Only this process saves them (parse workers hand their hits back, see parse_pipeline)
+atexit.register(selector_cascade.save)
+
+def simulate_human_behavior(driver, budget=None):
     """Simulate human-like behavior to avoid detection"""
     try:
         # Random mouse movements
@@ -215,14 +430,113 @@ def simulate_human_behavior(driver):
         actions.move_by_offset(random.randint(10, 100), random.randint(10, 100))
         actions.perform()
         
-        # Random scroll
+        # Random scroll, spaced out by the platform's politeness floor
         driver.execute_script(f"window.scrollTo(0, {random.randint(100, 500)});")
-        time.sleep(random.uniform(0.5, 1.5))
-        
-        # Random wait
-        time.sleep(random.uniform(1, 3))
+        if budget:
+            budget.polite()
     except:
         pass  # Ignore errors in behavior simulation
+
+# Politeness floor between page actions when all_jobs has no 'politeness_delay'
+DEFAULT_POLITENESS_DELAY = 1.5
+
+def wait_budget(platform, label=None):
+    """Start a WaitBudget with the platform's 'politeness_delay' from all_jobs"""
+    config = all_jobs.get(platform, {})
+    return WaitBudget(label or platform.title(), config.get('politeness_delay', DEFAULT_POLITENESS_DELAY), key=platform)
+
+# Per-host request limits shared by every fetch path; hosts come from each
+# all_jobs 'link' and limits from its 'rate_limit' (see configure_rate_limits)
+rate_limiter = RateLimiter()
+
+def throttle(url, budget=None):
+    """Wait for the host's rate limit before a blocking request or driver.get"""
+    waited = rate_limiter.wait(url)
+    if budget:
+        budget.add_wait(waited)
+
+async def throttle_async(url, budget=None):
+    """Wait for the host's rate limit before an aiohttp request or page.goto"""
+    waited = await rate_limiter.wait_async(url)
+    if budget:
+        budget.add_wait(waited)
+
+def configure_rate_limits(platforms):
+    for config in platforms.values():
+        limit = config.get('rate_limit')
+        if limit and config.get('link'):
+            rate_limiter.configure(config['link'], limit.get('rate'), limit.get('burst'))
+# Shared pyppeteer browser pools (one per headless mode) so repeated
+# searches reuse a warm Chrome instead of launching one per scrape.
+BROWSER_POOL_SIZE = 2       # browsers kept open per mode
+BROWSER_MAX_USES = 25       # pages served before a browser is recycled
+_browser_pools = {}
+
+def browser_launch_options(headless=True):
+    """Launch options shared by all pyppeteer scrapers"""
+    launch_options = {
+        'headless': headless,
+        'args': [
+            '--no-sandbox',
+            '--disable-features=CrossOriginEmbedderPolicy',
+            '--disable-dev-shm-usage',
+            '--disable-accelerated-2d-canvas',
+            '--no-first-run',
+            '--no-zygote',
+            '--disable-gpu',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+            '--disable-renderer-backgrounding',
+            '--disable-features=TranslateUI',
+            '--disable-ipc-flooding-protection',
+            '--window-size=1920,1080',
+            '--disable-setuid-sandbox',
+            '--disable-infobars',
+            '--window-position=0,0',
+            '--ignore-certificate-errors',
+            '--ignore-certificate-errors-spki-list',
+            f'--user-agent={get_random_user_agent()}'
+        ],
+        'ignoreHTTPSErrors': True
+    }
+    
+    # Only set executablePath if we found a specific Chrome path
+    chrome_path = find_chrome_executable()
+    if chrome_path and os.path.exists(chrome_path):
+        launch_options['executablePath'] = chrome_path
+    
+    return launch_options
+
+def get_browser_pool(headless=True):
+    """Return the shared browser pool for the given headless mode"""
+    pool = _browser_pools.get(headless)
+    if pool is None:
+        pool = BrowserPool(
+            lambda: browser_launch_options(headless),
+            size=BROWSER_POOL_SIZE,
+            max_uses=BROWSER_MAX_USES
+        )
+        _browser_pools[headless] = pool
+    return pool
+
+async def close_browser_pools():
+    """Close all pooled browsers; call before the event loop shuts down"""
+    for pool in _browser_pools.values():
+        await pool.close()
+
+def browser_pool_stats():
+    """Size and health stats for every browser pool in use"""
+    return {('headless' if headless else 'headed'): pool.stats() for headless, pool in _browser_pools.items()}
+
+def make_resource_blocker(platform):
+    """Build a ResourceBlocker if the platform opts in with 'block_resources' in all_jobs"""
+    config = all_jobs.get(platform, {})
+    block = config.get('block_resources')
+    if not block:
+        return None
+    first_party = urllib.parse.urlparse(config['link']).hostname
+    return ResourceBlocker(block, [first_party] + config.get('allow_hosts', []))
+
 # Helper function to get text content from an element safely
 async def get_text_content(element):
     """Safely gets text from a Pyppeteer element handle."""
@@ -331,109 +645,26 @@ async def wait_for_verification_completion(page, timeout=30000):
     
     print("Verification timed out.")
     return False
+
+def upwork_search_url(keywords, location=None, page=1):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    url = f'https://www.upwork.com/nx/search/jobs/?q={urllib.parse.quote(query)}&per_page=20'
+    return url if page == 1 else f'{url}&page={page}'
+
 async def get_upwork_jobs(keywords, location=None):
     """
     Corrected Upwork scraper using pyppeteer with proper error handling
     """
-    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-    search_url = f'https://www.upwork.com/nx/search/jobs/?q={urllib.parse.quote(query)}&per_page=20'
+    search_url = upwork_search_url(keywords, location)
 
     # Step 1: Try requests first (fast method)
     try:
-        headers = {
-            'User-Agent': get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        headers = platform_headers('upwork')
         
-        response = requests.get(search_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        html_content = await make_request_async(search_url, retries=1, headers=headers, timeout=15, platform='upwork')
         
-        if response.text and ('job-tile' in response.text or 'JobTile' in response.text):
-            soup = BeautifulSoup(response.text, 'html.parser')
-            jobs = []
-            
-            # Try multiple selectors for job elements
-            job_selectors = [
-                'article[data-test="JobTile"]',
-                'div[data-test="JobTile"]',
-                '.job-tile',
-                'section[data-test="job-tile"]'
-            ]
-            
-            job_elements = []
-            for selector in job_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    job_elements = elements[:10]
-                    break
-            
-            for job in job_elements:
-                try:
-                    # Try multiple title selectors
-                    title_selectors = [
-                        'h2[data-test="job-title"] a',
-                        'h3[data-test="job-title"] a',
-                        'h2 a[data-test="UpLink"]',
-                        'h3 a[data-test="UpLink"]',
-                        '.job-tile-title a',
-                        'a[data-test="UpLink"]'
-                    ]
-                    
-                    title_elem = None
-                    for selector in title_selectors:
-                        title_elem = job.select_one(selector)
-                        if title_elem:
-                            break
-                    
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
-                        
-                        # Get budget/payment info
-                        budget_selectors = [
-                            '[data-test="job-type-label"]',
-                            '.job-tile-info-list span',
-                            '.job-type',
-                            '.budget'
-                        ]
-                        
-                        budget_elem = None
-                        for selector in budget_selectors:
-                            budget_elem = job.select_one(selector)
-                            if budget_elem:
-                                break
-                        
-                        budget = budget_elem.get_text(strip=True) if budget_elem else 'Budget not specified'
-                        
-                        # Get company/client info
-                        client_selectors = [
-                            '[data-test="client-name"]',
-                            '.client-name',
-                            '.up-n-link'
-                        ]
-                        
-                        client_elem = None
-                        for selector in client_selectors:
-                            client_elem = job.select_one(selector)
-                            if client_elem:
-                                break
-                        
-                        client = client_elem.get_text(strip=True) if client_elem else 'Client not specified'
-                        
-                        jobs.append({
-                            'title': title,
-                            'link': f"https://www.upwork.com{link}" if link.startswith('/') else link,
-                            'budget': budget,
-                            'client': client,
-                            'platform': 'Upwork'
-                        })
-                except Exception as e:
-                    print(f"Error parsing individual job: {e}")
-                    continue
+        if html_content and ('job-tile' in html_content or 'JobTile' in html_content):
+            jobs = await parse_off_loop('upwork', html_content)
             
             if jobs:
                 print(f"Successfully scraped {len(jobs)} Upwork jobs using requests.")
@@ -443,45 +674,17 @@ async def get_upwork_jobs(keywords, location=None):
         print(f"Requests-based Upwork scrape failed: {e}. Falling back to pyppeteer.")
     
     # Step 2: Fallback to pyppeteer with improved configuration
-    browser = None
+    if replaying():
+        print("Replay mode: skipping Upwork browser fallback")
+        return []
+    pool = get_browser_pool(headless=False)
+    page = None
+    budget = wait_budget('upwork')
     try:
-        chrome_path = find_chrome_executable()
-        if not chrome_path:
-            print("Chrome executable not found. Please install Chrome or set the correct path.")
-            return []
-        
-        launch_options = {
-            'headless': False,
-            'args': [
-                '--no-sandbox',
-                '--disable-features=CrossOriginEmbedderPolicy',
-                '--disable-dev-shm-usage',
-                '--disable-accelerated-2d-canvas',
-                '--no-first-run',
-                '--no-zygote',
-                '--disable-gpu',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-features=TranslateUI',
-                '--disable-ipc-flooding-protection',
-                '--window-size=1920,1080',
-                '--disable-setuid-sandbox',
-                '--disable-infobars',
-                '--window-position=0,0',
-                '--ignore-certificate-errors',
-                '--ignore-certificate-errors-spki-list',
-                f'--user-agent={get_random_user_agent()}'
-            ],
-            'ignoreHTTPSErrors': True
-        }
-        
-        # Only set executablePath if we found a specific Chrome path
-        if chrome_path and os.path.exists(chrome_path):
-            launch_options['executablePath'] = chrome_path
-        
-        browser = await launch(**launch_options)
-        page = await browser.newPage()
+        page = await pool.acquire_page()
+        blocker = make_resource_blocker('upwork')
+        if blocker:
+            await blocker.attach(page)
            
         # Apply stealth evasions
         await stealth(page)
@@ -506,6 +709,8 @@ async def get_upwork_jobs(keywords, location=None):
 
         
         print(f"Navigating to: {search_url}")
+        await budget.polite_async()
+        await throttle_async(search_url, budget)
         await page.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 60000})
         await handle_cloudflare_turnstile(page)
         # Handle Cloudflare verification if present
@@ -536,53 +741,35 @@ async def get_upwork_jobs(keywords, location=None):
         #     print(f"No Cloudflare challenge detected or error: {e}")
         
 
-        # Wait a bit for the page to load
-        await asyncio.sleep(3)
-        # Wait for navigation after verification
-        await page.waitForNavigation()
+        # Let the post-verification navigation settle instead of sleeping
+        await wait_for_network_quiet(page, budget, idle=0.5, timeout=30)
         # Handle potential consent/cookie popups
         try:
             consent_selectors = [
                 'button[data-test="consent-accept"]',
                 'button[data-cy="consent-accept"]',
-                '#consent',
-                'button:contains("Accept")',
-                'button:contains("Agree")'
+                '#consent'
             ]
             
-            for selector in consent_selectors:
-                try:
-                    await page.waitForSelector(selector, {'timeout': 2000})
-                    await page.click(selector)
-                    await asyncio.sleep(1)
-                    break
-                except:
-                    continue
+            consent_button = await page.querySelector(', '.join(consent_selectors))
+            if consent_button:
+                await consent_button.click()
         except:
             pass  # No consent popup found
         
-        # Simulate human-like scrolling
-        for i in range(3):
-            await page.evaluate('window.scrollBy(0, window.innerHeight)')
-            await asyncio.sleep(random.uniform(2, 4))
-        
         # Wait for job elements to load
-        job_loaded = False
         job_selectors = [
             'article[data-test="JobTile"]',
             'div[data-test="JobTile"]', 
             '.job-tile',
             'section[data-test="job-tile"]'
         ]
+        any_job = ', '.join(job_selectors)
         
-        for selector in job_selectors:
-            try:
-                await page.waitForSelector(selector, options={'timeout': 15000})
-                job_loaded = True
-                await asyncio.sleep(random.uniform(2, 4))
-                break
-            except:
-                continue
+        job_loaded = await wait_for_selector(page, any_job, budget, timeout=15)
+        if job_loaded:
+            # Scroll until lazy-loaded tiles stop appearing
+            await wait_for_count_stable(page, any_job, budget, settle=1.0, timeout=12, scroll=True)
         
         if not job_loaded:
             print("No job elements found on Upwork page")
@@ -649,245 +836,146 @@ async def get_upwork_jobs(keywords, location=None):
             print("No job elements found in page content")
             return []
 
-        for job in job_elements:
-            try:
-                # Try multiple title selectors
-                title_selectors = [
-                    'h2[data-test="job-title"] a',
-                    'h3[data-test="job-title"] a', 
-                    'h2 a[data-test="UpLink"]',
-                    'h3 a[data-test="UpLink"]',
-                    '.job-tile-title a',
-                    'a[data-test="UpLink"]'
-                ]
-                
-                title_elem = None
-                for selector in title_selectors:
-                    title_elem = job.select_one(selector)
-                    if title_elem:
-                        break
-                
-                if not title_elem:
-                    continue
-                
-                title = title_elem.get_text(strip=True)
-                link = title_elem.get('href', '')
-                
-                # Get budget info
-                budget_selectors = [
-                    '[data-test="job-type-label"]',
-                    '.job-tile-info-list span',
-                    '.job-type',
-                    '.budget'
-                ]
-                
-                budget_elem = None
-                for selector in budget_selectors:
-                    budget_elem = job.select_one(selector)
-                    if budget_elem:
-                        break
-                
-                budget = budget_elem.get_text(strip=True) if budget_elem else 'Budget not specified'
-                
-                # Get description
-                desc_elem = job.select_one('[data-test="job-description"]')
-                description = desc_elem.get_text(strip=True)[:200] + '...' if desc_elem else 'No description'
-                
-                if title:
-                    jobs.append({
-                        'title': title,
-                        'link': f"https://www.upwork.com{link}" if link.startswith('/') else link,
-                        'budget': budget,
-                        'description': description,
-                        'platform': 'Upwork'
-                    })
-            except Exception as e:
-                print(f"Error parsing job with pyppeteer: {e}")
-                continue
+        # Same parser (and selector cascade) as the plain-HTTP path
+        jobs = await parse_off_loop('upwork', await page.content()) or []
         
         print(f"Successfully scraped {len(jobs)} jobs from Upwork using pyppeteer.")
+        if blocker:
+            blocker.report('Upwork')
         return jobs
         
     except Exception as e:
         print(f"Error scraping Upwork with pyppeteer: {e}")
         return []
     finally:
-        if browser:
-            try:
-                await browser.close()
-            except:
-                pass
+        if page:
+            await pool.release_page(page)
+        budget.report()
+
+def freelancer_search_url(keywords, location=None, page=1):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    url = f'https://www.freelancer.com/job-search/{urllib.parse.quote(query)}'
+    return url if page == 1 else f'{url}/{page}'
 
 def get_freelancer_jobs(keywords, location=None):
     """Improved Freelancer.com scraper"""
     try:
         query = ' '.join(keywords) if isinstance(keywords, list) else keywords
         base_url = 'https://www.freelancer.com'
-        search_url = f'{base_url}/job-search/{urllib.parse.quote(query)}'
+        search_url = freelancer_search_url(keywords, location)
+        
+        html_content = make_request(search_url, platform='freelancer')
         
         # Alternative URL format
-        if not make_request(search_url):
+        if not html_content:
             search_url = f'{base_url}/jobs/search/projects/?query={urllib.parse.quote(query)}'
+            html_content = make_request(search_url, platform='freelancer')
         
-        html_content = make_request(search_url)
         if not html_content:
             return []
             
-        soup = BeautifulSoup(html_content, 'html.parser')
-        jobs = []
-        
-        # Updated selectors for Freelancer
-        job_selectors = [
-            '.JobSearchCard-item',
-            '.ProjectCard',
-            'div[data-project-id]',
-            '.project-card',
-            'article.JobSearchCard-item'
-        ]
+        return parse_freelancer_jobs(html_content, base_url)
+    except Exception as e:
+        print(f"Error scraping Freelancer: {e}")
+        return []
+
+async def get_freelancer_jobs_async(keywords, location=None):
+    """get_freelancer_jobs on the shared aiohttp session"""
+    try:
+        query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+        base_url = 'https://www.freelancer.com'
+        search_url = freelancer_search_url(keywords, location)
         
-        job_elements = []
-        for selector in job_selectors:
-            elements = soup.select(selector)
-            if elements:
-                job_elements = elements
-                break
+        html_content = await make_request_async(search_url, platform='freelancer')
         
-        for job in job_elements[:10]:
-            try:
-                # Try multiple title selectors
-                title_selectors = [
-                    '.JobSearchCard-primary-heading a',
-                    'h3.project-title a',
-                    'h2 a', 'h3 a',
-                    '.project-title',
-                    'a[data-project-title]'
-                ]
-                
-                title_elem = None
-                for selector in title_selectors:
-                    title_elem = job.select_one(selector)
-                    if title_elem:
-                        break
-                
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    link = title_elem.get('href', '')
-                    
-                    # Get budget info
-                    budget_selectors = [
-                        '.JobSearchCard-secondary-price',
-                        '.project-budget',
-                        '.budget'
-                    ]
-                    
-                    budget_elem = None
-                    for selector in budget_selectors:
-                        budget_elem = job.select_one(selector)
-                        if budget_elem:
-                            break
-                    
-                    budget = budget_elem.get_text(strip=True) if budget_elem else 'Budget not specified'
-                    
-                    jobs.append({
-                        'title': title,
-                        'link': f"{base_url}{link}" if link.startswith('/') else link,
-                        'budget': budget,
-                        'platform': 'Freelancer'
-                    })
-            except Exception as e:
-                continue
+        # Alternative URL format
+        if not html_content:
+            search_url = f'{base_url}/jobs/search/projects/?query={urllib.parse.quote(query)}'
+            html_content = await make_request_async(search_url, platform='freelancer')
         
-        return jobs
+        if not html_content:
+            return []
+            
+        return await parse_off_loop('freelancer', html_content)
     except Exception as e:
         print(f"Error scraping Freelancer: {e}")
         return []
 
-def get_indeed_jobs(keywords, location=None):
-    """Improved Indeed scraper using Selenium"""
+INDEED_SELECTORS = {
+    'card': [
+        "div[data-jk]",
+        ".job_seen_beacon",
+        ".result",
+        "td.resultContent"
+    ],
+    'title': [
+        "h2.jobTitle a[data-jk] span",
+        "h2.jobTitle a span",
+        ".jobTitle a",
+        "a[data-jk]",
+        "h2 a span"
+    ],
+    'company': [
+        "span.companyName a",
+        "span.companyName",
+        ".companyName"
+    ]
+}
+selector_cascade.register('indeed', INDEED_SELECTORS)
+
+def indeed_search_url(keywords, location=None, page=1):
+    """Newest first, 10 results per page"""
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    location_param = location if location else ''
+    url = f'https://www.indeed.com/jobs?q={urllib.parse.quote(query)}&l={urllib.parse.quote(location_param)}&sort=date'
+    return url if page == 1 else f'{url}&start={(page - 1) * 10}'
+
+def get_indeed_jobs(keywords, location=None, page=1):
+    """Improved Indeed scraper using Selenium; `page` is the 1-based results page"""
+    if replaying():
+        print("Replay mode: Indeed is browser-only, skipping")
+        return []
     driver = None
+    budget = wait_budget('indeed')
     try:
-        driver = setup_selenium_driver()
+        driver = selenium_pool.acquire()
         if not driver:
             print("Selenium driver not available, skipping Indeed")
             return []
         
-        query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-        location_param = location if location else ''
-        url = f'https://www.indeed.com/jobs?q={urllib.parse.quote(query)}&l={urllib.parse.quote(location_param)}&sort=date'
+        url = indeed_search_url(keywords, location, page)
         
+        budget.polite()
+        throttle(url, budget)
         driver.get(url)
-        time.sleep(random.uniform(3, 6))
+        
+        # Wait for jobs to load
+        if not wait_for_elements(driver, "[data-jk], .job_seen_beacon, .result", budget, timeout=15):
+            print("Jobs didn't load on Indeed")
+            return []
         
         # Handle potential popup/modal
         try:
             close_button = driver.find_element(By.CSS_SELECTOR, "[data-testid='modal-close-button'], .icl-CloseButton")
             close_button.click()
-            time.sleep(1)
         except:
             pass  # No modal to close
         
-        # Wait for jobs to load
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-jk], .job_seen_beacon, .result"))
-            )
-        except:
-            print("Jobs didn't load on Indeed")
-            return []
-        
         jobs = []
         
-        # Find job elements
-        job_selectors = [
-            "div[data-jk]",
-            ".job_seen_beacon",
-            ".result",
-            "td.resultContent"
-        ]
+        # Find job elements; a selector only counts if it matches a real list
+        def find_cards(selector):
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            return elements if len(elements) > 2 else None
         
-        job_elements = []
-        for selector in job_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and len(elements) > 2:
-                    job_elements = elements
-                    break
-            except:
-                continue
+        job_elements = selector_cascade.first('indeed', 'card', find_cards) or []
         
-        for job in job_elements[:10]:
+        for job in job_elements:
             try:
-                # Title extraction
-                title_elem = None
-                title_selectors = [
-                    "h2.jobTitle a[data-jk] span",
-                    "h2.jobTitle a span", 
-                    ".jobTitle a",
-                    "a[data-jk]",
-                    "h2 a span"
-                ]
-                
-                for selector in title_selectors:
-                    try:
-                        title_elem = job.find_element(By.CSS_SELECTOR, selector)
-                        break
-                    except:
-                        continue
-                
-                # Company extraction
-                company_elem = None
-                company_selectors = [
-                    "span.companyName a",
-                    "span.companyName", 
-                    ".companyName"
-                ]
-                
-                for selector in company_selectors:
-                    try:
-                        company_elem = job.find_element(By.CSS_SELECTOR, selector)
-                        break
-                    except:
-                        continue
+                # Every miss is a WebDriver round trip, so the learned order matters here
+                find_in_job = lambda selector: job.find_element(By.CSS_SELECTOR, selector)
+                title_elem = selector_cascade.first('indeed', 'title', find_in_job)
+                company_elem = selector_cascade.first('indeed', 'company', find_in_job)
                 
                 if title_elem:
                     title = title_elem.text.strip()
@@ -901,12 +989,11 @@ def get_indeed_jobs(keywords, location=None):
                         link = ''
                     
                     if title:  # Only add if we have a title
-                        jobs.append({
+                        jobs.append(Job.coerce({
                             'title': title,
                             'company': company,
-                            'link': link,
-                            'platform': 'Indeed'
-                        })
+                            'link': link
+                        }, 'indeed'))
                         
             except Exception as e:
                 continue
@@ -917,27 +1004,70 @@ def get_indeed_jobs(keywords, location=None):
         print(f"Error scraping Indeed with Selenium: {e}")
         return []
     finally:
-        if driver:
-            driver.quit()
+        selenium_pool.release(driver)
+        budget.report()
+
+FIVERR_SELECTORS = {
+    'card': [
+        ".gig-card-layout",
+        "[data-gig-id]",
+        ".gig-wrapper",
+        "article.gig-card",
+        ".gig-card"
+    ],
+    'title': [
+        ".gig-card-layout h3 a",
+        "h3 a",
+        ".gig-title a",
+        "a[href*='/gigs/']",
+        ".gig-card-header a"
+    ],
+    'seller': [
+        ".seller-name",
+        ".username",
+        ".seller-link",
+        "[data-username]"
+    ],
+    'price': [
+        ".price",
+        ".gig-price",
+        "[data-testid='price']",
+        ".price-wrapper"
+    ]
+}
+selector_cascade.register('fiverr', FIVERR_SELECTORS)
+
+def fiverr_search_url(keywords, location=None, page=1):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    url = f'https://www.fiverr.com/search/gigs?query={urllib.parse.quote(query)}&source=top-bar'
+    return url if page == 1 else f'{url}&page={page}'
 
-def get_fiverr_jobs(keywords, location=None):
-    """Enhanced Fiverr scraper with better anti-detection"""
+def get_fiverr_jobs(keywords, location=None, page=1):
+    """Enhanced Fiverr scraper with better anti-detection; `page` is the 1-based results page"""
+    if replaying():
+        print("Replay mode: Fiverr is browser-only, skipping")
+        return []
     driver = None
+    budget = wait_budget('fiverr')
     try:
-        driver = setup_selenium_driver()
+        driver = selenium_pool.acquire()
         if not driver:
             print("Selenium driver not available, skipping Fiverr")
             return []
         
-        query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-        url = f'https://www.fiverr.com/search/gigs?query={urllib.parse.quote(query)}&source=top-bar'
+        url = fiverr_search_url(keywords, location, page)
         
+        budget.polite()
+        throttle(url, budget)
         driver.get(url)
-        simulate_human_behavior(driver)
+        simulate_human_behavior(driver, budget)
         
-        time.sleep(random.uniform(5, 8))
+        any_gig = ', '.join(FIVERR_SELECTORS['card'])
         
-        # Handle cookie consent more reliably
+        # Wait once for any gig card instead of sleeping and probing each selector
+        wait_for_elements(driver, any_gig, budget, timeout=15)
+        
+        # Handle cookie consent if the banner is already there
         try:
             cookie_selectors = [
                 "[data-testid='cookie-accept']",
@@ -946,45 +1076,21 @@ def get_fiverr_jobs(keywords, location=None):
                 "button[class*='cookie']"
             ]
             
-            for selector in cookie_selectors:
-                try:
-                    cookie_button = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    cookie_button.click()
-                    time.sleep(1)
-                    break
-                except:
-                    continue
+            cookie_buttons = driver.find_elements(By.CSS_SELECTOR, ', '.join(cookie_selectors))
+            if cookie_buttons:
+                cookie_buttons[0].click()
         except:
             pass
         
-        for i in range(3):
-            driver.execute_script(f"window.scrollTo(0, {300 * (i + 1)});")
-            time.sleep(random.uniform(1, 2))
-        
-        # Wait for gigs with multiple selector attempts
-        gig_elements = []
-        gig_selectors = [
-            ".gig-card-layout",
-            "[data-gig-id]",
-            ".gig-wrapper",
-            "article.gig-card",
-            ".gig-card"
-        ]
+        # Scroll until lazy-loaded gigs stop appearing
+        wait_for_count_stable_driver(driver, any_gig, budget, settle=1.0, timeout=10, scroll=True)
         
-        for selector in gig_selectors:
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                )
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and len(elements) > 2:
-                    gig_elements = elements[:10]
-                    break
-            except:
-                continue
+        # A card selector only counts if it matches a real list
+        def find_cards(selector):
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            return elements if len(elements) > 2 else None
         
+        gig_elements = selector_cascade.first('fiverr', 'card', find_cards)
         if not gig_elements:
             print("No gigs found on Fiverr - possible blocking")
             return []
@@ -992,68 +1098,26 @@ def get_fiverr_jobs(keywords, location=None):
         jobs = []
         for gig in gig_elements:
             try:
-                title_selectors = [
-                    ".gig-card-layout h3 a",
-                    "h3 a",
-                    ".gig-title a",
-                    "a[href*='/gigs/']",
-                    ".gig-card-header a"
-                ]
-                
-                title_elem = None
-                for selector in title_selectors:
-                    try:
-                        title_elem = gig.find_element(By.CSS_SELECTOR, selector)
-                        break
-                    except:
-                        continue
+                find_in_gig = lambda selector: gig.find_element(By.CSS_SELECTOR, selector)
+                title_elem = selector_cascade.first('fiverr', 'title', find_in_gig)
                 
                 if title_elem:
                     title = title_elem.text.strip()
                     link = title_elem.get_attribute('href') or ''
                     
-                    # Get seller info
-                    seller = 'Seller not specified'
-                    seller_selectors = [
-                        ".seller-name",
-                        ".username",
-                        ".seller-link",
-                        "[data-username]"
-                    ]
-                    
-                    for selector in seller_selectors:
-                        try:
-                            seller_elem = gig.find_element(By.CSS_SELECTOR, selector)
-                            seller = seller_elem.text.strip()
-                            break
-                        except:
-                            continue
+                    seller_elem = selector_cascade.first('fiverr', 'seller', find_in_gig)
+                    seller = seller_elem.text.strip() if seller_elem else 'Seller not specified'
                     
-                    # Get price
-                    price = 'Price not specified'
-                    price_selectors = [
-                        ".price",
-                        ".gig-price", 
-                        "[data-testid='price']",
-                        ".price-wrapper"
-                    ]
-                    
-                    for selector in price_selectors:
-                        try:
-                            price_elem = gig.find_element(By.CSS_SELECTOR, selector)
-                            price = price_elem.text.strip()
-                            break
-                        except:
-                            continue
+                    price_elem = selector_cascade.first('fiverr', 'price', find_in_gig)
+                    price = price_elem.text.strip() if price_elem else 'Price not specified'
                     
                     if title:
-                        jobs.append({
+                        jobs.append(Job.coerce({
                             'title': title,
                             'seller': seller,
                             'price': price,
-                            'link': link,
-                            'platform': 'Fiverr'
-                        })
+                            'link': link
+                        }, 'fiverr'))
                         
             except Exception as e:
                 continue
@@ -1064,8 +1128,8 @@ def get_fiverr_jobs(keywords, location=None):
         print(f"Error scraping Fiverr: {e}")
         return []
     finally:
-        if driver:
-            driver.quit()
+        selenium_pool.release(driver)
+        budget.report()
 
 def get_angellist_jobs(city, keywords):
     """Fetches jobs from AngelList (Wellfound) using its API."""
@@ -1076,27 +1140,28 @@ def get_angellist_jobs(city, keywords):
     }
     # The Wellfound API is complex and may not have a simple job search endpoint.
     # This is a placeholder for a hypothetical job search API call.
-    url = f"https://api.wellfound.com/v1/jobs"
+    query = urllib.parse.urlencode({'query': keywords, 'location': city or ''})
+    url = f"https://api.wellfound.com/v1/jobs?{query}"
     
     try:
-        response = requests.get(url, headers=headers, params={'query': keywords, 'location': city})
-        response.raise_for_status() # Raise an exception for bad status codes
-        data = response.json()
+        # make_request gives the API call the shared session, rate limit, cache and fixtures
+        body = make_request(url, headers=headers, platform='angellist')
+        if body is None:
+            print("Please check your API key and permissions for the Wellfound API.")
+            return []
+        data = json.loads(body)
         
         # Example of how you would parse the JSON data
         for job in data.get('jobs', []):
-            jobs.append({
+            jobs.append(Job.coerce({
                 'title': job.get('title'),
                 'link': job.get('permalink'),
                 'company': job.get('startup').get('name')
-            })
+            }, 'angellist'))
             
         print(f"Successfully fetched {len(jobs)} jobs from AngelList via API")
         return jobs
         
-    except requests.exceptions.HTTPError as e:
-        print(f"HTTP Error: {e.response.status_code} - {e.response.text}")
-        print("Please check your API key and permissions for the Wellfound API.")
     except Exception as e:
         print(f"Error fetching jobs from AngelList API: {e}")
         
@@ -1114,114 +1179,83 @@ def get_toptal_jobs(keywords, location=None):
         return []
 
 # Alternative job sources that are easier to scrape
+def timesjobs_search_url(keywords, location=None, page=1):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    location_param = location if location else ''
+    url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&txtKeywords={urllib.parse.quote(query)}&txtLocation={location_param}'
+    return url if page == 1 else f'{url}&sequence={page}&startPage=1'
+
 def get_timesjobs_jobs(keywords, location=None):
     """Scrape jobs from TimesJobs.com"""
     try:
-        query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-        location_param = location if location else ''
-        url = f'https://www.timesjobs.com/candidate/job-search.html?searchType=personalizedSearch&from=submit&txtKeywords={urllib.parse.quote(query)}&txtLocation={location_param}'
+        url = timesjobs_search_url(keywords, location)
         
-        html_content = make_request(url)
+        html_content = make_request(url, platform='timesjobs')
         if not html_content:
             return []
             
-        soup = BeautifulSoup(html_content, 'lxml')
-        jobs = []
-        
-        job_elements = soup.find_all('li', class_='clearfix job-bx wht-shd-bx')
-        
-        for job in job_elements[:10]:
-            try:
-                published_date_element = job.find('span', class_='sim-posted')
-                if published_date_element and published_date_element.span:
-                    published_date = published_date_element.span.text
-                    # Focus on recently posted jobs
-                    if 'few' in published_date.lower() or 'today' in published_date.lower():
-                        company_name_elem = job.find('h3', class_='joblist-comp-name')
-                        company_name = company_name_elem.text.replace(' ', '').strip() if company_name_elem else 'N/A'
-                        
-                        skills_element = job.find('span', class_='srp-skills')
-                        skills = skills_element.text.replace(' ', '').strip() if skills_element else 'Skills not specified'
-                        
-                        title_elem = job.header.h2.a if job.header and job.header.h2 and job.header.h2.a else None
-                        title = title_elem.text.strip() if title_elem else 'Job Title Not Found'
-                        link = title_elem['href'] if title_elem and title_elem.get('href') else ''
-                        
-                        jobs.append({
-                            'title': title,
-                            'company': company_name,
-                            'skills': skills,
-                            'link': link,
-                            'platform': 'TimesJobs',
-                            'posted': published_date
-                        })
-            except Exception as e:
-                continue  # Skip problematic job entries
+        return parse_timesjobs_jobs(html_content)
+    except Exception as e:
+        print(f"Error scraping TimesJobs: {e}")
+        return []
+
+async def get_timesjobs_jobs_async(keywords, location=None):
+    """get_timesjobs_jobs on the shared aiohttp session"""
+    try:
+        url = timesjobs_search_url(keywords, location)
         
-        return jobs
+        html_content = await make_request_async(url, platform='timesjobs')
+        if not html_content:
+            return []
+            
+        return await parse_off_loop('timesjobs', html_content)
     except Exception as e:
         print(f"Error scraping TimesJobs: {e}")
         return []
 
-async def get_glassdoor_jobs(keywords, location=None):
+# Glassdoor city filters searched on every run
+GLASSDOOR_LOCATIONS = ['locT=C&locId=2762404', 'locT=C&locId=2203308']
+
+def glassdoor_search_url(keywords, location=None, page=1, city=GLASSDOOR_LOCATIONS[0]):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    location_param = location if location else 'Indonesia'
+    url = f'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={urllib.parse.quote(query)}&{city}&locKeyword={urllib.parse.quote(location_param)}&jobType=all&fromAge=-1&minSalary=0&includeNoSalaryJobs=true&radius=100&cityId=-1&minRating=0.0&industryId=-1&sgocId=-1&seniorityType=all&companyId=-1&employerSizes=0&applicationType=0&remoteWorkType=1'
+    return url if page == 1 else f'{url}&p={page}'
+
+async def get_glassdoor_jobs(keywords, location=None, page=1):
     """
-    Glassdoor scraper using pyppeteer with anti-detection measures
+    Glassdoor scraper using pyppeteer with anti-detection measures; `page` is
+    the 1-based results page of every GLASSDOOR_LOCATIONS search
     """
-    browser = None
+    if replaying():
+        print("Replay mode: Glassdoor is browser-only, skipping")
+        return []
+    pool = get_browser_pool(headless=False)
+    tab = None
+    jobs = []
+    blocker = make_resource_blocker('glassdoor')
+    budget = wait_budget('glassdoor')
     try:
-        query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-        location_param = location if location else 'Indonesia'
-        string=['locT=C&locId=2762404','locT=C&locId=2203308']
-        for i in range(len(string)):
-            # Construct Glassdoor search URL                                                           
-            search_url = f'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={urllib.parse.quote(query)}&{string[i]}&locKeyword={urllib.parse.quote(location_param)}&jobType=all&fromAge=-1&minSalary=0&includeNoSalaryJobs=true&radius=100&cityId=-1&minRating=0.0&industryId=-1&sgocId=-1&seniorityType=all&companyId=-1&employerSizes=0&applicationType=0&remoteWorkType=1'
+        for city in GLASSDOOR_LOCATIONS:
+            search_url = glassdoor_search_url(keywords, location, page, city)
             chrome_path = find_chrome_executable()
             if not chrome_path:
                 print("Chrome executable not found. Please install Chrome or set the correct path.")
                 return []
             
-            launch_options = {
-                'headless': False,
-                'args': [
-                    '--no-sandbox',
-                    '--disable-features=CrossOriginEmbedderPolicy',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--disable-gpu',
-                    '--disable-background-timer-throttling',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-renderer-backgrounding',
-                    '--disable-features=TranslateUI',
-                    '--disable-ipc-flooding-protection',
-                    '--window-size=1920,1080',
-                    '--disable-setuid-sandbox',
-                    '--disable-infobars',
-                    '--window-position=0,0',
-                    '--ignore-certificate-errors',
-                    '--ignore-certificate-errors-spki-list',
-                    f'--user-agent={get_random_user_agent()}'
-                ],
-                'ignoreHTTPSErrors': True
-            }
-            
-            # Only set executablePath if we found a specific Chrome path
-            if chrome_path and os.path.exists(chrome_path):
-                launch_options['executablePath'] = chrome_path
-            
-            browser = await launch(**launch_options)
-            page = await browser.newPage()
+            tab = await pool.acquire_page()
+            if blocker:
+                await blocker.attach(tab)
 
             # Apply stealth evasions
-            await stealth(page)
+            await stealth(tab)
             # Set viewport and additional headers
-            await page.evaluateOnNewDocument('() =>{ Object.defineProperties(navigator, { webdriver: { get: () => false } }) }')
-            await page.setViewport({'width': 1920, 'height': 1080})
-            await page.setUserAgent(get_random_user_agent())
+            await tab.evaluateOnNewDocument('() =>{ Object.defineProperties(navigator, { webdriver: { get: () => false } }) }')
+            await tab.setViewport({'width': 1920, 'height': 1080})
+            await tab.setUserAgent(get_random_user_agent())
             
             # Set additional headers to appear more like a real browser
-            await page.setExtraHTTPHeaders({
+            await tab.setExtraHTTPHeaders({
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
                 'Accept-Encoding': 'gzip, deflate, br',
@@ -1237,18 +1271,28 @@ async def get_glassdoor_jobs(keywords, location=None):
             
             print(f"Navigating to: {search_url}")
             # Navigate to search page
-            await page.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 100000})
+            await budget.polite_async()
+            await throttle_async(search_url, budget)
+            await tab.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 100000})
             
-            await page.waitForSelector(
+            if not await wait_for_selector(
+                tab,
                 "[class*='JobsList_jobsList__'], .react-job-listing, .jobContainer, [data-test='job-listing']",
-                timeout=30000
+                budget,
+                timeout=30
+            ):
+                print(f"No job list found on Glassdoor page: {search_url}")
+
+            # Let the listing finish rendering instead of pausing for a random delay
+            await wait_for_count_stable(
+                tab,
+                "[class*='JobsList_jobListItem__'], .react-job-listing, .jobContainer, [data-test='job-listing']",
+                budget,
+                settle=1.0,
+                timeout=10
             )
-
-
-            # Random delay to simulate human behavior
-            await page.waitFor(random.randint(2000, 4000))
             
-            jobs_data = await page.evaluate('''() => {
+            jobs_data = await tab.evaluate('''() => {
                 const jobs = [];
                 
                 // Try to find job list container first
@@ -1414,55 +1458,42 @@ async def get_glassdoor_jobs(keywords, location=None):
                 return jobs;
 
             }''')
+            jobs.extend(coerce_jobs(jobs_data, 'glassdoor'))
         
-            await browser.close()
+            await pool.release_page(tab)
+            tab = None
         
-        print(f"Successfully scraped {len(jobs_data)} jobs from Glassdoor")
-        return jobs_data
+        print(f"Successfully scraped {len(jobs)} jobs from Glassdoor")
+        if blocker:
+            blocker.report('Glassdoor')
+        return jobs
         
     except Exception as e:
         print(f"Error scraping Glassdoor with pyppeteer: {e}")
-        if browser:
-            await browser.close()
-        return []
+        return jobs
+    finally:
+        if tab:
+            await pool.release_page(tab)
+        budget.report()
 
 
+def remote_co_search_url(keywords, location=None, page=1):
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    url = f'https://remote.co/remote-jobs/search?searchkeyword={urllib.parse.quote(query)}&useclocation=false'
+    return url if page == 1 else f'{url}&page={page}'
+
 async def get_remote_jobs(keywords, location=None):
     """
     Corrected Remote.co scraper using pyppeteer
     """
-    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-    search_url = f'https://remote.co/remote-jobs/search?searchkeyword={urllib.parse.quote(query)}&useclocation=false'
+    search_url = remote_co_search_url(keywords, location)
 
     # Step 1: Try requests first
     try:
-        headers = {'User-Agent': get_random_user_agent()}
-        response = requests.get(search_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        html_content = await make_request_async(search_url, retries=1, timeout=15, platform='remote')
         
-        if response.text and 'job_listing' in response.text:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            jobs = []
-            
-            job_elements = soup.select('.job_listing, .job-listing-item')
-            for job in job_elements[:10]:
-                try:
-                    title_elem = job.select_one('h3 a, h2 a, .job-title a')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
-                        link = title_elem.get('href', '')
-                        
-                        company_elem = job.select_one('.company_name, .company-name')
-                        company = company_elem.get_text(strip=True) if company_elem else 'Company not specified'
-                        
-                        jobs.append({
-                            'title': title,
-                            'link': f"https://remote.co{link}" if link.startswith('/') else link,
-                            'company': company,
-                            'platform': 'Remote.co'
-                        })
-                except Exception as e:
-                    continue
+        if html_content and 'job_listing' in html_content:
+            jobs = await parse_off_loop('remote', html_content)
             
             if jobs:
                 print(f"Successfully scraped {len(jobs)} Remote.co jobs using requests.")
@@ -1472,48 +1503,30 @@ async def get_remote_jobs(keywords, location=None):
         print(f"Requests-based Remote.co scrape failed: {e}. Falling back to pyppeteer.")
     
     # Step 2: Fallback to pyppeteer
-    browser = None
+    if replaying():
+        print("Replay mode: skipping Remote.co browser fallback")
+        return []
+    pool = get_browser_pool(headless=True)
+    page = None
+    budget = wait_budget('remote', 'Remote.co')
     try:
-        chrome_path = find_chrome_executable()
-        if not chrome_path:
-            print("Chrome executable not found for Remote.co scraping.")
-            return []
-        
-        launch_options = {
-            'headless': True,
-            'args': [
-                '--no-sandbox',
-                '--disable-setuid-sandbox', 
-                '--disable-dev-shm-usage',
-                '--window-size=1920,1080',
-                f'--user-agent={get_random_user_agent()}'
-            ]
-        }
-        
-        if chrome_path and os.path.exists(chrome_path):
-            launch_options['executablePath'] = chrome_path
-            
-        browser = await launch(**launch_options)
-        page = await browser.newPage()
+        page = await pool.acquire_page()
         
         await page.setViewport({'width': 1920, 'height': 1080})
+        await budget.polite_async()
+        await throttle_async(search_url, budget)
         await page.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 30000})
-        
-        # Wait and scroll
-        await asyncio.sleep(3)
-        for i in range(2):
-            await page.evaluate('window.scrollBy(0, window.innerHeight)')
-            await asyncio.sleep(random.uniform(1.5, 3))
 
         # Wait for jobs to load
-        try:
-            await page.waitForSelector('#job-table-wrapper', {'timeout': 10000})
-        except:
+        if not await wait_for_selector(page, '#job-table-wrapper', budget, timeout=10):
             print("No job listings found on Remote.co")
             return []
+        
+        # Scroll until no more rows get added
+        await wait_for_count_stable(page, '#job-table-wrapper > *', budget, settle=1.0, timeout=10, scroll=True)
         jobs = []
         # First, get the parent element
-        jobs_wrapper = await page.waitForSelector('#job-table-wrapper', {'timeout': 10000})
+        jobs_wrapper = await page.querySelector('#job-table-wrapper')
 
         # Use element.querySelectorAll() with the universal selector '*'
         # This selects all direct child elements of jobs_wrapper.
@@ -1566,7 +1579,7 @@ async def get_remote_jobs(keywords, location=None):
 
                 if job_data:
                     print(f"Successfully scraped data for: {job_data['title']}")
-                    jobs.append(job_data)
+                    jobs.append(Job.coerce(job_data, 'remote'))
 
             except Exception as e:
                 print(f"Error scraping job {job_index + 1}: {e}")
@@ -1579,11 +1592,9 @@ async def get_remote_jobs(keywords, location=None):
         print(f"Error scraping Remote.co with pyppeteer: {e}")
         return []
     finally:
-        if browser:
-            try:
-                await browser.close()
-            except:
-                pass
+        if page:
+            await pool.release_page(page)
+        budget.report()
 
 async def scroll_to_selector(page, selector, timeout=10000):
     """
@@ -1618,9 +1629,10 @@ async def scroll_to_selector(page, selector, timeout=10000):
         if time.time() - start_time > timeout / 1000:
             print(f"Scrolling timed out after {timeout/1000} seconds. Selector not found.")
             return False
-async def get_jobs_from_categories(page, search_url, max_sections=3):
+async def get_jobs_from_categories(page, search_url, max_sections=3, blocker=None):
     """
     Scrapes jobs and then navigates to the detail page for each to get more data.
+    If a ResourceBlocker is given it is attached to every detail tab as well.
     """
     job_details = []
 
@@ -1656,10 +1668,14 @@ async def get_jobs_from_categories(page, search_url, max_sections=3):
             
             print(f"Navigating to job {i+1} detail page at: {link_href}")
             # Open a new tab
-            new_tab = await page.browser.newPage()
+            # Open the tab in the same incognito context as the listing page
+            new_tab = await page.target.browserContext.newPage()
             await new_tab.setViewport({'width': 1366, 'height': 768})
+            if blocker:
+                await blocker.attach(new_tab)
             
             # Navigate to the job detail page in the new tab
+            await throttle_async(link_href)
             await new_tab.goto(link_href, {'waitUntil': 'networkidle2', 'timeout': 60000})
 
             # Wait for job listings to load on the detail page
@@ -1706,7 +1722,7 @@ async def get_jobs_from_categories(page, search_url, max_sections=3):
                             return anchor ? anchor.innerText.trim() : null;
                         }''')
                         job_data['skills'] = category_name
-                        job_details.append(job_data)
+                        job_details.append(Job.coerce(job_data, 'weworkremotely'))
                 except Exception as e:
                     print(f"Error scraping job {job_index+1} on detail page: {e}")
                     continue
@@ -1720,150 +1736,116 @@ async def get_jobs_from_categories(page, search_url, max_sections=3):
                 await page.goBack({'waitUntil': 'networkidle2', 'timeout': 200000})
             except:
                 # If we can't go back, reload the main page
+                await throttle_async(search_url)
                 await page.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 60000})
             continue
 
     print(f"Successfully scraped details for {len(job_details)} jobs.")
     return job_details
 
+def weworkremotely_search_url(keywords, location=None, page=1):
+    """Search results come back on a single page"""
+    if page != 1:
+        return None
+    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
+    return f'https://weworkremotely.com/remote-jobs/search?term={urllib.parse.quote(query)}'
+
 async def get_weworkremotely_jobs(keywords, location=None):
     """
     Corrected We Work Remotely scraper
     """
-    query = ' '.join(keywords) if isinstance(keywords, list) else keywords
-    search_url = f'https://weworkremotely.com/remote-jobs/search?term={urllib.parse.quote(query)}'
+    search_url = weworkremotely_search_url(keywords, location)
     jobs = []
     # Step 1: Try with BeautifulSoup
     try:
-        headers = {
-            'User-Agent': get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        headers = platform_headers('weworkremotely')
         
-        response = requests.get(search_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        html_content = await make_request_async(search_url, retries=1, headers=headers, timeout=15, platform='weworkremotely')
+        if not html_content:
+            raise ValueError("empty response")
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        # Look for job listings in both 'li' with classes 'feature' and regular ones
-        for job_item in soup.select('li.feature, li:not(.feature)'):
-            # Skip if it's a view-all or non-job item
-            if job_item.find('a', class_='view-all'):
-                continue
-                
-            link = job_item.find('a', href=True)
-            title_span = job_item.find('span', class_='title')
-            company_span = job_item.find('span', class_='company')
-            
-            if link and title_span and company_span:
-                job_url = f"https://weworkremotely.com{link['href']}"
-                jobs.append({
-                    'title': title_span.get_text(strip=True),
-                    'company': company_span.get_text(strip=True),
-                    'url': job_url,
-                    'platform': 'We Work Remotely'
-                })
+        jobs = await parse_off_loop('weworkremotely', html_content)
         
         if jobs:
             print(f"Successfully scraped {len(jobs)} We Work Remotely jobs using JSON API.")
-            return jobs[:10]  # Limit to 10 results
+            return jobs
             
     except Exception as e:
         print(f"Scrape failed: {e}. Falling back to pyppeteer.")
     
     # Step 2: Fallback to web scraping
-    browser = None
+    if replaying():
+        print("Replay mode: skipping We Work Remotely browser fallback")
+        return []
+    pool = get_browser_pool(headless=False)
+    page = None
+    budget = wait_budget('weworkremotely', 'We Work Remotely')
     
     try:
-        chrome_path = find_chrome_executable()
-        if not chrome_path:
-            print(f"No chrome executable exist.")
-            return []
-            
-        launch_options = {
-            'headless': False,
-            'args': ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage'],
-            'executablePath': chrome_path
-        }
-        
-        # if chrome_path and os.path.exists(chrome_path):
-        #     launch_options['executablePath'] = chrome_path
-            
-        browser = await launch(**launch_options)
-        page = await browser.newPage()
+        page = await pool.acquire_page()
+        blocker = make_resource_blocker('weworkremotely')
+        if blocker:
+            await blocker.attach(page)
 
+        await budget.polite_async()
+        await throttle_async(search_url, budget)
         await page.goto(search_url, {'waitUntil': 'networkidle2', 'timeout': 180000})
-        # Simulate human scrolling
-        for i in range(3):
-            await page.evaluate('window.scrollBy(0, window.innerHeight)')
-            await asyncio.sleep(random.uniform(3.5, 5))
+        # Scroll until the category sections stop growing
+        await wait_for_count_stable(page, 'section.jobs > article', budget, settle=1.5, timeout=15, scroll=True)
             
-        job_elements = await get_jobs_from_categories(page, search_url)
+        job_elements = await get_jobs_from_categories(page, search_url, blocker=blocker)
 
         # Extract job details
         for job in job_elements:
             jobs.append(job) # Check if all fields are non-null
-                
+        
+        if blocker:
+            blocker.report('We Work Remotely')
         return jobs
         
     except Exception as e:
         print(f"Error scraping We Work Remotely: {e}")
         return []
     finally:
-        if browser:
-            try:
-                await browser.close()
-            except:
-                pass
+        if page:
+            await pool.release_page(page)
+        budget.report()
+
+def remoteok_search_url(keywords, location=None, page=1):
+    """The listing page holds every open job for the tag; there is no page 2"""
+    if page != 1:
+        return None
+    query = '+'.join(keywords) if isinstance(keywords, list) else keywords
+    return f'https://remoteok.io/remote-{query.lower()}-jobs'
 
 def get_remoteok_jobs(keywords, location=None):
     """Scrape jobs from Remote OK (good alternative)"""
     try:
-        query = '+'.join(keywords) if isinstance(keywords, list) else keywords
-        url = f'https://remoteok.io/remote-{query.lower()}-jobs'
+        url = remoteok_search_url(keywords, location)
         
-        headers = {
-            'User-Agent': get_random_user_agent(),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-        }
+        headers = platform_headers('remoteok')
         
-        response = requests.get(url, headers=headers, timeout=10)
-        if response.status_code != 200:
+        html_content = make_request(url, retries=1, headers=headers, timeout=10, platform='remoteok')
+        if not html_content:
             return []
             
-        soup = BeautifulSoup(response.text, 'html.parser')
-        jobs = []
+        return parse_remoteok_jobs(html_content)
+    except Exception as e:
+        print(f"Error scraping RemoteOK: {e}")
+        return []
+
+async def get_remoteok_jobs_async(keywords, location=None):
+    """get_remoteok_jobs on the shared aiohttp session"""
+    try:
+        url = remoteok_search_url(keywords, location)
         
-        job_elements = soup.select('tr.job')
+        headers = platform_headers('remoteok')
         
-        for job in job_elements[:10]:
-            try:
-                title_elem = job.select_one('h2')
-                company_elem = job.select_one('.company h3')
-                location_elem = job.select_one('.location')
-                
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    company = company_elem.get_text(strip=True) if company_elem else 'Company not specified'
-                    job_location = location_elem.get_text(strip=True) if location_elem else 'Remote'
-                    
-                    link_elem = job.select_one('a')
-                    link = f"https://remoteok.io{link_elem.get('href')}" if link_elem else ''
-                    
-                    jobs.append({
-                        'title': title,
-                        'company': company,
-                        'location': job_location,
-                        'link': link,
-                        'platform': 'RemoteOK'
-                    })
-            except Exception as e:
-                continue
-                
-        return jobs
+        html_content = await make_request_async(url, retries=1, headers=headers, timeout=10, platform='remoteok')
+        if not html_content:
+            return []
+            
+        return await parse_off_loop('remoteok', html_content)
     except Exception as e:
         print(f"Error scraping RemoteOK: {e}")
         return []
@@ -1872,18 +1854,28 @@ def get_remoteok_jobs(keywords, location=None):
 all_jobs = {
     'freelancer': {
         'jobs': get_freelancer_jobs,
+        # Native asyncio variant, preferred by the orchestrator when present
+        'async_jobs': get_freelancer_jobs_async,
         'link': 'https://www.freelancer.com',
         'description': 'Global freelancing platform for various skills'
     },
     'glassdoor': {
         'jobs': get_glassdoor_jobs,
         'link': 'https://www.glassdoor.com',
-        'description': 'Job search and company reviews platform'
+        'description': 'Job search and company reviews platform',
+        'timeout': 300,
+        # Opt-in request blocking for browser scrapes (image/font/media/stylesheet/third_party)
+        'block_resources': ['image', 'font', 'media', 'third_party'],
+        'politeness_delay': 2.0,
+        # Requests per second and back-to-back burst for the host (defaults in rate_limiter)
+        'rate_limit': {'rate': 0.5, 'burst': 2}
     },
     # 'upwork': {
     #     'jobs': get_upwork_jobs,
     #     'link': 'https://www.upwork.com',
-    #     'description': 'Professional freelancing platform'
+    #     'description': 'Professional freelancing platform',
+    #     # Third-party hosts stay allowed so the Cloudflare challenge can load
+    #     'block_resources': ['image', 'font', 'media']
     # },
     # 'fiverr': {
     #     'jobs': get_fiverr_jobs,
@@ -1893,7 +1885,10 @@ all_jobs = {
     'indeed': {
         'jobs': get_indeed_jobs,
         'link': 'https://www.indeed.com',
-        'description': 'Global job search engine'
+        'description': 'Global job search engine',
+        # Minimum seconds between page actions (defaults to DEFAULT_POLITENESS_DELAY)
+        'politeness_delay': 2.0,
+        'rate_limit': {'rate': 0.5, 'burst': 2}
     },
     'angellist': {
         'jobs': get_angellist_jobs,
@@ -1902,13 +1897,17 @@ all_jobs = {
     },
     'remoteok': {
         'jobs': get_remoteok_jobs,
+        'async_jobs': get_remoteok_jobs_async,
         'link': 'https://remoteok.io',
         'description': 'Remote job board with good API access'
     },
     'timesjobs': {
         'jobs': get_timesjobs_jobs,
+        'async_jobs': get_timesjobs_jobs_async,
         'link': 'https://www.timesjobs.com',
-        'description': 'Leading job portal in India'
+        'description': 'Leading job portal in India',
+        # Seconds a cached search page stays fresh (defaults to DEFAULT_CACHE_TTL)
+        'cache_ttl': 60 * 60
     },
     'remote': {
         'jobs': get_remote_jobs,
@@ -1918,10 +1917,127 @@ all_jobs = {
     'weworkremotely': {
         'jobs': get_weworkremotely_jobs,
         'link': 'https://weworkremotely.com',
-        'description': 'Remote-first job board'
+        'description': 'Remote-first job board',
+        'timeout': 300,
+        # Cloudflare challenge hosts are always let through (browser_pool.CHALLENGE_HOSTS)
+        'block_resources': ['image', 'font', 'media', 'third_party']
     }
 }
 
+configure_rate_limits(all_jobs)
+
+# Results page URL per platform: SEARCH_URLS[platform](keywords, location, page)
+# gives page `page` (1-based), or None past the last page the site offers
+SEARCH_URLS = {
+    'freelancer': freelancer_search_url,
+    'upwork': upwork_search_url,
+    'timesjobs': timesjobs_search_url,
+    'remote': remote_co_search_url,
+    'weworkremotely': weworkremotely_search_url,
+    'remoteok': remoteok_search_url
+}
+
+# Browser scrapers that take a `page` argument, with their results page URLs
+# (same contract as SEARCH_URLS). stream_job_pages asks them for one page at a time.
+PAGED_SCRAPERS = {
+    'indeed': indeed_search_url,
+    'glassdoor': glassdoor_search_url,
+    'fiverr': fiverr_search_url
+}
+
+# Pages fetched per search unless all_jobs sets 'max_pages'
+DEFAULT_MAX_PAGES = 3
+
+async def fetch_and_parse(platform, url):
+    """Fetch one results page and parse it off the event loop; None if it could not be fetched"""
+    html_content = await make_request_async(url, retries=1, headers=platform_headers(platform), timeout=15,
+                                            platform=platform)
+    return await parse_off_loop(platform, html_content) if html_content else None
+
+async def stream_job_pages(platform, keywords, location=None, max_results=None, max_pages=None,
+                           fetch=fetch_and_parse, seen=None, executor=None):
+    """
+    Yield a platform's jobs one results page at a time. Plain results pages
+    come from `fetch(platform, url)` (pass ParsePipeline.submit to parse in
+    worker processes), with page n+1 fetched while the caller works through
+    page n; PAGED_SCRAPERS are asked for one page after the other. Stops at
+    max_pages (all_jobs 'max_pages', else DEFAULT_MAX_PAGES), once max_results
+    jobs are out, or at the first page with no new jobs. With a SeenJobs index
+    as `seen`, only unseen jobs are yielded and paging stops on the first page
+    made up only of jobs from earlier runs. Other platforms run their scraper
+    once and yield its jobs as a single page. Blocking scrapers run on
+    `executor` (the loop's default one if None).
+    """
+    config = all_jobs.get(platform, {})
+    job_func = config.get('async_jobs') or config.get('jobs')
+
+    def run_scraper(**kwargs):
+        if asyncio.iscoroutinefunction(job_func):
+            return asyncio.ensure_future(job_func(keywords, location, **kwargs))
+        call = functools.partial(job_func, keywords, location, **kwargs)
+        return asyncio.get_running_loop().run_in_executor(executor, call)
+
+    if platform not in SEARCH_URLS and platform not in PAGED_SCRAPERS:
+        jobs = await run_scraper()
+        jobs = seen.filter_new(jobs or []) if seen else (jobs or [])
+        if jobs:
+            yield jobs[:max_results]
+        return
+
+    def request_page(page):
+        if platform in SEARCH_URLS:
+            url = SEARCH_URLS[platform](keywords, location, page)
+            return asyncio.ensure_future(fetch(platform, url)) if url else None
+        if PAGED_SCRAPERS[platform](keywords, location, page) is None:
+            return None
+        return run_scraper(page=page)
+
+    prefetch = platform in SEARCH_URLS    # browser pages load one at a time
+    max_pages = max_pages or config.get('max_pages', DEFAULT_MAX_PAGES)
+    streamed = set()
+    yielded = 0
+    pending = request_page(1)
+    try:
+        for page in range(1, max_pages + 1):
+            if pending is None:
+                break
+            jobs = await pending
+            pending = None
+            new_jobs = [job for job in (jobs or []) if job_hash(job) not in streamed]
+            if not new_jobs:
+                break
+            reached_known = False
+            if seen:
+                unseen = seen.filter_new(new_jobs)
+                # Not every platform sorts by date, and pinned/featured jobs
+                # come back on every search, so one known job proves nothing
+                reached_known = not unseen
+                new_jobs = unseen
+            if max_results is not None:
+                new_jobs = new_jobs[:max_results - yielded]
+            
+            more = page < max_pages and not reached_known and (max_results is None or yielded + len(new_jobs) < max_results)
+            if more and prefetch:
+                pending = request_page(page + 1)
+            
+            streamed.update(job_hash(job) for job in new_jobs)
+            yielded += len(new_jobs)
+            yield new_jobs
+            if not more:
+                break
+            if not prefetch:
+                pending = request_page(page + 1)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+async def stream_jobs(platform, keywords, location=None, max_results=None, max_pages=None,
+                      fetch=fetch_and_parse, seen=None):
+    """stream_job_pages one job at a time"""
+    async for jobs in stream_job_pages(platform, keywords, location, max_results, max_pages, fetch, seen):
+        for job in jobs:
+            yield job
+
 def safe_scrape_with_fallback(scraper_func, platform_name, keywords, location=None, max_retries=2):
     """Safely execute scraper with fallback and retry logic"""
     for attempt in range(max_retries):
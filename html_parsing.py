@@ -0,0 +1,69 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+DEFAULT_FEATURES = 'lxml'
+
+# One compound selector: optional tag, then any mix of .class, #id, [attr] and [attr=value]
+_COMPOUND = re.compile(r'^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:\.[\w-]+|#[\w-]+|\[[^\]]+\])*)$')
+_PART = re.compile(r'\.([\w-]+)|#([\w-]+)|\[\s*([\w-]+)\s*(?:=\s*["\']?([^"\'\]]*)["\']?\s*)?\]')
+
+
+def _compile_selector(selector):
+    """
+    Turn a simple selector ('tr.job', '.job_listing', 'div[data-project-id]',
+    'article[data-test="JobTile"]') into (tag, classes, attrs). Returns None
+    for anything a start-tag match cannot decide: combinators, pseudo-classes.
+    """
+    match = _COMPOUND.match(selector.strip())
+    if not match or not (match.group('tag') or match.group('rest')):
+        return None
+    tag = match.group('tag')
+    classes = []
+    attrs = {}
+    for class_name, element_id, attr, value in _PART.findall(match.group('rest')):
+        if class_name:
+            classes.append(class_name)
+        elif element_id:
+            attrs['id'] = element_id
+        else:
+            attrs[attr] = value if value else None    # None: attribute only has to be present
+    return (None if tag in (None, '*') else tag.lower(), classes, attrs)
+
+
+def card_strainer(selectors):
+    """
+    SoupStrainer that keeps only the subtrees matching any of `selectors`.
+    Returns None (parse the whole page) if one of them is not a simple selector,
+    since straining would then drop the ancestors the selector depends on.
+    """
+    rules = [_compile_selector(selector) for selector in selectors]
+    if not rules or None in rules:
+        return None
+
+    def matches(name, attrs=None):
+        if attrs is None:    # called with a Tag
+            name, attrs = name.name, name.attrs
+        classes = attrs.get('class') or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        for tag, wanted_classes, wanted_attrs in rules:
+            if tag and tag != name:
+                continue
+            if any(class_name not in classes for class_name in wanted_classes):
+                continue
+            if any(attr not in attrs or (value is not None and attrs[attr] != value)
+                   for attr, value in wanted_attrs.items()):
+                continue
+            return True
+        return False
+
+    return SoupStrainer(matches)
+
+
+def make_soup(html_content, card_selectors=None, features=DEFAULT_FEATURES):
+    """
+    Shared entry point for listing pages: parse with lxml and, given the
+    platform's card selectors, only build the job card subtrees.
+    """
+    strainer = card_strainer(card_selectors) if card_selectors else None
+    return BeautifulSoup(html_content, features, parse_only=strainer)
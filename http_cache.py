@@ -0,0 +1,163 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import zstandard
+
+CACHE_DIR = '.http_cache'
+CACHE_MAX_BYTES = 200 * 1024 * 1024    # compressed bodies kept on disk
+ZSTD_LEVEL = 3
+
+# Request headers that change the response body and so belong in the cache key.
+# User-Agent is deliberately left out because it is randomised per request.
+KEY_HEADERS = ('accept', 'accept-language')
+
+# Text found in bot-challenge and captcha interstitials (Cloudflare, DataDome,
+# PerimeterX, hCaptcha/reCAPTCHA walls). These are often served with status 200
+# and must not be cached as if they were the page.
+CHALLENGE_MARKERS = (
+    'cf-chl-', '/cdn-cgi/challenge-platform/', 'cf-turnstile', '<title>just a moment...</title>',
+    'attention required! | cloudflare', 'captcha-delivery.com', 'px-captcha', 'h-captcha', 'g-recaptcha'
+)
+
+
+def normalize_url(url):
+    """Lowercase scheme/host, drop default ports and fragments, sort query params"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    port = parts.port
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f'{host}:{port}'
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+def is_challenge_page(body):
+    """True when a response body looks like a bot challenge rather than content"""
+    text = body[:200000].lower()
+    return any(marker in text for marker in CHALLENGE_MARKERS)
+
+
+class ResponseCache:
+    """
+    Persistent HTTP response cache in a single SQLite file. Bodies are stored
+    zstd-compressed alongside their ETag/Last-Modified validators, and the
+    least recently used entries are evicted once the cache exceeds max_bytes.
+    Freshness (TTL) is decided by the caller, per platform.
+    """
+
+    def __init__(self, path=None, max_bytes=CACHE_MAX_BYTES):
+        self.path = path or os.path.join(CACHE_DIR, 'responses.sqlite3')
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)')
+        self._db.commit()
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    @staticmethod
+    def make_key(url, headers=None):
+        headers = {name.lower(): value for name, value in (headers or {}).items()}
+        parts = [normalize_url(url)] + [f'{name}:{headers.get(name, "")}' for name in KEY_HEADERS]
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return the cached entry (body, etag, last_modified, stored_at) or None"""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute('UPDATE responses SET last_access = ? WHERE key = ?', (time.time(), key))
+            self._db.commit()
+            body = self._decompressor.decompress(row[0]).decode('utf-8')
+        return {'body': body, 'etag': row[1], 'last_modified': row[2], 'stored_at': row[3]}
+
+    def mark_hit(self, revalidated=False):
+        with self._lock:
+            self.hits += 1
+            if revalidated:
+                self.revalidated += 1
+
+    def put(self, key, url, body, etag=None, last_modified=None):
+        now = time.time()
+        with self._lock:
+            blob = self._compressor.compress(body.encode('utf-8'))
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses (key, url, body, size, etag, last_modified, stored_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, url, blob, len(blob), etag, last_modified, now, now)
+            )
+            self._evict()
+            self._db.commit()
+
+    def touch(self, key):
+        """Mark an entry fresh again after a 304 Not Modified"""
+        now = time.time()
+        with self._lock:
+            self._db.execute('UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?', (now, now, key))
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute('SELECT key, size FROM responses ORDER BY last_access').fetchall():
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        return {
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated
+        }
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Return the shared ResponseCache, opening it on first use"""
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
@@ -0,0 +1,249 @@
+import re
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+import xxhash
+
+# Query parameters that only track the visit; dropped from canonical URLs
+TRACKING_PARAMS = {
+    'ref', 'ref_', 'referrer', 'referrer_url_path', 'source', 'src', 'from', 'trk', 'tk', 'vjs',
+    'fbclid', 'gclid', 'msclkid', 'mc_cid', 'mc_eid', 'search_id', 'pageid'
+}
+TRACKING_PREFIXES = ('utm_', 'ga_', '_hs')
+
+# Canonical job fields, in export order
+JOB_FIELDS = ('platform', 'title', 'link', 'company', 'location', 'budget', 'skills', 'categories',
+              'description', 'posted')
+
+# Scraper-specific keys and the canonical field they fill
+FIELD_ALIASES = {
+    'url': 'link',
+    'permalink': 'link',
+    'client': 'company',
+    'seller': 'company',
+    'company_name': 'company',
+    'price': 'budget',
+    'salary': 'budget',
+    'headquarters': 'location',
+    'posted_date': 'posted',
+    'date': 'posted',
+    'descriptions': 'categories',
+    'tags': 'categories'
+}
+
+# Filler text scrapers use for missing values; stored as None instead
+PLACEHOLDERS = {
+    '', 'n/a', 'none', 'null', 'no description', 'budget not specified', 'client not specified',
+    'company not specified', 'skills not specified', 'job title not found'
+}
+
+
+class Job:
+    """
+    One job posting with canonical fields. Fields a platform does not have are
+    None; anything outside JOB_FIELDS (search metadata, ratings, ...) lives in
+    `extra`. Supports the dict-style access the exporters and generators
+    already use (job['title'], job.get('budget', ''), job['platform'] = ...),
+    and old key names such as 'url' or 'client' resolve to their canonical field.
+    """
+
+    __slots__ = JOB_FIELDS + ('extra',)
+
+    def __init__(self, platform=None, title=None, link=None, company=None, location=None, budget=None,
+                 skills=None, categories=None, description=None, posted=None, **extra):
+        self.platform = platform
+        self.title = title
+        self.link = link
+        self.company = company
+        self.location = location
+        self.budget = budget
+        self.skills = skills
+        self.categories = categories
+        self.description = description
+        self.posted = posted
+        self.extra = extra or None
+
+    @classmethod
+    def coerce(cls, raw, platform=None, base_url=None):
+        """
+        Job from a scraper dict (or an existing Job), run through the platform's
+        normalizer. `platform` is the all_jobs key and wins over raw['platform'];
+        relative links are resolved against `base_url`. A Job passed in is
+        never changed: it comes back as is, or as a copy when either applies.
+        """
+        if isinstance(raw, cls):
+            job = raw
+            if (platform and job.platform != platform) or (base_url and job.link and '://' not in job.link):
+                job = raw.copy()
+        else:
+            job = cls(**NORMALIZERS.get(platform, normalize_fields)(raw))
+        if platform:
+            job.platform = platform
+        if base_url and job.link and '://' not in job.link:
+            job.link = urljoin(base_url.rstrip('/') + '/', job.link)
+        return job
+
+    def get(self, key, default=None):
+        key = FIELD_ALIASES.get(key, key)
+        if key in JOB_FIELDS:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key) if self.extra else None
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        key = FIELD_ALIASES.get(key, key)
+        if key in JOB_FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        key = FIELD_ALIASES.get(key, key)
+        if key in JOB_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def keys(self):
+        keys = [field for field in JOB_FIELDS if getattr(self, field) is not None]
+        return keys + list(self.extra or ())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self):
+        """Plain dict of the set fields, for JSON/CSV export"""
+        return dict(self.items())
+
+    def copy(self):
+        """Shallow copy, like dict.copy"""
+        return Job(**self.to_dict())
+
+    def __eq__(self, other):
+        if not isinstance(other, Job):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        # Equal jobs share a link (or platform/title/company), so they hash alike
+        return job_hash(self)
+
+    def __repr__(self):
+        return f"Job({self.platform!r}, {self.title!r}, {self.link!r})"
+
+
+def clean_text(value):
+    """Collapse whitespace; None for empty or placeholder text"""
+    value = re.sub(r'\s+', ' ', value).strip()
+    return None if value.lower() in PLACEHOLDERS else value
+
+
+def normalize_fields(raw):
+    """Map a scraper dict onto canonical field names with cleaned values"""
+    fields = {}
+    for key, value in raw.items():
+        key = FIELD_ALIASES.get(key, key)
+        if isinstance(value, str):
+            value = clean_text(value)
+        if value is None or fields.get(key) is not None:
+            continue    # an earlier key already filled this field
+        fields[key] = value
+
+    categories = fields.get('categories')
+    if isinstance(categories, str):
+        fields['categories'] = [category.strip() for category in categories.split(',') if category.strip()]
+    return fields
+
+
+def normalize_timesjobs(raw):
+    """TimesJobs squeezes the spaces out of skills and prefixes dates with 'Posted'"""
+    fields = normalize_fields(raw)
+    if fields.get('skills'):
+        fields['skills'] = ', '.join(skill for skill in fields['skills'].split(',') if skill)
+    if fields.get('posted'):
+        fields['posted'] = re.sub(r'^posted\s*', '', fields['posted'], flags=re.IGNORECASE) or None
+    return fields
+
+
+def normalize_glassdoor(raw):
+    """Glassdoor ratings come back as text; easy_apply is only present when true"""
+    fields = normalize_fields(raw)
+    rating = fields.get('company_rating')
+    if rating:
+        try:
+            fields['company_rating'] = float(rating)
+        except ValueError:
+            pass
+    return fields
+
+
+# Per-platform normalizers; platforms not listed use normalize_fields
+NORMALIZERS = {
+    'timesjobs': normalize_timesjobs,
+    'glassdoor': normalize_glassdoor
+}
+
+
+def coerce_jobs(jobs, platform=None, base_url=None):
+    """Job.coerce over a list, skipping entries without a title"""
+    coerced = [Job.coerce(job, platform, base_url) for job in jobs or []]
+    return [job for job in coerced if job.title]
+
+
+def canonical_url(url, base_url=None):
+    """
+    One spelling per job page: https, no 'www.', default port, fragment,
+    tracking parameters or trailing slash, and the remaining query sorted.
+    Relative links are resolved against base_url when given.
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+    if base_url and '://' not in url:
+        url = urljoin(base_url.rstrip('/') + '/', url)
+    parts = urlsplit(url)
+    if not parts.netloc:
+        return url.rstrip('/')
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f'{host}:{parts.port}'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/')
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+
+def link_hash(url, base_url=None):
+    """
+    64-bit xxhash of the canonical URL as a signed int, so it fits SQLite
+    INTEGER and numpy int64 columns
+    """
+    return _hash64(canonical_url(url, base_url))
+
+
+def job_hash(job):
+    """
+    Job identity used for de-duplication: link_hash of its link, or of
+    platform/title/company when it has none. Works on Jobs and plain dicts.
+    """
+    link = job.get('link')
+    if link:
+        return link_hash(link)
+    return _hash64('|'.join(str(job.get(field) or '').strip().lower() for field in ('platform', 'title', 'company')))
+
+
+def _hash64(text):
+    value = xxhash.xxh64_intdigest(text.encode('utf-8'))
+    return value - (1 << 64) if value >= 1 << 63 else value
@@ -0,0 +1,205 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from job_record import Job, JOB_FIELDS, job_hash
+
+JOB_STORE_PATH = os.path.join('job_results', 'jobs.sqlite3')
+
+# Job fields stored as JSON text rather than plain strings
+_JSON_FIELDS = ('categories',)
+# Per-search metadata: keywords go to job_keywords, the rest is not stored
+_SEARCH_KEYS = ('search_keywords', 'search_location', 'search_date')
+
+
+class JobStore:
+    """
+    Every job ever scraped, in one SQLite file (WAL mode, so the daemon can
+    write while compile_jobs or the generators read). Jobs are keyed by
+    job_hash; search keywords live in their own table so one job can belong
+    to many searches. Indexed on link hash, platform, posted date, first-seen
+    time and keyword.
+    """
+
+    def __init__(self, path=JOB_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(f'''
+            CREATE TABLE IF NOT EXISTS jobs (
+                link_hash INTEGER PRIMARY KEY,
+                {", ".join(f"{field} TEXT" for field in JOB_FIELDS)},
+                extra TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_platform ON jobs (platform);
+            CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (posted);
+            CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+            CREATE TABLE IF NOT EXISTS job_keywords (
+                keyword TEXT NOT NULL,
+                link_hash INTEGER NOT NULL,
+                PRIMARY KEY (keyword, link_hash)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS job_keywords_link_hash ON job_keywords (link_hash);
+            CREATE TABLE IF NOT EXISTS compiled_files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime REAL NOT NULL,
+                content_hash INTEGER NOT NULL,
+                jobs INTEGER NOT NULL,
+                compiled_at REAL NOT NULL
+            );
+        ''')
+        self._db.commit()
+
+    def _row(self, job, now):
+        values = []
+        for field in JOB_FIELDS:
+            value = job.get(field)
+            if value is not None and field in _JSON_FIELDS:
+                value = json.dumps(value, ensure_ascii=False)
+            elif value is not None:
+                value = str(value)
+            values.append(value)
+        extra = {key: value for key, value in job.items() if key not in JOB_FIELDS and key not in _SEARCH_KEYS}
+        return (job_hash(job), *values, json.dumps(extra, ensure_ascii=False) if extra else None, now, now)
+
+    def add_jobs(self, jobs, keywords=None):
+        """
+        Bulk upsert in one transaction. Known jobs keep their first_seen and any
+        field the new copy lacks. `keywords` are recorded for every job; without
+        them each job's own 'search_keywords' are used. Returns the rows written.
+        """
+        now = time.time()
+        jobs = [job for job in jobs if job.get('title')]
+        if not jobs:
+            return 0
+        if isinstance(keywords, str):
+            keywords = [keywords]
+        # Microsecond steps keep the scraped order within one batch (queries sort newest first)
+        rows = [self._row(job, now - i * 1e-6) for i, job in enumerate(jobs)]
+        columns = ('link_hash',) + JOB_FIELDS + ('extra', 'first_seen', 'last_seen')
+        updates = ', '.join(f'{column} = COALESCE(excluded.{column}, jobs.{column})'
+                            for column in JOB_FIELDS + ('extra',))
+        keyword_rows = [
+            (keyword.strip().lower(), row[0])
+            for job, row in zip(jobs, rows)
+            for keyword in (keywords or job.get('search_keywords') or [])
+            if isinstance(keyword, str) and keyword.strip()
+        ]
+        with self._lock:
+            with self._db:
+                self._db.executemany(
+                    f'INSERT INTO jobs ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))}) '
+                    f'ON CONFLICT(link_hash) DO UPDATE SET {updates}, last_seen = excluded.last_seen',
+                    rows
+                )
+                self._db.executemany('INSERT OR IGNORE INTO job_keywords (keyword, link_hash) VALUES (?, ?)',
+                                     keyword_rows)
+        return len(rows)
+
+    def add_results(self, results, keywords=None):
+        """add_jobs for a {platform: jobs} result dict"""
+        jobs = []
+        for platform, platform_jobs in results.items():
+            for job in platform_jobs:
+                job['platform'] = platform
+                jobs.append(job)
+        return self.add_jobs(jobs, keywords)
+
+    def _job(self, row):
+        fields = dict(zip(JOB_FIELDS, row[:len(JOB_FIELDS)]))
+        for field in _JSON_FIELDS:
+            if fields[field]:
+                fields[field] = json.loads(fields[field])
+        extra = json.loads(row[len(JOB_FIELDS)]) if row[len(JOB_FIELDS)] else {}
+        keywords = row[len(JOB_FIELDS) + 1]
+        if keywords:
+            extra['search_keywords'] = keywords.split('\x1f')
+        return Job(**{key: value for key, value in fields.items() if value is not None}, **extra)
+
+    def query(self, platforms=None, keywords=None, since=None, limit=None):
+        """
+        Jobs matching every given filter, newest first: platform names, any of
+        the search keywords, and first seen at or after `since` (epoch seconds)
+        """
+        where, params = [], []
+        if platforms:
+            where.append(f'jobs.platform IN ({",".join("?" * len(platforms))})')
+            params.extend(platforms)
+        if keywords:
+            keywords = [keyword.strip().lower() for keyword in keywords]
+            where.append('jobs.link_hash IN (SELECT link_hash FROM job_keywords '
+                         f'WHERE keyword IN ({",".join("?" * len(keywords))}))')
+            params.extend(keywords)
+        if since is not None:
+            where.append('jobs.first_seen >= ?')
+            params.append(since)
+        sql = (f'SELECT {", ".join(f"jobs.{field}" for field in JOB_FIELDS)}, jobs.extra, '
+               "(SELECT group_concat(keyword, char(31)) FROM job_keywords k WHERE k.link_hash = jobs.link_hash) "
+               'FROM jobs')
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY jobs.first_seen DESC'
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [self._job(row) for row in rows]
+
+    def compiled_files(self):
+        """Manifest of imported result files: {path: {'size', 'mtime', 'content_hash', 'jobs'}}"""
+        with self._lock:
+            rows = self._db.execute('SELECT path, size, mtime, content_hash, jobs FROM compiled_files').fetchall()
+        return {
+            path: {'size': size, 'mtime': mtime, 'content_hash': content_hash, 'jobs': jobs}
+            for path, size, mtime, content_hash, jobs in rows
+        }
+
+    def mark_compiled(self, path, size, mtime, content_hash, jobs):
+        """Record that the first `size` bytes of a result file are in the store"""
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO compiled_files (path, size, mtime, content_hash, jobs, compiled_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (path, size, mtime, content_hash, jobs, time.time())
+                )
+
+    def forget_compiled(self, paths):
+        with self._lock:
+            with self._db:
+                self._db.executemany('DELETE FROM compiled_files WHERE path = ?', [(path,) for path in paths])
+
+    def count(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def stats(self):
+        """Job count per platform"""
+        with self._lock:
+            rows = self._db.execute('SELECT platform, COUNT(*) FROM jobs GROUP BY platform ORDER BY platform').fetchall()
+        return {platform or 'unknown': count for platform, count in rows}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store():
+    """Return the shared JobStore, opening it on first use"""
+    global _job_store
+    if _job_store is None:
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = JobStore()
+    return _job_store
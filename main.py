@@ -4,7 +4,23 @@ from get_jobs import *
 import sys
 import os
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import asyncio
+from parse_pipeline import ParsePipeline, active_pipeline
+from seen_jobs import get_seen_jobs
+from job_store import get_job_store
+from job_record import coerce_jobs, canonical_url, job_hash
+
+# Concurrency limits for the platform fan-out in search_all_platforms
+PLATFORM_TIMEOUT = 180      # seconds per platform unless all_jobs overrides 'timeout'
+SEARCH_DEADLINE = 420       # seconds for the whole search
+SYNC_SCRAPER_WORKERS = 4    # threads for blocking (requests/Selenium) scrapers
+
+# Only report and save jobs that no earlier run has saved; CARIKERJA_ONLY_NEW=0 keeps everything
+ONLY_NEW_JOBS = os.getenv('CARIKERJA_ONLY_NEW', '1') != '0'
+
+# Every run goes into the job store; these file exports are written alongside (json, csv, txt)
+EXPORT_FORMATS = [fmt.strip() for fmt in os.getenv('CARIKERJA_EXPORTS', 'json').lower().split(',') if fmt.strip()]
 
 def loop_input(ask_for, examples=None):
     """
@@ -31,13 +47,7 @@ def display_results(jobs, company, base_link):
     for i, job in enumerate(jobs, 1):
         print(f"{i}. {job['title']}")
         if job['link']:
-            # Handle relative and absolute URLs
-            if job['link'].startswith('http'):
-                print(f"   Link: {job['link']}")
-            elif job['link'].startswith('/'):
-                print(f"   Link: {base_link}{job['link']}")
-            else:
-                print(f"   Link: {base_link}/{job['link']}")
+            print(f"   Link: {canonical_url(job['link'], base_link)}")
         print()
 
 def save_results_to_csv(all_results, job_keys, location):
@@ -46,7 +56,7 @@ def save_results_to_csv(all_results, job_keys, location):
     for company, jobs in all_results.items():
         for job in jobs:
             job['platform'] = company
-            flat_jobs.append(job)
+            flat_jobs.append(job.to_dict())
 
     if not flat_jobs:
         print("No results to save.")
@@ -68,7 +78,7 @@ def save_results_to_json(all_results, job_keys, location):
             job['search_keywords'] = job_keys
             job['search_location'] = location
             job['search_date'] = datetime.now().isoformat()
-            flat_jobs.append(job)
+            flat_jobs.append(job.to_dict())
 
     if not flat_jobs:
         print("No results to save.")
@@ -139,29 +149,22 @@ def save_results_to_text(all_results, job_keys, location):
                     if job.get('company'):
                         f.write(f"   Company: {job['company']}\n")
                     
+                    if job.get('budget'):
+                        f.write(f"   Budget: {job['budget']}\n")
+                    
                     if job.get('skills'):
                         f.write(f"   Skills: {job['skills']}\n")
                     
-                    if job.get('headquarters'):
-                        f.write(f"   Headquarters: {job['headquarters']}\n")
-                    
-                    if job.get('descriptions'):
-                        f.write(f"   Categories: {', '.join(job['descriptions'])}\n")
+                    if job.get('categories'):
+                        f.write(f"   Categories: {', '.join(job['categories'])}\n")
                     
-                    if job.get('posted_date'):
-                        f.write(f"   Posted: {job['posted_date']}\n")
+                    if job.get('posted'):
+                        f.write(f"   Posted: {job['posted']}\n")
                     
                     if job.get('location'):
                         f.write(f"   Location: {job['location']}\n")
                     if job.get('link'):
-                        # Handle relative and absolute URLs
-                        base_link = all_jobs[company_name]['link']
-                        if job['link'].startswith('http'):
-                            f.write(f"   Link: {job['link']}\n")
-                        elif job['link'].startswith('/'):
-                            f.write(f"   Link: {base_link}{job['link']}\n")
-                        else:
-                            f.write(f"   Link: {base_link}/{job['link']}\n")
+                        f.write(f"   Link: {canonical_url(job['link'], all_jobs[company_name]['link'])}\n")
                     
                     f.write("\n")
                 
@@ -303,13 +306,18 @@ def compile_jobs_from_json(json_file_path: str = None):
         json_files = [json_file_path]
     
     all_jobs = []
+    seen_hashes = set()
     
     for json_file in json_files:
         try:
             with open(json_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                jobs = data.get('jobs', [])
-                all_jobs.extend(jobs)
+                jobs = coerce_jobs(data.get('jobs', []))
+                for job in jobs:
+                    key = job_hash(job)
+                    if key not in seen_hashes:
+                        seen_hashes.add(key)
+                        all_jobs.append(job)
                 print(f"✅ Loaded {len(jobs)} jobs from {json_file}")
         except Exception as e:
             print(f"❌ Error loading {json_file}: {e}")
@@ -326,7 +334,7 @@ def compile_jobs_from_json(json_file_path: str = None):
             "source_files": json_files,
             "platforms": list(set(job.get('platform', 'Unknown') for job in all_jobs))
         },
-        "jobs": all_jobs
+        "jobs": [job.to_dict() for job in all_jobs]
     }
     
     # Save compiled jobs
@@ -361,6 +369,131 @@ def compile_jobs_from_json(json_file_path: str = None):
 #     else:
 #         compile_jobs_from_json()
 
+async def stream_platform(company_name, company_info, job_keys, location, executor, pipeline=None, seen=None):
+    """
+    Yield one platform's jobs in batches, as each results page comes in, all
+    within the platform's timeout. Plain search pages go through the
+    fetch/parse pipeline and browser scrapers are asked for one page at a
+    time (stream_job_pages); the full scraper (with its browser fallback) only
+    runs if no search page had jobs, within what is left of the timeout.
+    Other platforms yield everything in one batch. With a SeenJobs index only
+    jobs missing from it are yielded.
+    """
+    job_func = company_info.get('async_jobs') or company_info['jobs']
+    timeout = company_info.get('timeout', PLATFORM_TIMEOUT)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    if pipeline is not None:
+        # Async scrapers parse through the same process pool (parse_off_loop)
+        active_pipeline.set(pipeline)
+    
+    paged = company_name in PAGED_SCRAPERS or (pipeline is not None and company_name in SEARCH_URLS)
+    if paged:
+        fetch = pipeline.submit if pipeline is not None else fetch_and_parse
+        pages = stream_job_pages(company_name, job_keys, location, fetch=fetch, seen=seen, executor=executor)
+        found = 0
+        had_pages = False
+        try:
+            while loop.time() < deadline:
+                try:
+                    batch = await asyncio.wait_for(pages.__anext__(), deadline - loop.time())
+                except StopAsyncIteration:
+                    break
+                # Even an all-seen page means the search page works
+                had_pages = True
+                batch = coerce_jobs(batch, company_name, company_info['link'])
+                found += len(batch)
+                if batch:
+                    yield batch
+            else:
+                print(f"{company_name.title()} pagination timed out after {timeout}s, keeping {found} jobs\n")
+        except asyncio.TimeoutError:
+            print(f"{company_name.title()} pagination timed out after {timeout}s, keeping {found} jobs\n")
+        except Exception as e:
+            print(f"Error searching {company_name}: {e}\n")
+        finally:
+            await pages.aclose()
+        if had_pages or company_name in PAGED_SCRAPERS or loop.time() >= deadline:
+            return
+    
+    if asyncio.iscoroutinefunction(job_func):
+        pending = job_func(job_keys, location)
+    else:
+        pending = loop.run_in_executor(executor, job_func, job_keys, location)
+    
+    try:
+        jobs = await asyncio.wait_for(pending, deadline - loop.time())
+    except asyncio.TimeoutError:
+        print(f"{company_name.title()} timed out after {timeout}s\n")
+        jobs = []
+    except Exception as e:
+        print(f"Error searching {company_name}: {e}\n")
+        jobs = []
+    
+    jobs = coerce_jobs(jobs, company_name, company_info['link'])
+    if seen and jobs:
+        jobs = seen.filter_new(jobs)
+    if jobs:
+        yield jobs
+
+async def scrape_platform(company_name, company_info, job_keys, location, executor, pipeline=None, seen=None):
+    """Every batch stream_platform yields for one platform, as (company_name, jobs)"""
+    jobs = []
+    async for batch in stream_platform(company_name, company_info, job_keys, location, executor, pipeline, seen):
+        jobs.extend(batch)
+    return company_name, jobs
+
+async def search_all_platforms(job_keys, location, platforms=None, deadline=SEARCH_DEADLINE,
+                               max_workers=SYNC_SCRAPER_WORKERS, use_pipeline=True,
+                               executor=None, pipeline=None, verbose=True, seen=None):
+    """
+    Search all platforms concurrently and print each one as soon as it finishes.
+    Batch runs pass in a shared executor and pipeline, which are then left open.
+    Pass a SeenJobs index as `seen` to get only jobs not found by earlier runs;
+    marking the returned jobs as seen is left to the caller, after saving.
+    """
+    platforms = platforms or all_jobs
+    results = {}
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='scraper')
+    own_pipeline = pipeline is None and use_pipeline and any(name in SEARCH_URLS for name in platforms)
+    if own_pipeline:
+        pipeline = ParsePipeline()
+    
+    if verbose:
+        print(f"Searching {', '.join(name.title() for name in platforms)}...\n")
+    tasks = [
+        asyncio.create_task(scrape_platform(company_name, company_info, job_keys, location, executor, pipeline, seen))
+        for company_name, company_info in platforms.items()
+    ]
+    
+    try:
+        for finished in asyncio.as_completed(tasks, timeout=deadline):
+            company_name, jobs = await finished
+            results[company_name] = jobs
+            
+            if not verbose:
+                continue
+            if jobs:
+                display_results(jobs, company_name, platforms[company_name]['link'])
+            else:
+                print(f"No relevant jobs found on {company_name.title()}\n")
+    except asyncio.TimeoutError:
+        unfinished = [name for name in platforms if name not in results]
+        print(f"Search deadline of {deadline}s reached, giving up on: {', '.join(unfinished)}\n")
+        for task in tasks:
+            task.cancel()
+    finally:
+        # Blocking scrapers cannot be interrupted; let stragglers finish in the background
+        if own_executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if own_pipeline:
+            await pipeline.close()
+    
+    # Keep the all_jobs ordering for the exporters
+    return {company_name: results.get(company_name, []) for company_name in platforms}
+
 async def main():
     """Main function to run the freelance job scraper"""
     print("=== Freelance Job Scraper ===")
@@ -379,45 +512,31 @@ async def main():
     print(f"Searching for '{', '.join(job_keys)}' jobs" + (f" in {location}" if location else " globally"))
     print("This may take a moment...\n")
     
-    total_jobs_found = 0
-    all_results = {}
-    
-    for company_name, company_info in all_jobs.items():
-        print(f"Searching {company_name.title()}...")
-        
-        try:
-            # Check if the function is async and handle it
-            job_func = company_info['jobs']
-            if asyncio.iscoroutinefunction(job_func):
-                jobs = await job_func(job_keys, location)
-            else:
-                jobs = job_func(job_keys, location)
-
-            all_results[company_name] = jobs
-            
-            if jobs:
-                display_results(jobs, company_name, company_info['link'])
-                total_jobs_found += len(jobs)
-            else:
-                print(f"No relevant jobs found on {company_name.title()}\n")
-                
-        except Exception as e:
-            print(f"Error searching {company_name}: {e}\n")
-            all_results[company_name] = []
-        
-        time.sleep(2)
+    try:
+        all_results = await search_all_platforms(job_keys, location, seen=get_seen_jobs() if ONLY_NEW_JOBS else None)
+    finally:
+        await close_browser_pools()
+        await close_aiohttp_session()
+        selenium_pool.close()
+    total_jobs_found = sum(len(jobs) for jobs in all_results.values())
     
     print(f"=== Search Complete ===")
     print(f"Total jobs found: {total_jobs_found}")
     
     if total_jobs_found > 0:
         try:
-            # Save to multiple formats
-            csv_file = save_results_to_csv(all_results, job_keys, location)
-            json_file = save_results_to_json(all_results, job_keys, location)
-            txt_file = save_results_to_text(all_results, job_keys, location)
+            store = get_job_store()
+            stored = store.add_results(all_results, job_keys)
+            
+            csv_file = save_results_to_csv(all_results, job_keys, location) if 'csv' in EXPORT_FORMATS else None
+            json_file = save_results_to_json(all_results, job_keys, location) if 'json' in EXPORT_FORMATS else None
+            txt_file = save_results_to_text(all_results, job_keys, location) if 'txt' in EXPORT_FORMATS else None
+            # Only once everything is written, so a failed export is retried next run
+            get_seen_jobs().mark_results(all_results)
             
-            print(f"\nResults exported to:")
+            print(f"\nStored {stored} jobs in {store.path}")
+            if csv_file or json_file or txt_file:
+                print(f"Results exported to:")
             if csv_file: print(f"  CSV: {csv_file}")
             if json_file: print(f"  JSON: {json_file}")
             if txt_file: print(f"  Text: {txt_file}")
@@ -0,0 +1,205 @@
+import re
+import numpy as np
+
+NUM_PERM = 128         # MinHash permutations per signature
+LSH_BANDS = 16         # 16 bands of 8 rows: pairs above ~0.7 Jaccard almost always share a bucket
+SIMILARITY_THRESHOLD = 0.7
+SHINGLE_SIZE = 5       # characters per shingle; job titles are too short for word shingles
+MIN_TEXT_LENGTH = 20   # shorter texts look alike by chance and are never folded
+
+_SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)    # odd 64-bit constant for multiply-shift hashing
+_SHIFT = np.uint64(32)
+
+
+def job_text(job):
+    """The text two postings of the same gig share: title, company and description"""
+    parts = (job.get('title'), job.get('company'), job.get('description'))
+    text = ' '.join(str(part) for part in parts if part).lower()
+    return re.sub(r'[^a-z0-9]+', ' ', text).strip()
+
+
+def _field_key(value):
+    return re.sub(r'[^a-z0-9]+', ' ', str(value).lower()).strip() if value else ''
+
+
+def is_indexable(job):
+    """
+    Whether a job carries enough to be matched: a description, or at least a
+    company next to the title. Title-only cards ("Python Developer") would
+    match every other card with that title.
+    """
+    return bool(job.get('description') or job.get('company')) and len(job_text(job)) >= MIN_TEXT_LENGTH
+
+
+def is_cross_post(a, b):
+    """
+    Whether two similar postings can be one gig posted twice: they come from
+    different platforms, and company and location do not disagree where both
+    postings have them. Without a description on both sides the title is all
+    the text there is, so the company must be present and the same; that
+    keeps same-titled roles of different employers apart. Same-titled roles
+    of one company in two cities stay apart through the location.
+    """
+    if a.get('platform') == b.get('platform'):
+        return False
+    for field in ('company', 'location'):
+        left, right = _field_key(a.get(field)), _field_key(b.get(field))
+        if left and right and left != right:
+            return False
+    if a.get('description') and b.get('description'):
+        return True
+    company = _field_key(a.get('company'))
+    return bool(company) and company == _field_key(b.get('company'))
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """
+    Distinct 32-bit hashes of the text's character shingles. job_text leaves
+    only ASCII, so each shingle packs into one integer and the whole text is
+    hashed in a few numpy operations.
+    """
+    data = np.frombuffer(text.encode('ascii'), dtype=np.uint8).astype(np.uint64)
+    if not len(data):
+        return data
+    size = min(size, len(data))
+    windows = np.zeros(len(data) - size + 1, dtype=np.uint64)
+    for offset in range(size):
+        windows |= data[offset:len(data) - size + 1 + offset] << np.uint64(8 * offset)
+    return np.unique((windows * _SHINGLE_MULTIPLIER) >> _SHIFT)
+
+
+class MinHasher:
+    """
+    MinHash signatures from NUM_PERM multiply-shift hash functions
+    (a * x + b) >> 32 over uint64 (wrapping), evaluated for all shingles
+    of a job at once.
+    """
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_hashes):
+        if not len(shingle_hashes):
+            return None
+        hashed = (shingle_hashes[:, None] * self._a + self._b) >> _SHIFT
+        return hashed.min(axis=0).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures. Each signature is cut into `bands`
+    bands; jobs that share any band bucket become candidates, and only
+    candidates are compared, so clustering stays near-linear in the number
+    of jobs instead of comparing every pair.
+    """
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD, num_perm=NUM_PERM, bands=LSH_BANDS):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm)
+        self.jobs = []
+        self._signatures = []
+        self._buckets = [{} for _ in range(bands)]
+
+    def add(self, job):
+        """
+        Index a job; returns its position. Jobs that fail is_indexable are
+        kept but never grouped.
+        """
+        position = len(self.jobs)
+        signature = None
+        if is_indexable(job):
+            signature = self.hasher.signature(shingles(job_text(job)))
+        self.jobs.append(job)
+        self._signatures.append(signature)
+        if signature is not None:
+            for band, buckets in enumerate(self._buckets):
+                key = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+                buckets.setdefault(key, []).append(position)
+        return position
+
+    def similarity(self, i, j):
+        """Estimated Jaccard similarity of two indexed jobs"""
+        a, b = self._signatures[i], self._signatures[j]
+        if a is None or b is None:
+            return 0.0
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    def candidate_pairs(self):
+        pairs = set()
+        for buckets in self._buckets:
+            for positions in buckets.values():
+                for n, i in enumerate(positions):
+                    for j in positions[n + 1:]:
+                        pairs.add((i, j))
+        return pairs
+
+    def clusters(self):
+        """
+        Groups of near-duplicate jobs as [{'representative': job, 'members': [jobs]}],
+        one entry per group of two or more, in first-seen order. Only
+        cross-posts (is_cross_post) are grouped, and a group never holds two
+        jobs from one platform.
+        """
+        parent = list(range(len(self.jobs)))
+        platforms = [{job.get('platform')} for job in self.jobs]
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, j in sorted(self.candidate_pairs()):
+            if self.similarity(i, j) < self.threshold or not is_cross_post(self.jobs[i], self.jobs[j]):
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j or platforms[root_i] & platforms[root_j]:
+                continue
+            root, child = min(root_i, root_j), max(root_i, root_j)
+            parent[child] = root
+            platforms[root] |= platforms[child]
+
+        groups = {}
+        for position in range(len(self.jobs)):
+            groups.setdefault(find(position), []).append(position)
+        return [
+            {'representative': self.jobs[pick_representative(self.jobs, positions)],
+             'members': [self.jobs[position] for position in positions]}
+            for root, positions in sorted(groups.items()) if len(positions) > 1
+        ]
+
+
+def pick_representative(jobs, positions):
+    """The most complete posting of a group; the earliest one on ties"""
+    return max(positions, key=lambda position: (sum(1 for _ in jobs[position].keys()), -position))
+
+
+def find_near_duplicates(jobs, threshold=SIMILARITY_THRESHOLD):
+    """Near-duplicate clusters among jobs (see NearDuplicateIndex.clusters)"""
+    index = NearDuplicateIndex(threshold)
+    for job in jobs:
+        index.add(job)
+    return index.clusters()
+
+
+def collapse_near_duplicates(jobs, threshold=SIMILARITY_THRESHOLD):
+    """
+    Keep one job per near-duplicate cluster. The kept representative lists
+    the links of the postings folded into it under 'near_duplicates'.
+    Returns (kept_jobs, clusters).
+    """
+    clusters = find_near_duplicates(jobs, threshold)
+    dropped = set()
+    for cluster in clusters:
+        representative = cluster['representative']
+        others = [job for job in cluster['members'] if job is not representative]
+        representative['near_duplicates'] = [job.get('link') or job.get('title') for job in others]
+        dropped.update(id(job) for job in others)
+    return [job for job in jobs if id(job) not in dropped], clusters
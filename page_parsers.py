@@ -0,0 +1,292 @@
+from css_selectors import select, select_one
+from html_parsing import make_soup
+from job_record import Job
+from selector_cascade import SelectorCascade
+
+# Page parsers only: no browsers, HTTP sessions or pools, so parse worker
+# processes can import this without pulling in the scrapers (get_jobs).
+
+# Fallback selectors learn their try order from hits; get_jobs saves the
+# counts at exit, parse workers hand theirs to the parent (take_pending)
+selector_cascade = SelectorCascade()
+
+# Fallback selectors per field, tried through selector_cascade so the one that
+# keeps matching moves to the front. 'card' selectors also drive make_soup's
+# strainer, so keep them to simple tag/.class/[attr] forms
+UPWORK_SELECTORS = {
+    'card': [
+        'article[data-test="JobTile"]',
+        'div[data-test="JobTile"]',
+        '.job-tile',
+        'section[data-test="job-tile"]'
+    ],
+    'title': [
+        'h2[data-test="job-title"] a',
+        'h3[data-test="job-title"] a',
+        'h2 a[data-test="UpLink"]',
+        'h3 a[data-test="UpLink"]',
+        '.job-tile-title a',
+        'a[data-test="UpLink"]'
+    ],
+    'budget': [
+        '[data-test="job-type-label"]',
+        '.job-tile-info-list span',
+        '.job-type',
+        '.budget'
+    ],
+    'client': [
+        '[data-test="client-name"]',
+        '.client-name',
+        '.up-n-link'
+    ],
+    'description': [
+        '[data-test="job-description"]',
+        '[data-test="UpCLineClamp JobDescription"] p',
+        '.job-description'
+    ]
+}
+selector_cascade.register('upwork', UPWORK_SELECTORS)
+
+def parse_upwork_jobs(html_content, features='lxml'):
+    """Parse Upwork job tiles from a search results page"""
+    soup = make_soup(html_content, UPWORK_SELECTORS['card'], features)
+    jobs = []
+    
+    job_elements = selector_cascade.select('upwork', 'card', soup)
+    
+    for job in job_elements:
+        try:
+            title_elem = selector_cascade.select_one('upwork', 'title', job)
+    
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = title_elem.get('href', '')
+    
+                budget_elem = selector_cascade.select_one('upwork', 'budget', job)
+                budget = budget_elem.get_text(strip=True) if budget_elem else 'Budget not specified'
+    
+                client_elem = selector_cascade.select_one('upwork', 'client', job)
+                client = client_elem.get_text(strip=True) if client_elem else 'Client not specified'
+    
+                desc_elem = selector_cascade.select_one('upwork', 'description', job)
+                description = desc_elem.get_text(' ', strip=True) if desc_elem else 'No description'
+    
+                jobs.append(Job.coerce({
+                    'title': title,
+                    'link': f"https://www.upwork.com{link}" if link.startswith('/') else link,
+                    'budget': budget,
+                    'client': client,
+                    'description': description
+                }, 'upwork'))
+        except Exception as e:
+            print(f"Error parsing individual job: {e}")
+            continue
+    
+    return jobs
+
+
+FREELANCER_SELECTORS = {
+    'card': [
+        '.JobSearchCard-item',
+        '.ProjectCard',
+        'div[data-project-id]',
+        '.project-card',
+        'article.JobSearchCard-item'
+    ],
+    'title': [
+        '.JobSearchCard-primary-heading a',
+        'h3.project-title a',
+        'h2 a', 'h3 a',
+        '.project-title',
+        'a[data-project-title]'
+    ],
+    'budget': [
+        '.JobSearchCard-secondary-price',
+        '.project-budget',
+        '.budget'
+    ],
+    'description': [
+        '.JobSearchCard-primary-description',
+        '.project-description',
+        'p.description'
+    ]
+}
+selector_cascade.register('freelancer', FREELANCER_SELECTORS)
+
+def parse_freelancer_jobs(html_content, base_url='https://www.freelancer.com', features='lxml'):
+    """Parse Freelancer project cards from a search results page"""
+    soup = make_soup(html_content, FREELANCER_SELECTORS['card'], features)
+    jobs = []
+    
+    job_elements = selector_cascade.select('freelancer', 'card', soup)
+    
+    for job in job_elements:
+        try:
+            title_elem = selector_cascade.select_one('freelancer', 'title', job)
+    
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = title_elem.get('href', '')
+    
+                budget_elem = selector_cascade.select_one('freelancer', 'budget', job)
+                budget = budget_elem.get_text(strip=True) if budget_elem else 'Budget not specified'
+    
+                desc_elem = selector_cascade.select_one('freelancer', 'description', job)
+                description = desc_elem.get_text(' ', strip=True) if desc_elem else 'No description'
+    
+                jobs.append(Job.coerce({
+                    'title': title,
+                    'link': f"{base_url}{link}" if link.startswith('/') else link,
+                    'budget': budget,
+                    'description': description
+                }, 'freelancer'))
+        except Exception as e:
+            continue
+    
+    return jobs
+
+
+TIMESJOBS_CARD_SELECTORS = ['li.job-bx']
+
+def parse_timesjobs_jobs(html_content, features='lxml'):
+    """Parse recently posted TimesJobs listings from a search results page"""
+    soup = make_soup(html_content, TIMESJOBS_CARD_SELECTORS, features)
+    jobs = []
+    
+    job_elements = soup.find_all('li', class_='clearfix job-bx wht-shd-bx')
+    
+    for job in job_elements:
+        try:
+            published_date_element = job.find('span', class_='sim-posted')
+            if published_date_element and published_date_element.span:
+                published_date = published_date_element.span.text
+                # Focus on recently posted jobs
+                if 'few' in published_date.lower() or 'today' in published_date.lower():
+                    company_name_elem = job.find('h3', class_='joblist-comp-name')
+                    company_name = company_name_elem.text.replace(' ', '').strip() if company_name_elem else 'N/A'
+    
+                    skills_element = job.find('span', class_='srp-skills')
+                    skills = skills_element.text.replace(' ', '').strip() if skills_element else 'Skills not specified'
+    
+                    title_elem = job.header.h2.a if job.header and job.header.h2 and job.header.h2.a else None
+                    title = title_elem.text.strip() if title_elem else 'Job Title Not Found'
+                    link = title_elem['href'] if title_elem and title_elem.get('href') else ''
+    
+                    jobs.append(Job.coerce({
+                        'title': title,
+                        'company': company_name,
+                        'skills': skills,
+                        'link': link,
+                        'posted': published_date
+                    }, 'timesjobs'))
+        except Exception as e:
+            continue  # Skip problematic job entries
+    
+    return jobs
+
+
+REMOTE_CO_SELECTORS = {
+    'card': ['.job_listing', '.job-listing-item'],
+    'title': ['h3 a', 'h2 a', '.job-title a'],
+    'company': ['.company_name', '.company-name']
+}
+selector_cascade.register('remote', REMOTE_CO_SELECTORS)
+
+def parse_remote_co_jobs(html_content, features='lxml'):
+    """Parse Remote.co listings from a search results page"""
+    soup = make_soup(html_content, REMOTE_CO_SELECTORS['card'], features)
+    jobs = []
+    
+    job_elements = select(soup, ', '.join(REMOTE_CO_SELECTORS['card']))
+    for job in job_elements:
+        try:
+            title_elem = selector_cascade.select_one('remote', 'title', job)
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                link = title_elem.get('href', '')
+    
+                company_elem = selector_cascade.select_one('remote', 'company', job)
+                company = company_elem.get_text(strip=True) if company_elem else 'Company not specified'
+    
+                jobs.append(Job.coerce({
+                    'title': title,
+                    'link': f"https://remote.co{link}" if link.startswith('/') else link,
+                    'company': company
+                }, 'remote'))
+        except Exception as e:
+            continue
+    
+    return jobs
+
+
+WEWORKREMOTELY_CARD_SELECTORS = ['li']
+
+def parse_weworkremotely_jobs(html_content, features='lxml'):
+    """Parse We Work Remotely listings from a search results page"""
+    jobs = []
+    soup = make_soup(html_content, WEWORKREMOTELY_CARD_SELECTORS, features)
+    # Look for job listings in both 'li' with classes 'feature' and regular ones
+    for job_item in select(soup, 'li.feature, li:not(.feature)'):
+        # Skip if it's a view-all or non-job item
+        if job_item.find('a', class_='view-all'):
+            continue
+    
+        link = job_item.find('a', href=True)
+        title_span = job_item.find('span', class_='title')
+        company_span = job_item.find('span', class_='company')
+    
+        if link and title_span and company_span:
+            job_url = f"https://weworkremotely.com{link['href']}"
+            jobs.append(Job.coerce({
+                'title': title_span.get_text(strip=True),
+                'company': company_span.get_text(strip=True),
+                'link': job_url
+            }, 'weworkremotely'))
+    
+    return jobs
+
+
+REMOTEOK_CARD_SELECTORS = ['tr.job']
+
+def parse_remoteok_jobs(html_content, features='lxml'):
+    """Parse Remote OK job rows from a listing page"""
+    soup = make_soup(html_content, REMOTEOK_CARD_SELECTORS, features)
+    jobs = []
+    
+    job_elements = select(soup, ', '.join(REMOTEOK_CARD_SELECTORS))
+    
+    for job in job_elements:
+        try:
+            title_elem = select_one(job, 'h2')
+            company_elem = select_one(job, '.company h3')
+            location_elem = select_one(job, '.location')
+    
+            if title_elem:
+                title = title_elem.get_text(strip=True)
+                company = company_elem.get_text(strip=True) if company_elem else 'Company not specified'
+                job_location = location_elem.get_text(strip=True) if location_elem else 'Remote'
+    
+                link_elem = select_one(job, 'a')
+                link = f"https://remoteok.io{link_elem.get('href')}" if link_elem else ''
+    
+                jobs.append(Job.coerce({
+                    'title': title,
+                    'company': company,
+                    'location': job_location,
+                    'link': link
+                }, 'remoteok'))
+        except Exception as e:
+            continue
+    
+    return jobs
+
+
+# Page parsers by platform, used for fixture replay and parser benchmarks
+PAGE_PARSERS = {
+    'freelancer': parse_freelancer_jobs,
+    'upwork': parse_upwork_jobs,
+    'timesjobs': parse_timesjobs_jobs,
+    'remote': parse_remote_co_jobs,
+    'weworkremotely': parse_weworkremotely_jobs,
+    'remoteok': parse_remoteok_jobs
+}
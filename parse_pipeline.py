@@ -0,0 +1,212 @@
+import asyncio
+import contextvars
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 1)   # leave a core for the event loop and fetch threads
+FETCH_WORKERS = 8
+PARSE_QUEUE_SIZE = 16    # raw pages waiting for a parser; with PARSE_WORKERS, caps pages in flight
+
+
+def _init_parse_worker():
+    """
+    Import the parsers once per worker process instead of on the first page.
+    Only page_parsers: the scrapers' browsers, pools and atexit hooks stay in
+    the parent.
+    """
+    import page_parsers  # noqa: F401
+
+
+def parse_page(platform, html_content):
+    """
+    Parse one raw page in a worker process. Returns (jobs, selector hits):
+    workers never write the selector stats file themselves, the parent adds
+    their hits to its own cascade and saves once.
+    """
+    from page_parsers import PAGE_PARSERS, selector_cascade
+    jobs = PAGE_PARSERS[platform](html_content)
+    return jobs, selector_cascade.take_pending()
+
+
+# Pipeline of the search running in this task, set by the orchestrator (see parse_off_loop)
+active_pipeline = contextvars.ContextVar('active_pipeline', default=None)
+
+
+async def parse_off_loop(platform, html_content):
+    """
+    Parse a raw page without blocking the event loop: in the active
+    pipeline's process pool when a search has one, else in a thread.
+    Returns the page's jobs ([] if parsing failed).
+    """
+    pipeline = active_pipeline.get()
+    if pipeline is not None:
+        return await pipeline.parse(platform, html_content) or []
+    from page_parsers import PAGE_PARSERS
+    return await asyncio.to_thread(PAGE_PARSERS[platform], html_content)
+
+
+async def fetch_page(url, platform):
+    from get_jobs import make_request_async, platform_headers
+    return await make_request_async(url, retries=1, headers=platform_headers(platform), timeout=15,
+                                    platform=platform)
+
+
+class ParsePipeline:
+    """
+    Fetch and parse as separate stages: fetchers (coroutines on the shared
+    aiohttp session, or blocking callables run in threads) push raw HTML onto
+    a bounded queue and parse tasks hand each page to a process pool, so
+    network waits and BeautifulSoup CPU work overlap across all cores.
+
+    Backpressure covers fetching too: a fetch only starts once it holds one
+    of queue_size + parse_workers slots, released when its page is parsed,
+    so at most that many pages are in flight or held in memory however many
+    are submitted. submit() itself never blocks; extra pages wait for a slot.
+
+    submit() returns a future that resolves to the page's job list, or None
+    if the page could not be fetched or parsed.
+    """
+
+    def __init__(self, fetch=fetch_page, parse_workers=PARSE_WORKERS, fetch_workers=FETCH_WORKERS,
+                 queue_size=PARSE_QUEUE_SIZE):
+        self.fetch = fetch
+        self.parse_workers = parse_workers
+        self.fetch_workers = fetch_workers
+        self.queue_size = queue_size
+        self._queue = None
+        self._slots = None
+        self._fetch_pool = None
+        self._parse_pool = None
+        self._fetch_tasks = set()     # in flight only; each task drops itself when done
+        self._parse_tasks = []
+        self._stats = {
+            'submitted': 0,
+            'fetched': 0,
+            'fetch_failed': 0,
+            'parsed': 0,
+            'parse_failed': 0,
+            'fetch_seconds': 0.0,
+            'parse_seconds': 0.0,
+            'backpressure_seconds': 0.0
+        }
+
+    def start(self):
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._slots = asyncio.Semaphore(self.queue_size + self.parse_workers)
+        self._fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='fetch')
+        self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers, initializer=_init_parse_worker)
+        self._parse_tasks = [asyncio.create_task(self._parse_loop()) for _ in range(self.parse_workers)]
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def submit(self, platform, url):
+        """Queue a page for fetching and parsing; returns a future with its jobs"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._stats['submitted'] += 1
+        task = asyncio.create_task(self._fetch(platform, url, future))
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+        return future
+
+    def parse(self, platform, html_content, url=None):
+        """Queue an already fetched page for parsing; returns a future with its jobs"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._stats['submitted'] += 1
+        self._stats['fetched'] += 1
+        task = asyncio.create_task(self._hand_over(platform, url or platform, html_content, future))
+        self._fetch_tasks.add(task)
+        task.add_done_callback(self._fetch_tasks.discard)
+        return future
+
+    async def _take_slot(self):
+        """Wait for one of the in-flight page slots (released once the page is parsed)"""
+        started = time.time()
+        await self._slots.acquire()
+        self._stats['backpressure_seconds'] += time.time() - started
+
+    async def _hand_over(self, platform, url, html_content, future):
+        await self._take_slot()
+        await self._queue.put((platform, url, html_content, future))
+
+    async def _fetch(self, platform, url, future):
+        loop = asyncio.get_running_loop()
+        await self._take_slot()
+        queued = False
+        try:
+            started = time.time()
+            try:
+                if asyncio.iscoroutinefunction(self.fetch):
+                    html_content = await self.fetch(url, platform)
+                else:
+                    html_content = await loop.run_in_executor(self._fetch_pool, self.fetch, url, platform)
+            except Exception as e:
+                print(f"Pipeline fetch failed for {url}: {e}")
+                html_content = None
+            self._stats['fetch_seconds'] += time.time() - started
+
+            if not html_content:
+                self._stats['fetch_failed'] += 1
+                if not future.done():
+                    future.set_result(None)
+                return
+            self._stats['fetched'] += 1
+            await self._queue.put((platform, url, html_content, future))
+            queued = True
+        finally:
+            if not queued:
+                self._slots.release()
+
+    async def _parse_loop(self):
+        from page_parsers import selector_cascade
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                break
+            platform, url, html_content, future = item
+            started = time.time()
+            try:
+                jobs, hits = await loop.run_in_executor(self._parse_pool, parse_page, platform, html_content)
+                selector_cascade.add_hits(hits)
+                self._stats['parsed'] += 1
+            except Exception as e:
+                print(f"Pipeline parse failed for {url}: {e}")
+                self._stats['parse_failed'] += 1
+                jobs = None
+            self._stats['parse_seconds'] += time.time() - started
+            self._slots.release()
+            if not future.done():
+                future.set_result(jobs)
+
+    async def close(self):
+        """Finish queued pages, then stop the parse tasks and both pools"""
+        if self._queue is None:
+            return
+        await asyncio.gather(*list(self._fetch_tasks), return_exceptions=True)
+        for _ in self._parse_tasks:
+            await self._queue.put(None)
+        await asyncio.gather(*self._parse_tasks, return_exceptions=True)
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self._parse_pool.shutdown(wait=True, cancel_futures=True)
+        self._queue = None
+        self._slots = None
+        self._fetch_tasks = set()
+        self._parse_tasks = []
+
+    def stats(self):
+        return {
+            'parse_workers': self.parse_workers,
+            'fetch_workers': self.fetch_workers,
+            'queued': self._queue.qsize() if self._queue else 0,
+            **{key: round(value, 3) if isinstance(value, float) else value for key, value in self._stats.items()}
+        }
@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+DEFAULT_RATE = 1.0     # sustained requests per second per host
+DEFAULT_BURST = 3      # requests allowed back to back after an idle spell
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations: a caller takes a token now and
+    is told how long to wait before using it, so concurrent callers queue up
+    at exactly `rate` per second and the limit is never exceeded.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.waited = 0.0
+
+    def reserve(self):
+        """Take a token; returns the seconds to wait before the request may go out"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.requests += 1
+            self.waited += delay
+            return delay
+
+
+def host_key(url):
+    """Bucket key for a URL: its host without a leading 'www.'"""
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class RateLimiter:
+    """
+    Per-host token buckets shared by every fetch path (requests, aiohttp,
+    Selenium and pyppeteer). Subdomains share their parent's bucket when the
+    parent is configured, so api.example.com and example.com count together.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.default_rate = rate
+        self.default_burst = burst
+        self._limits = {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate=None, burst=None):
+        """Set the limit for a host (or a URL's host); replaces its bucket"""
+        key = host_key(host) if '://' in host else host_key(f'http://{host}')
+        with self._lock:
+            self._limits[key] = (rate or self.default_rate, burst or self.default_burst)
+            self._buckets.pop(key, None)
+
+    def _bucket_key(self, host):
+        parts = host.split('.')
+        for i in range(len(parts) - 1):
+            candidate = '.'.join(parts[i:])
+            if candidate in self._limits:
+                return candidate
+        return host
+
+    def bucket(self, url):
+        host = host_key(url)
+        with self._lock:
+            key = self._bucket_key(host)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self._limits.get(key, (self.default_rate, self.default_burst))
+                bucket = self._buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def wait(self, url):
+        """Block until a request to url is allowed; returns the seconds waited"""
+        delay = self.bucket(url).reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url):
+        """Coroutine version of wait() for aiohttp and pyppeteer"""
+        delay = self.bucket(url).reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def stats(self):
+        """Requests and total wait per host bucket"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            key: {
+                'rate': bucket.rate,
+                'burst': bucket.burst,
+                'requests': bucket.requests,
+                'waited': round(bucket.waited, 3)
+            }
+            for key, bucket in buckets.items()
+        }
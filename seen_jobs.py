@@ -0,0 +1,125 @@
+import os
+import sqlite3
+import threading
+import time
+from job_record import job_hash
+
+SEEN_JOBS_PATH = os.path.join('job_results', 'seen_jobs.sqlite3')
+
+
+class SeenJobs:
+    """
+    Persistent index of every job already emitted, so repeated searches can
+    stop paginating at known jobs and only pass the delta downstream. Jobs
+    are keyed by job_hash, the 64-bit hash of their canonical link.
+    """
+
+    def __init__(self, path=SEEN_JOBS_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                link_hash INTEGER PRIMARY KEY,
+                platform TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        ''')
+        self._db.commit()
+
+    def seen_keys(self, keys):
+        """The subset of job hashes already in the index"""
+        keys = list(set(keys))
+        found = set()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    f'SELECT link_hash FROM seen_jobs WHERE link_hash IN ({",".join("?" * len(chunk))})', chunk
+                ).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def is_seen(self, job):
+        return bool(self.seen_keys([job_hash(job)]))
+
+    def filter_new(self, jobs):
+        """Jobs not in the index, in their original order"""
+        hashes = [job_hash(job) for job in jobs]
+        seen = self.seen_keys(hashes)
+        return [job for job, key in zip(jobs, hashes) if key not in seen]
+
+    def mark_seen(self, jobs, platform=None):
+        """Add jobs to the index (call once they have been saved)"""
+        now = time.time()
+        rows = [(job_hash(job), platform or job.get('platform'), now, now) for job in jobs]
+        with self._lock:
+            self._db.executemany(
+                'INSERT INTO seen_jobs (link_hash, platform, first_seen, last_seen) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT(link_hash) DO UPDATE SET last_seen = excluded.last_seen',
+                rows
+            )
+            self._db.commit()
+        return len(rows)
+
+    def claim(self, jobs, platform=None):
+        """
+        Add jobs to the index and return only those that were not in it yet,
+        in their original order. Insert-or-ignore makes check and mark one
+        step, so concurrent searches finding the same job emit it once.
+        """
+        now = time.time()
+        claimed = []
+        with self._lock:
+            for job in jobs:
+                cursor = self._db.execute(
+                    'INSERT OR IGNORE INTO seen_jobs (link_hash, platform, first_seen, last_seen) VALUES (?, ?, ?, ?)',
+                    (job_hash(job), platform or job.get('platform'), now, now)
+                )
+                if cursor.rowcount:
+                    claimed.append(job)
+            self._db.commit()
+        return claimed
+
+    def forget(self, jobs):
+        """Drop jobs from the index, e.g. a claim whose jobs could not be written"""
+        keys = [(job_hash(job),) for job in jobs]
+        with self._lock:
+            self._db.executemany('DELETE FROM seen_jobs WHERE link_hash = ?', keys)
+            self._db.commit()
+        return len(keys)
+
+    def mark_results(self, results):
+        """mark_seen for a {platform: jobs} result dict"""
+        return sum(self.mark_seen(jobs, platform) for platform, jobs in results.items())
+
+    def forget_older_than(self, days):
+        """Drop entries not seen for `days` days so relisted jobs surface again"""
+        cutoff = time.time() - days * 86400
+        with self._lock:
+            deleted = self._db.execute('DELETE FROM seen_jobs WHERE last_seen < ?', (cutoff,)).rowcount
+            self._db.commit()
+        return deleted
+
+    def stats(self):
+        with self._lock:
+            rows = self._db.execute('SELECT platform, COUNT(*) FROM seen_jobs GROUP BY platform').fetchall()
+        return {platform or 'unknown': count for platform, count in rows}
+
+
+_seen_jobs = None
+_seen_jobs_lock = threading.Lock()
+
+
+def get_seen_jobs():
+    """Return the shared SeenJobs index, opening it on first use"""
+    global _seen_jobs
+    if _seen_jobs is None:
+        with _seen_jobs_lock:
+            if _seen_jobs is None:
+                _seen_jobs = SeenJobs()
+    return _seen_jobs
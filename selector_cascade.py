@@ -0,0 +1,186 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from css_selectors import select, select_one
+try:
+    import fcntl
+except ImportError:     # Windows
+    fcntl = None
+    import msvcrt
+
+STATS_PATH = '.selector_stats.json'
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive lock on `path`.lock, held across processes"""
+    with open(f"{path}.lock", 'a+b') as f:
+        if fcntl:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SelectorCascade:
+    """
+    Declarative "try selector A, then B, then C" lookups. Field specs map
+    platform -> field -> fallback selectors; every successful lookup is
+    counted and the selector with the most hits is tried first next time,
+    so parsing converges on one lookup per field. Hit counts persist
+    between runs in a JSON file.
+    """
+
+    def __init__(self, specs=None, path=STATS_PATH):
+        self.specs = {platform: dict(fields) for platform, fields in (specs or {}).items()}
+        self.path = path
+        self._lock = threading.Lock()
+        self._hits = {}       # (platform, field) -> {selector: hits}, loaded + this process
+        self._pending = {}    # hits not yet written to disk
+        self._orders = {}     # (platform, field) -> selectors in current try order
+        self._misses = {}     # (platform, field) -> lookups where no selector matched
+        self.load()
+
+    def register(self, platform, fields):
+        """Add or replace the field specs for a platform"""
+        with self._lock:
+            self.specs[platform] = dict(fields)
+            for field in fields:
+                self._orders.pop((platform, field), None)
+
+    def selectors(self, platform, field):
+        """Selectors for a field, most successful first (ties keep spec order)"""
+        key = (platform, field)
+        order = self._orders.get(key)
+        if order is None:
+            declared = self.specs[platform][field]
+            hits = self._hits.get(key, {})
+            order = sorted(declared, key=lambda selector: -hits.get(selector, 0))
+            self._orders[key] = order
+        return order
+
+    def _record_hit(self, platform, field, selector, count=1):
+        key = (platform, field)
+        with self._lock:
+            hits = self._hits.setdefault(key, {})
+            hits[selector] = hits.get(selector, 0) + count
+            pending = self._pending.setdefault(key, {})
+            pending[selector] = pending.get(selector, 0) + count
+            order = self._orders.get(key)
+            # Promote the selector once it overtakes the one currently tried first
+            if order and order[0] != selector and hits[selector] > hits.get(order[0], 0):
+                self._orders.pop(key, None)
+
+    def take_pending(self):
+        """
+        Hand over the hits not yet saved, as [(platform, field, selector, count)],
+        and forget them here. Parse workers send these back to the parent
+        process, which is the only one that saves.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return [(platform, field, selector, count)
+                for (platform, field), hits in pending.items() for selector, count in hits.items()]
+
+    def add_hits(self, hits):
+        """Count hits recorded elsewhere (see take_pending) as if they happened here"""
+        for platform, field, selector, count in hits:
+            self._record_hit(platform, field, selector, count)
+
+    def first(self, platform, field, lookup):
+        """
+        Run lookup(selector) over the field's selectors and return the first
+        truthy result, or None. lookup should return None/empty on a miss.
+        """
+        for selector in self.selectors(platform, field):
+            try:
+                result = lookup(selector)
+            except Exception:
+                result = None
+            if result:
+                self._record_hit(platform, field, selector)
+                return result
+        with self._lock:
+            key = (platform, field)
+            self._misses[key] = self._misses.get(key, 0) + 1
+        return None
+
+    def select_one(self, platform, field, element):
+        """BeautifulSoup select_one through the cascade, with compiled selectors"""
+        return self.first(platform, field, lambda selector: select_one(element, selector))
+
+    def select(self, platform, field, element):
+        """BeautifulSoup select through the cascade; [] when nothing matches"""
+        return self.first(platform, field, lambda selector: select(element, selector)) or []
+
+    def load(self):
+        """Read persisted hit counts; a missing or unreadable file means no history"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            for platform, fields in data.items():
+                for field, hits in fields.items():
+                    merged = self._hits.setdefault((platform, field), {})
+                    for selector, count in hits.items():
+                        merged[selector] = max(merged.get(selector, 0), count)
+            self._orders = {}
+
+    def save(self):
+        """
+        Add this process's new hits to whatever is on disk now and write it
+        back. The read-merge-write runs under a lock file, so scraper processes
+        saving at the same time (a search next to the daemon) don't drop each
+        other's counts.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with _file_lock(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+
+            for (platform, field), hits in pending.items():
+                stored = data.setdefault(platform, {}).setdefault(field, {})
+                for selector, count in hits.items():
+                    stored[selector] = stored.get(selector, 0) + count
+
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def stats(self):
+        """Per field: try order, hit counts and misses"""
+        with self._lock:
+            keys = sorted(set(self._hits) | set(self._misses) | {
+                (platform, field) for platform, fields in self.specs.items() for field in fields
+            })
+            hits = {key: dict(value) for key, value in self._hits.items()}
+            misses = dict(self._misses)
+        return {
+            f'{platform}.{field}': {
+                'order': self.selectors(platform, field) if field in self.specs.get(platform, {}) else [],
+                'hits': hits.get((platform, field), {}),
+                'misses': misses.get((platform, field), 0)
+            }
+            for platform, field in keys
+        }
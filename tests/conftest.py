@@ -0,0 +1,17 @@
+import os
+import sys
+import pytest
+
+# The scrapers are top-level scripts, not a package
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+FIXTURE_CORPUS = os.path.join(REPO_ROOT, 'fixtures')
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _isolated_selector_stats(tmp_path_factory):
+    """Keep the parsers' selector hit counts out of the working tree"""
+    from get_jobs import selector_cascade
+    selector_cascade.path = str(tmp_path_factory.mktemp('selectors') / 'selector_stats.json')
+    yield
@@ -0,0 +1,11 @@
+from batch_search import expand_queries
+
+
+def test_equivalent_queries_run_once():
+    queries = expand_queries(['Django  REST', 'rest django', 'python'], ['New York', 'new_york'])
+    assert queries == [('Django  REST', 'New York'), ('python', 'New York')]
+
+
+def test_location_goes_out_as_typed():
+    assert expand_queries(['python'], [' New Delhi ']) == [('python', 'New Delhi')]
+    assert expand_queries(['python'], ['', None]) == [('python', None)]
@@ -0,0 +1,100 @@
+import json
+import os
+import pytest
+import compile_jobs
+from job_record import Job
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    yield store
+    store.close()
+
+
+def write_lines(path, titles, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        for title in titles:
+            f.write(json.dumps({'title': title, 'link': f'https://example.com/{title}'}) + '\n')
+
+
+def test_unchanged_files_are_skipped(tmp_path, store):
+    sink = str(tmp_path / 'new_jobs.jsonl')
+    export = str(tmp_path / 'run.json')
+    write_lines(sink, ['a', 'b'])
+    with open(export, 'w', encoding='utf-8') as f:
+        json.dump({'jobs': [{'title': 'c', 'link': 'https://example.com/c'}]}, f)
+    files = compile_jobs.find_result_files(str(tmp_path))
+    assert sorted(compile_jobs.import_results(store, files)) == sorted([export, sink])
+    assert compile_jobs.import_results(store, files) == []
+    os.utime(export, (1, 1))    # touched, same content
+    assert compile_jobs.import_results(store, files) == []
+    assert store.count() == 3
+
+
+def test_appended_lines_are_read_from_the_previous_end(tmp_path, store, monkeypatch):
+    sink = str(tmp_path / 'new_jobs.jsonl')
+    write_lines(sink, ['a', 'b'])
+    compile_jobs.import_results(store, [sink])
+    size = store.compiled_files()[sink]['size']
+
+    offsets = []
+    import_file = compile_jobs.import_file
+    monkeypatch.setattr(compile_jobs, 'import_file',
+                        lambda store, path, offset=0, end=None: offsets.append(offset) or
+                        import_file(store, path, offset, end))
+    write_lines(sink, ['c'], mode='a')
+    compile_jobs.import_results(store, [sink])
+    assert offsets == [size]
+    assert store.count() == 3
+    assert store.compiled_files()[sink]['jobs'] == 3
+
+
+def test_partial_last_line_waits_for_the_next_import(tmp_path, store):
+    sink = str(tmp_path / 'new_jobs.jsonl')
+    write_lines(sink, ['a'])
+    with open(sink, 'a', encoding='utf-8') as f:
+        f.write('{"title": "b", "li')
+    compile_jobs.import_results(store, [sink])
+    assert store.count() == 1
+    with open(sink, 'a', encoding='utf-8') as f:
+        f.write('nk": "https://example.com/b"}\n')
+    compile_jobs.import_results(store, [sink])
+    assert store.count() == 2
+
+
+def test_rewritten_files_are_read_again_and_deleted_ones_forgotten(tmp_path, store):
+    sink = str(tmp_path / 'new_jobs.jsonl')
+    write_lines(sink, ['a', 'b'])
+    compile_jobs.import_results(store, [sink])
+    write_lines(sink, ['z'])
+    assert compile_jobs.import_results(store, [sink]) == [sink]
+    assert store.compiled_files()[sink]['jobs'] == 1
+    os.remove(sink)
+    compile_jobs.import_results(store, [])
+    assert store.compiled_files() == {}
+
+
+def test_full_import_ignores_the_manifest(tmp_path, store):
+    sink = str(tmp_path / 'new_jobs.jsonl')
+    write_lines(sink, ['a'])
+    compile_jobs.import_results(store, [sink])
+    assert compile_jobs.import_results(store, [sink], full=True) == [sink]
+
+
+def test_recent_jobs_windows_and_folds(store):
+    description = ('Build a Python scraper for e-commerce product pages, store the results in PostgreSQL '
+                   'and schedule daily runs with cron.')
+    store.add_jobs([
+        Job(platform='upwork', title='Python scraper', link='https://upwork.com/jobs/~01', company='Northwind',
+            description=description),
+        Job(platform='freelancer', title='Python scraper', link='https://www.freelancer.com/projects/1',
+            company='Northwind', description=description),
+        Job(platform='remoteok', title='Old role', link='https://remoteok.io/1'),
+    ])
+    store._db.execute('UPDATE jobs SET first_seen = first_seen - 30 * 86400 WHERE title = ?', ('Old role',))
+    jobs = compile_jobs.recent_jobs(store=store)
+    assert len(jobs) == 1
+    assert jobs[0]['near_duplicates']
+    assert len(compile_jobs.recent_jobs(store=store, days=60)) == 2
@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+import daemon
+from job_record import Job
+from job_store import JobStore
+from seen_jobs import SeenJobs
+
+PROFILE = {'name': 'python', 'keywords': ['python'], 'location': None}
+
+
+class FailingSink:
+    def emit(self, jobs):
+        raise OSError('disk full')
+
+
+class ListSink:
+    def __init__(self):
+        self.jobs = []
+
+    def emit(self, jobs):
+        self.jobs.extend(jobs)
+
+
+@pytest.fixture
+def polling(tmp_path, monkeypatch):
+    jobs = [Job(platform='remoteok', title=f'Job {n}', link=f'https://remoteok.io/{n}') for n in range(2)]
+
+    async def stream_platform(*args, **kwargs):
+        yield [Job(**job.to_dict()) for job in jobs]
+
+    monkeypatch.setattr(daemon, 'stream_platform', stream_platform)
+    seen = SeenJobs(str(tmp_path / 'seen.sqlite3'))
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    yield seen, store
+    store.close()
+
+
+def test_failed_write_releases_the_claim(polling):
+    seen, store = polling
+    with pytest.raises(OSError):
+        asyncio.run(daemon.PollingDaemon([PROFILE], FailingSink(), seen, store).poll(PROFILE, 'remoteok'))
+    assert seen.stats() == {}
+
+    sink = ListSink()
+    emitted = asyncio.run(daemon.PollingDaemon([PROFILE], sink, seen, store).poll(PROFILE, 'remoteok'))
+    assert len(emitted) == len(sink.jobs) == 2
+    assert store.count() == 2
+    assert seen.stats() == {'remoteok': 2}
@@ -0,0 +1,51 @@
+from job_record import Job, canonical_url, coerce_jobs, job_hash, link_hash
+
+
+def test_jobs_are_hashable_and_equal_jobs_hash_alike():
+    a = Job(platform='upwork', title='ETL', link='https://upwork.com/jobs/~01', budget='$50')
+    b = Job(platform='upwork', title='ETL', link='https://upwork.com/jobs/~01', budget='$50')
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert {a: 'kept'}[b] == 'kept'
+
+
+def test_coerce_leaves_the_job_passed_in_alone():
+    job = Job(platform='indeed', title='Data Engineer', link='/viewjob?jk=1')
+    coerced, = coerce_jobs([job], 'glassdoor', 'https://www.glassdoor.com')
+    assert (coerced.platform, coerced.link) == ('glassdoor', 'https://www.glassdoor.com/viewjob?jk=1')
+    assert (job.platform, job.link) == ('indeed', '/viewjob?jk=1')
+    # Nothing to change: no copy
+    assert Job.coerce(coerced, 'glassdoor') is coerced
+
+
+def test_canonical_url_drops_noise():
+    assert canonical_url('http://www.Example.com:443/jobs/42/?utm_source=x&b=2&a=1#apply') == \
+        'https://example.com/jobs/42?a=1&b=2'
+    assert canonical_url('https://example.com//jobs//42/?ref=search&fbclid=abc') == 'https://example.com/jobs/42'
+
+
+def test_canonical_url_keeps_meaningful_parts():
+    assert canonical_url('https://example.com:8443/jobs?id=7') == 'https://example.com:8443/jobs?id=7'
+    assert canonical_url('/projects/python/bot', 'https://www.freelancer.com') == \
+        'https://freelancer.com/projects/python/bot'
+    assert canonical_url('') == ''
+
+
+def test_link_hash_is_signed_64_bit():
+    value = link_hash('https://example.com/jobs/42')
+    assert -(1 << 63) <= value < (1 << 63)
+    assert value == link_hash('http://www.example.com/jobs/42/?utm_medium=email')
+
+
+def test_job_hash_matches_link_spellings():
+    a = Job(platform='upwork', title='ETL', link='https://www.upwork.com/jobs/~01/?referrer_url_path=/nx')
+    b = {'title': 'ETL pipeline', 'url': 'https://upwork.com/jobs/~01'}
+    assert job_hash(a) == job_hash(Job.coerce(b))
+
+
+def test_job_hash_without_link_uses_platform_title_company():
+    a = Job(platform='remoteok', title='ML Engineer', company='Cyberdyne')
+    b = Job(platform='remoteok', title=' ml engineer ', company='CYBERDYNE')
+    c = Job(platform='remote', title='ML Engineer', company='Cyberdyne')
+    assert job_hash(a) == job_hash(b)
+    assert job_hash(a) != job_hash(c)
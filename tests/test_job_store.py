@@ -0,0 +1,45 @@
+import pytest
+from job_record import Job
+from job_store import JobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = JobStore(str(tmp_path / 'jobs.sqlite3'))
+    yield store
+    store.close()
+
+
+def test_upsert_keeps_one_row_per_link_and_fills_gaps(store):
+    store.add_jobs([Job(platform='upwork', title='ETL', link='https://upwork.com/jobs/~01', budget='$50')],
+                   keywords=['python'])
+    store.add_jobs([Job(platform='upwork', title='ETL', link='https://www.upwork.com/jobs/~01/?utm_source=x',
+                        company='Northwind')], keywords=['etl'])
+    assert store.count() == 1
+    job, = store.query()
+    assert (job.budget, job.company) == ('$50', 'Northwind')
+    assert sorted(job['search_keywords']) == ['etl', 'python']
+
+
+def test_upsert_keeps_first_seen(store):
+    store.add_jobs([Job(platform='remoteok', title='Old', link='https://remoteok.io/1')])
+    first_seen = store._db.execute('SELECT first_seen FROM jobs').fetchone()[0]
+    store.add_jobs([Job(platform='remoteok', title='Old', link='https://remoteok.io/1')])
+    assert store._db.execute('SELECT first_seen FROM jobs').fetchone()[0] == first_seen
+    assert store.query(since=first_seen + 1) == []
+
+
+def test_query_filters_and_order(store):
+    store.add_jobs([Job(platform='remoteok', title='A', link='https://remoteok.io/a'),
+                    Job(platform='freelancer', title='B', link='https://freelancer.com/b')], keywords='python')
+    store.add_jobs([Job(platform='freelancer', title='C', link='https://freelancer.com/c')], keywords='go')
+    assert [job.title for job in store.query()] == ['C', 'A', 'B']
+    assert [job.title for job in store.query(platforms=['freelancer'])] == ['C', 'B']
+    assert [job.title for job in store.query(keywords=['Python'])] == ['A', 'B']
+    assert [job.title for job in store.query(limit=1)] == ['C']
+    assert store.stats() == {'freelancer': 2, 'remoteok': 1}
+
+
+def test_jobs_without_title_are_skipped(store):
+    assert store.add_jobs([Job(platform='remoteok', link='https://remoteok.io/x')]) == 0
+    assert store.count() == 0
@@ -0,0 +1,69 @@
+import fixtures
+from conftest import FIXTURE_CORPUS
+from job_record import Job
+from near_duplicates import collapse_near_duplicates, find_near_duplicates
+from page_parsers import PAGE_PARSERS
+
+DESCRIPTION = ('We need a Python developer to build a scraper for e-commerce product pages, '
+               'store the results in PostgreSQL and schedule daily runs with cron.')
+
+
+def test_cross_posted_gig_is_folded():
+    upwork = Job(platform='upwork', title='Python scraper for product pages', link='https://upwork.com/jobs/~01',
+                 company='Northwind', location='Remote', description=DESCRIPTION)
+    freelancer = Job(platform='freelancer', title='Python Scraper for Product Pages',
+                     link='https://www.freelancer.com/projects/python/scraper-1', company='Northwind',
+                     location='remote', description=DESCRIPTION + ' Budget is flexible.')
+    kept, clusters = collapse_near_duplicates([upwork, freelancer])
+    assert len(kept) == 1 and len(clusters) == 1
+    assert kept[0]['near_duplicates']
+
+
+def test_distinct_postings_are_not_merged():
+    jobs = [
+        # Title-only cards with no company or description
+        Job(platform='indeed', title='Python Developer', link='https://www.indeed.com/viewjob?jk=1'),
+        Job(platform='glassdoor', title='Python Developer', link='https://www.glassdoor.com/job-listing/1'),
+        Job(platform='remoteok', title='Python Developer', link='https://remoteok.io/remote-jobs/1',
+            company='Company not specified'),
+        # One company hiring the same role in two cities
+        Job(platform='indeed', title='Data Engineer', link='https://www.indeed.com/viewjob?jk=2',
+            company='Acme', location='Jakarta', description=DESCRIPTION),
+        Job(platform='glassdoor', title='Data Engineer', link='https://www.glassdoor.com/job-listing/2',
+            company='Acme', location='Bandung', description=DESCRIPTION),
+        # The same text reposted on one platform is two listings, not a cross-post
+        Job(platform='indeed', title='Data Engineer', link='https://www.indeed.com/viewjob?jk=3',
+            company='Acme', location='Jakarta', description=DESCRIPTION),
+    ]
+    assert find_near_duplicates(jobs) == []
+    kept, _ = collapse_near_duplicates(jobs)
+    assert len(kept) == 6
+
+
+def test_group_never_holds_two_jobs_from_one_platform():
+    def job(platform, n):
+        return Job(platform=platform, title='Data Engineer', link=f'https://{platform}.com/{n}',
+                   company='Acme', location='Jakarta', description=DESCRIPTION)
+    jobs = [job('indeed', 1), job('glassdoor', 1), job('indeed', 2)]
+    clusters = find_near_duplicates(jobs)
+    assert [len(cluster['members']) for cluster in clusters] == [2]
+
+
+def test_cross_post_with_a_description_but_no_company_on_one_side():
+    upwork = Job(platform='upwork', title='Python scraper for product pages', link='https://upwork.com/jobs/~02',
+                 company='Northwind', description=DESCRIPTION)
+    freelancer = Job(platform='freelancer', title='Python scraper for product pages',
+                     link='https://www.freelancer.com/projects/python/scraper-2', description=DESCRIPTION)
+    assert len(find_near_duplicates([upwork, freelancer])) == 1
+
+
+def test_parsed_corpus_folds_only_the_cross_post():
+    # Scraper output carries no description on most platforms
+    jobs = [job for entry, body in fixtures.iter_fixtures(fixture_dir=FIXTURE_CORPUS)
+            for job in PAGE_PARSERS[entry['platform']](body)]
+    kept, clusters = collapse_near_duplicates(jobs)
+    assert [sorted((job.platform, job.company, job.title) for job in cluster['members']) for cluster in clusters] == [
+        [('remoteok', 'Cyberdyne', 'Python Backend Engineer'),
+         ('weworkremotely', 'Cyberdyne', 'Python Backend Engineer')],
+    ]
+    assert len(kept) == len(jobs) - 1
@@ -0,0 +1,24 @@
+import asyncio
+import get_jobs
+
+
+def test_paged_urls_move_past_the_first_page():
+    assert get_jobs.indeed_search_url(['python'], None, 3).endswith('&start=20')
+    assert get_jobs.glassdoor_search_url(['python'], None, 2).endswith('&p=2')
+    assert get_jobs.fiverr_search_url(['python'], None, 2).endswith('&page=2')
+    assert 'start=' not in get_jobs.indeed_search_url(['python'], None, 1)
+
+
+def test_glassdoor_asks_for_the_requested_page(monkeypatch):
+    requested = []
+    real_search_url = get_jobs.glassdoor_search_url
+
+    def search_url(keywords, location=None, page=1, city=get_jobs.GLASSDOOR_LOCATIONS[0]):
+        requested.append(page)
+        return real_search_url(keywords, location, page, city)
+
+    monkeypatch.setattr(get_jobs, 'glassdoor_search_url', search_url)
+    # Stop right after the URL is built, before any browser is started
+    monkeypatch.setattr(get_jobs, 'find_chrome_executable', lambda: None)
+    asyncio.run(get_jobs.get_glassdoor_jobs(['python'], page=3))
+    assert requested == [3]
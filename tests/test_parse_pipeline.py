@@ -0,0 +1,27 @@
+import asyncio
+import fixtures
+from conftest import FIXTURE_CORPUS
+from parse_pipeline import ParsePipeline
+
+
+def test_fetches_wait_for_parse_capacity():
+    (entry, body), = [(entry, body) for entry, body in fixtures.iter_fixtures('remoteok', fixture_dir=FIXTURE_CORPUS)]
+    in_flight = 0
+    peak = 0
+
+    async def fetch(url, platform):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return body
+
+    async def run():
+        async with ParsePipeline(fetch=fetch, parse_workers=1, queue_size=1) as pipeline:
+            return await asyncio.gather(*(pipeline.submit('remoteok', f'{entry["url"]}?n={n}') for n in range(8)))
+
+    results = asyncio.run(run())
+    assert all(len(jobs) == 2 for jobs in results)
+    # queue_size + parse_workers pages at most, however many were submitted
+    assert peak <= 2
@@ -0,0 +1,104 @@
+import pytest
+import fixtures
+import get_jobs
+from conftest import FIXTURE_CORPUS
+
+
+def parse_fixture(url):
+    """Run the recorded page for `url` through its platform parser"""
+    for entry, body in fixtures.iter_fixtures(fixture_dir=FIXTURE_CORPUS):
+        if entry['url'] == url:
+            return get_jobs.PAGE_PARSERS[entry['platform']](body)
+    raise AssertionError(f"no fixture recorded for {url}")
+
+
+def test_every_platform_parser_has_fixtures():
+    recorded = {entry['platform'] for entry, body in fixtures.iter_fixtures(fixture_dir=FIXTURE_CORPUS)}
+    assert set(get_jobs.PAGE_PARSERS) <= recorded
+
+
+@pytest.mark.parametrize('features', ['lxml', 'html.parser'])
+def test_every_fixture_parses_to_jobs(features):
+    for entry, body in fixtures.iter_fixtures(fixture_dir=FIXTURE_CORPUS):
+        jobs = get_jobs.PAGE_PARSERS[entry['platform']](body, features=features)
+        assert jobs, entry['url']
+        for job in jobs:
+            assert job.platform == entry['platform']
+            assert job.title and job.link.startswith('https://')
+
+
+def test_freelancer_cards():
+    jobs = parse_fixture(get_jobs.freelancer_search_url('python'))
+    assert [job.to_dict() for job in jobs] == [
+        {'platform': 'freelancer', 'title': 'Django REST API backend',
+         'link': 'https://www.freelancer.com/projects/python/django-rest-api-backend', 'budget': '$250 - $750 USD',
+         'description': 'Build a REST API for an inventory app.'},
+        {'platform': 'freelancer', 'title': 'Scrape product prices',
+         'link': 'https://www.freelancer.com/projects/python/scrape-product-prices', 'budget': '$30 - $250 USD'},
+        {'platform': 'freelancer', 'title': 'Pandas report automation',
+         'link': 'https://www.freelancer.com/projects/data-entry/pandas-report-automation?ref=search'},
+    ]
+
+
+def test_freelancer_legacy_cards_use_fallback_selectors():
+    jobs = parse_fixture(get_jobs.freelancer_search_url('python', page=2))
+    assert [(job.title, job.link, job.budget) for job in jobs] == [
+        ('Flask dashboard for sensor data', 'https://www.freelancer.com/projects/python/flask-dashboard',
+         '$15 - $25 USD / hour'),
+        ('Telegram bot with aiogram', 'https://www.freelancer.com/projects/python/telegram-bot', None),
+    ]
+
+
+def test_upwork_tiles():
+    jobs = parse_fixture(get_jobs.upwork_search_url('python'))
+    assert [(job.title, job.company, job.budget) for job in jobs] == [
+        ('Python developer for ETL pipeline', 'Northwind Analytics', 'Hourly: $30-$60'),
+        ('FastAPI microservice', None, 'Fixed price'),
+    ]
+    assert jobs[1].link == 'https://www.upwork.com/jobs/FastAPI-microservice_~0fedcba987654321/'
+
+
+def test_timesjobs_keeps_only_recent_postings():
+    jobs = parse_fixture(get_jobs.timesjobs_search_url('python'))
+    assert [job.title for job in jobs] == ['Python Developer', 'Data Engineer']
+    assert jobs[0].skills == 'python, django, restapi'
+    assert jobs[0].posted == 'few days ago'
+    assert jobs[0].company == 'AcmeInfotechPvtLtd'
+    assert jobs[1].posted == 'today'
+
+
+def test_remote_co_listings():
+    jobs = parse_fixture(get_jobs.remote_co_search_url('python'))
+    assert [(job.title, job.link, job.company) for job in jobs] == [
+        ('Senior Python Engineer', 'https://remote.co/job/senior-python-engineer-umbrella/', 'Umbrella Health'),
+        ('Backend Developer', 'https://remote.co/job/backend-developer-hooli/', None),
+    ]
+
+
+def test_weworkremotely_skips_view_all_links():
+    jobs = parse_fixture(get_jobs.weworkremotely_search_url('python'))
+    assert [(job.title, job.company) for job in jobs] == [
+        ('Python Platform Engineer', 'Stark Industries'),
+        ('Django Developer', 'Wayne Enterprises'),
+        ('Python Backend Engineer', 'Cyberdyne'),
+    ]
+    assert jobs[0].link == 'https://weworkremotely.com/remote-jobs/stark-industries-python-platform-engineer'
+
+
+def test_remoteok_rows():
+    jobs = parse_fixture(get_jobs.remoteok_search_url('python'))
+    assert [(job.title, job.company, job.location) for job in jobs] == [
+        ('Python Backend Engineer', 'Cyberdyne', 'Worldwide'),
+        ('ML Engineer', None, 'Remote'),
+    ]
+
+
+def test_scrapers_replay_from_fixtures(monkeypatch):
+    monkeypatch.setattr(fixtures, 'FIXTURE_DIR', FIXTURE_CORPUS)
+    fixtures.set_fixture_mode('replay')
+    try:
+        assert len(get_jobs.get_freelancer_jobs('python')) == 3
+        assert len(get_jobs.get_remoteok_jobs('python')) == 2
+        assert len(get_jobs.get_timesjobs_jobs('python')) == 2
+    finally:
+        fixtures.set_fixture_mode('')
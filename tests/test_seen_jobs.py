@@ -0,0 +1,56 @@
+import asyncio
+import pytest
+from get_jobs import stream_job_pages
+from job_record import Job
+from seen_jobs import SeenJobs
+
+
+@pytest.fixture
+def seen(tmp_path):
+    return SeenJobs(str(tmp_path / 'seen.sqlite3'))
+
+
+def page_of(page, count=3):
+    return [Job(platform='freelancer', title=f'p{page}-{i}', link=f'https://www.freelancer.com/projects/p{page}-{i}')
+            for i in range(count)]
+
+
+def collect_pages(seen, pages):
+    fetched = []
+
+    async def fetch(platform, url):
+        fetched.append(url)
+        return pages[len(fetched) - 1]
+
+    async def run():
+        return [batch async for batch in stream_job_pages('freelancer', ['python'], max_pages=len(pages),
+                                                          fetch=fetch, seen=seen)]
+    return asyncio.run(run()), fetched
+
+
+def test_paging_continues_past_pinned_known_jobs(seen):
+    pages = [page_of(1), page_of(2), page_of(3)]
+    # A featured job from an earlier run pinned to the top of page 1
+    pinned = pages[0][0]
+    seen.mark_seen([pinned], 'freelancer')
+    batches, fetched = collect_pages(seen, pages)
+    assert len(fetched) == 3
+    assert [len(batch) for batch in batches] == [2, 3, 3]
+
+
+def test_paging_stops_at_a_fully_known_page(seen):
+    pages = [page_of(1), page_of(2), page_of(3)]
+    seen.mark_seen(pages[1], 'freelancer')
+    batches, fetched = collect_pages(seen, pages)
+    assert len(fetched) == 2
+    assert [len(batch) for batch in batches] == [3, 0]
+
+
+def test_claim_hands_each_job_out_once(seen):
+    jobs = page_of(1)
+    assert seen.claim(jobs[:2], 'freelancer') == jobs[:2]
+    # An overlapping search finding the same jobs only gets the new one
+    assert seen.claim(jobs, 'freelancer') == jobs[2:]
+    assert seen.claim(jobs, 'freelancer') == []
+    assert seen.stats() == {'freelancer': 3}
+
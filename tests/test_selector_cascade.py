@@ -0,0 +1,28 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+from selector_cascade import SelectorCascade
+
+SPECS = {'board': {'title': ['h2 a', 'h3 a']}}
+
+
+def save_hits(path, count):
+    cascade = SelectorCascade(SPECS, path=path)
+    cascade.add_hits([('board', 'title', 'h3 a', 1)] * count)
+    cascade.save()
+
+
+def test_worker_hits_move_to_the_parent(tmp_path):
+    worker = SelectorCascade(SPECS, path=str(tmp_path / 'unused.json'))
+    worker.add_hits([('board', 'title', 'h3 a', 2)])
+    parent = SelectorCascade(SPECS, path=str(tmp_path / 'stats.json'))
+    parent.add_hits(worker.take_pending())
+    assert worker.take_pending() == []
+    assert parent.selectors('board', 'title') == ['h3 a', 'h2 a']
+
+
+def test_concurrent_saves_keep_every_count(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(save_hits, [path] * 8, [5] * 8))
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {'board': {'title': {'h3 a': 40}}}
@@ -0,0 +1,175 @@
+import asyncio
+import threading
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+
+# Time of the latest (or next reserved) page action per politeness key, shared by every budget
+_last_actions = {}
+_last_actions_lock = threading.Lock()
+
+
+class WaitBudget:
+    """
+    Accounts for the time a single scrape spends waiting versus working.
+    `politeness` is a per-platform floor in seconds: polite()/polite_async()
+    make sure at least that long has passed since the previous page action,
+    and only sleep for whatever is left of it. Budgets with the same `key`
+    (the platform) share their last action, so the floor also holds between
+    successive or concurrent scrapes of one platform.
+    """
+
+    def __init__(self, label, politeness=0.0, key=None):
+        self.label = label
+        self.politeness = politeness
+        self.key = key if key is not None else label
+        self.started = time.time()
+        self.waited = 0.0
+
+    def add_wait(self, seconds):
+        self.waited += max(0.0, seconds)
+
+    def _reserve(self):
+        """Claim the next action slot for this key; returns the seconds to wait for it"""
+        now = time.time()
+        with _last_actions_lock:
+            last = _last_actions.get(self.key)
+            slot = now if last is None or self.politeness <= 0 else max(now, last + self.politeness)
+            _last_actions[self.key] = slot
+        return slot - now
+
+    def polite(self):
+        """Blocking politeness pause (Selenium/requests scrapers)"""
+        remaining = self._reserve()
+        if remaining:
+            time.sleep(remaining)
+            self.add_wait(remaining)
+
+    async def polite_async(self):
+        """Politeness pause for pyppeteer scrapers"""
+        remaining = self._reserve()
+        if remaining:
+            await asyncio.sleep(remaining)
+            self.add_wait(remaining)
+
+    def summary(self):
+        elapsed = time.time() - self.started
+        return {
+            'label': self.label,
+            'elapsed': round(elapsed, 3),
+            'waited': round(self.waited, 3),
+            'worked': round(max(0.0, elapsed - self.waited), 3)
+        }
+
+    def report(self):
+        summary = self.summary()
+        print(f"{self.label}: waited {summary['waited']:.1f}s, worked {summary['worked']:.1f}s "
+              f"(total {summary['elapsed']:.1f}s)")
+
+
+# --- pyppeteer conditions ---
+
+async def wait_for_selector(page, selector, budget, timeout=15):
+    """Wait until `selector` is present; returns False on timeout instead of raising"""
+    started = time.time()
+    try:
+        await page.waitForSelector(selector, {'timeout': int(timeout * 1000)})
+        return True
+    except Exception:
+        return False
+    finally:
+        budget.add_wait(time.time() - started)
+
+
+async def wait_for_count_stable(page, selector, budget, settle=1.0, timeout=15, scroll=False, poll=0.25):
+    """
+    Wait until the number of elements matching `selector` stops changing for
+    `settle` seconds. With scroll=True the page is scrolled on every poll so
+    lazy-loaded listings keep arriving. Returns the final count.
+    """
+    started = time.time()
+    last_count = -1
+    stable_since = time.time()
+    try:
+        while time.time() - started < timeout:
+            if scroll:
+                await page.evaluate('window.scrollBy(0, window.innerHeight)')
+            count = await page.evaluate('(selector) => document.querySelectorAll(selector).length', selector)
+            if count != last_count:
+                last_count = count
+                stable_since = time.time()
+            elif count > 0 and time.time() - stable_since >= settle:
+                break
+            await asyncio.sleep(poll)
+        return max(last_count, 0)
+    finally:
+        budget.add_wait(time.time() - started)
+
+
+async def wait_for_network_quiet(page, budget, idle=0.5, timeout=15, poll=0.1):
+    """Wait until the page has had no requests in flight for `idle` seconds"""
+    started = time.time()
+    in_flight = set()
+    last_activity = [time.time()]
+
+    def on_request(request):
+        in_flight.add(request)
+        last_activity[0] = time.time()
+
+    def on_done(request):
+        in_flight.discard(request)
+        last_activity[0] = time.time()
+
+    page.on('request', on_request)
+    page.on('requestfinished', on_done)
+    page.on('requestfailed', on_done)
+    try:
+        while time.time() - started < timeout:
+            if not in_flight and time.time() - last_activity[0] >= idle:
+                return True
+            await asyncio.sleep(poll)
+        return False
+    finally:
+        page.remove_listener('request', on_request)
+        page.remove_listener('requestfinished', on_done)
+        page.remove_listener('requestfailed', on_done)
+        budget.add_wait(time.time() - started)
+
+
+# --- Selenium conditions ---
+
+def wait_for_elements(driver, selector, budget, timeout=15):
+    """Wait until `selector` is present in the DOM; returns False on timeout"""
+    started = time.time()
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except Exception:
+        return False
+    finally:
+        budget.add_wait(time.time() - started)
+
+
+def wait_for_count_stable_driver(driver, selector, budget, settle=1.0, timeout=15, scroll=False, poll=0.25):
+    """Selenium twin of wait_for_count_stable; returns the final element count"""
+    started = time.time()
+    last_count = -1
+    stable_since = time.time()
+    try:
+        while time.time() - started < timeout:
+            if scroll:
+                driver.execute_script("window.scrollBy(0, window.innerHeight);")
+            count = len(driver.find_elements(By.CSS_SELECTOR, selector))
+            if count != last_count:
+                last_count = count
+                stable_since = time.time()
+            elif count > 0 and time.time() - stable_since >= settle:
+                break
+            time.sleep(poll)
+        return max(last_count, 0)
+    finally:
+        budget.add_wait(time.time() - started)